@@ -0,0 +1,337 @@
+# Plan a chain of decimation stages that lowers the receive sample rate before the channel filter.
+#
+# QS.get_filter_rate() returns the fixed rate of the channel filter for each mode, for example
+# 6000 sps for CW.  A narrow filter needs far less, and the channel filter is cheaper at a lower
+# rate.  planDecimation() chooses the decimation factors and the half-band or FIR filter of each
+# stage that give the fewest multiplies per input sample, and DecimationPlan exports the filters.
+
+from __future__ import print_function
+from __future__ import division
+
+import math
+import time
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+import filter_design
+
+# The half-band filter of quisk_cDecim2HB45() in filter.c; rate 96, cutoff 16-24-32, atten 120 dB.
+# These are the taps 0, 2, 4, ..., 20 and the center tap 21 of the 43 taps.  The other taps are zero.
+hb45_coefs = (0.000018566625444266, -0.000118469698701817, 0.000457318798253456,
+  -0.001347840471412094, 0.003321838571445455, -0.007198422696929033, 0.014211106939802483,
+  -0.026424776824073383, 0.048414810444971007, -0.096214669073304823, 0.314881034738348550,
+  0.500000000000000000)
+
+def halfbandTaps(coefs):	# Return all the taps of a half-band filter from its even taps and center tap
+  center = len(coefs) * 2 - 3
+  taps = [0.0] * (center * 2 + 1)
+  for i, coef in enumerate(coefs[:-1]):
+    taps[i * 2] = taps[center * 2 - i * 2] = coef
+  taps[center] = coefs[-1]
+  return taps
+
+def rippleAtten(delta):		# Return the ripple in dB peak to peak of a passband error delta
+  return 20 * math.log10((1 + delta) / (1 - delta))
+
+class Stage(object):
+  """A lowpass filter at rate followed by keeping one sample out of factor.
+
+  A half-band filter has every second tap zero except the center, and it is used to decimate by
+  two.  Other factors use an FIR filter.  The band edges fpass and fstop are in Hertz.  The number
+  of taps is an estimate until Design() is called or the coefficients are given."""
+  def __init__(self, kind, factor, rate, fpass, fstop, ripple, atten, coefs=None):
+    self.kind = kind		# 'halfband' or 'fir'
+    self.factor = factor
+    self.rate = rate		# the input sample rate
+    self.fpass = fpass
+    self.fstop = fstop
+    self.ripple = ripple
+    self.atten = atten
+    self.coefs = coefs
+    if coefs is None:
+      self.taps = self.EstimateTaps()
+    else:
+      self.taps = len(coefs)
+  def EstimateTaps(self):
+    fpass = self.fpass / self.rate
+    fstop = self.fstop / self.rate
+    if self.kind == 'halfband':	# the ripple is the same in both bands
+      N = filter_design.estimateTaps(fpass, fstop, rippleAtten(10 ** (-self.atten / 20.0)), self.atten)
+      return max(7, ((N + 4) // 4) * 4 - 1)	# 4 * k + 3 taps
+    N = filter_design.estimateTaps(fpass, fstop, self.ripple, self.atten)
+    return max(3, (N // 2) * 2 + 1)
+  def Nonzero(self):	# Return the number of taps that are not zero
+    if self.kind == 'halfband':
+      return (self.taps + 1) // 2 + 1
+    return self.taps
+  def Design(self):
+    """Design the equiripple filter of the stage; numpy is required."""
+    if self.coefs is not None:
+      return
+    fpass = self.fpass / self.rate
+    fstop = self.fstop / self.rate
+    if self.kind == 'halfband':
+      N = self.taps
+      while True:
+        taps = filter_design.remezLowpass(N, fpass, 0.5 - fpass)
+        center = N // 2
+        taps[center + 2::2] = 0.0	# equal weights make a half-band filter; remove the round off
+        taps[center - 2::-2] = 0.0
+        taps[center] = 0.5
+        r, a = filter_design.measureLowpass(taps, fpass, fstop)
+        if a >= self.atten - 0.01 or N > 1000:
+          break
+        N += 4
+    else:
+      taps = filter_design.equirippleLowpass(fpass, fstop, self.ripple, self.atten)
+    self.coefs = taps.tolist()
+    self.taps = len(self.coefs)
+  def Describe(self):
+    if self.kind == 'halfband':
+      return "half-band /%d (%d taps)" % (self.factor, self.taps)
+    return "FIR /%d (%d taps)" % (self.factor, self.taps)
+
+class DecimationPlan(object):
+  """Decimation stages from the capture rate to out_rate, followed by the channel filter.
+
+  The channel filter is the filter that OnBtnFilter() would design at out_rate.  The cost is
+  counted as real multiplies per input sample: two for each tap of a real filter of complex
+  samples, and four for each tap of a tuned channel filter."""
+  def __init__(self, rate, bw, center, stages, window='blackman'):
+    self.rate = rate
+    self.bw = bw
+    self.center = center
+    self.stages = stages
+    self.window = window
+    self.out_rate = rate
+    for stage in stages:
+      self.out_rate //= stage.factor
+    self.channel = None		# the (filtI, filtQ) coefficients of the channel filter
+    self.channel_taps = len(self.ChannelFilter()[0])
+  def ChannelFilter(self):
+    if self.channel is None:
+      self.channel = filter_design.makeFilterCoef(self.out_rate, None, self.bw, self.center, self.window)
+    return self.channel
+  def Factors(self):
+    return [stage.factor for stage in self.stages]
+  def Multiplies(self):		# Return the real multiplies per input sample
+    total = 0.0
+    scale = 1.0		# the samples at this stage for each input sample
+    for stage in self.stages:
+      total += scale * 2 * stage.Nonzero() / stage.factor
+      scale /= stage.factor
+    if self.center:
+      total += scale * 4 * self.channel_taps
+    else:
+      total += scale * 2 * self.channel_taps
+    return total
+  def Samples(self):	# Return the samples handled by all stages and the channel filter per input sample
+    total = 0.0
+    scale = 1.0
+    for stage in self.stages:
+      total += scale
+      scale /= stage.factor
+    return total + scale
+  def Design(self):
+    for stage in self.stages:
+      stage.Design()
+    self.ChannelFilter()
+  def Coefficients(self):
+    """Return a list of (factor, coefficients) for each stage, and the channel filter (filtI, filtQ)."""
+    self.Design()
+    return [(stage.factor, stage.coefs) for stage in self.stages], self.ChannelFilter()
+  def CSource(self, name='quiskPlan'):
+    """Return the coefficients as C arrays in the style of filters.h."""
+    def array(text, coefs):
+      lines = [text + " = {"]
+      for i in range(0, len(coefs), 5):
+        lines.append(" " + ", ".join(["%.15f" % x for x in coefs[i:i+5]]) + ",")
+      lines[-1] = lines[-1][:-1] + " };"
+      return lines
+    stages, (filtI, filtQ) = self.Coefficients()
+    lines = ["// Decimation plan for %d sps, bandwidth %d Hz at %d Hz: %s" % (self.rate, self.bw, self.center, self.Describe())]
+    for index, stage in enumerate(self.stages):
+      lines.append("// Stage %d: %s, rate %d, pass %.0f, stop %.0f, ripple %.3f dB, atten %.0f dB" % (index + 1,
+          stage.Describe(), stage.rate, stage.fpass, stage.fstop, stage.ripple, stage.atten))
+      lines += array("double %sD%dCoefs[%d]" % (name, index + 1, stage.taps), stage.coefs)
+    lines.append("// Channel filter at %d sps" % self.out_rate)
+    lines += array("double %sICoefs[%d]" % (name, len(filtI)), filtI)
+    lines += array("double %sQCoefs[%d]" % (name, len(filtQ)), filtQ)
+    return "\n".join(lines) + "\n"
+  def Describe(self):
+    text = ["%d" % self.rate]
+    for stage in self.stages:
+      text.append(stage.Describe())
+    text.append("%d channel (%d taps)" % (self.out_rate, self.channel_taps))
+    return " -> ".join(text)
+
+def factorOrders(rate, factors, max_stages, min_rate):	# Return the possible lists of factors
+  orders = [[]]
+  def add(order, rate):
+    if len(order) >= max_stages:
+      return
+    for factor in factors:
+      if rate % factor == 0 and rate // factor >= min_rate:
+        orders.append(order + [factor])
+        add(order + [factor], rate // factor)
+  add([], rate)
+  return orders
+
+def makeStages(rate, order, fpass, fstop, ripple, atten):
+  """Return the stages for the list of factors.  The band from -fpass to fpass is kept, and aliases
+  may fall above fstop where the channel filter removes them."""
+  stages = []
+  for factor in order:
+    out_rate = rate // factor
+    if factor == 2 and out_rate - fstop > fstop:
+      stages.append(Stage('halfband', 2, rate, fstop, out_rate - fstop, ripple, atten))
+    else:
+      stages.append(Stage('fir', factor, rate, fpass, out_rate - fstop, ripple, atten))
+    rate = out_rate
+  return stages
+
+def planDecimation(rate, bw, center=0, ripple=0.2, atten=88.0, shape=1.5, min_rate=0,
+      factors=(2, 3, 4, 5, 6, 7, 8), max_stages=4, window='blackman'):
+  """Return the DecimationPlan with the fewest multiplies per input sample.
+
+  The rate is the capture rate from VarDecimSet(), and bw and center are the filter bandwidth and
+  center as in OnBtnFilter().  The decimation stages share the passband ripple and each has atten
+  dB attenuation.  The final rate is at least min_rate and leaves room for the transition band of
+  the channel filter given by shape."""
+  fpass = abs(center) + bw / 2.0
+  fstop = abs(center) + shape * bw / 2.0
+  best = None
+  for order in factorOrders(rate, factors, max_stages, max(min_rate, 2 * fstop)):
+    stages = makeStages(rate, order, fpass, fstop, ripple / (len(order) + 1), atten)
+    plan = DecimationPlan(rate, bw, center, stages, window)
+    if best is None or plan.Multiplies() < best.Multiplies():
+      best = plan
+  return best
+
+def currentPlan(rate, bw, center, filter_rate, window='blackman'):
+  """Return the plan used now: HB45 half-band filters from rate to filter_rate, then the channel filter."""
+  start = rate
+  stages = []
+  while rate > filter_rate:
+    stages.append(Stage('halfband', 2, rate, rate / 6.0, rate / 3.0, 0.0, 120.0, halfbandTaps(hb45_coefs)))
+    rate //= 2
+  return DecimationPlan(start, bw, center, stages, window)
+
+def polyphaseDecimate(x, taps, factor):
+  """Return the samples x filtered by taps and decimated by factor, computing only the kept outputs.
+
+  Output n is sum(taps[k] * x[n * factor - k]), the same as numpy.convolve(x, taps)[::factor]."""
+  taps = numpy.asarray(taps, dtype=numpy.float64)
+  count = (len(x) + factor - 1) // factor
+  y = numpy.zeros(count, dtype=x.dtype)
+  for phase in range(factor):
+    h = taps[phase::factor]
+    nonzero = numpy.nonzero(h)[0]
+    if len(nonzero) == 0:
+      continue
+    xp = numpy.zeros(count, dtype=x.dtype)	# xp[m] = x[m * factor - phase]
+    if phase == 0:
+      xp[:] = x[0::factor]
+    else:
+      part = x[factor - phase::factor][:count - 1]
+      xp[1:1 + len(part)] = part
+    if len(nonzero) == 1:	# the center phase of a half-band filter
+      delay = nonzero[0]
+      if delay < count:
+        y[delay:] += h[delay] * xp[:count - delay]
+    else:
+      y += numpy.convolve(xp, h)[:count]
+  return y
+
+def runPlan(plan, x):
+  """Return the complex samples x at the capture rate after the decimation stages and the channel filter."""
+  for stage in plan.stages:
+    x = polyphaseDecimate(x, stage.coefs, stage.factor)
+  filtI, filtQ = plan.ChannelFilter()
+  if plan.center:	# the tuned filter passes the frequency center
+    taps = numpy.array(filtI) - 1j * numpy.array(filtQ)
+  else:
+    taps = numpy.array(filtI)
+  return numpy.convolve(x, taps)[:len(x)]
+
+def planResponse(plan, freqs, seconds=0.5):
+  """Return the gain in dB of the plan for a tone at each frequency, including aliases."""
+  samples = int(plan.rate * seconds)
+  n = numpy.arange(samples)
+  gains = []
+  for freq in freqs:
+    y = runPlan(plan, numpy.exp(2j * math.pi * freq / plan.rate * n))
+    y = y[len(y) // 2:]		# skip the filter delays
+    gains.append(10 * math.log10(max(numpy.mean(numpy.abs(y) ** 2), 1E-30)))
+  return gains
+
+class CostModel(object):
+  """Predict the time per input sample of a plan from its multiplies and the samples handled by its stages.
+
+  The default constants are placeholders; Calibrate() measures them on this computer."""
+  def __init__(self, mult_ns=0.5, sample_ns=5.0):
+    self.mult_ns = mult_ns
+    self.sample_ns = sample_ns
+  def Predict(self, plan):	# Return the nanoseconds per input sample
+    return self.mult_ns * plan.Multiplies() + self.sample_ns * plan.Samples()
+  def Measure(self, plan, samples=192000, repeat=3):	# Return the measured nanoseconds per input sample
+    x = numpy.exp(1j * numpy.arange(samples) * 0.1)
+    plan.Design()
+    best = None
+    for i in range(repeat):
+      t0 = time.time()
+      runPlan(plan, x)
+      t = (time.time() - t0) / samples * 1E9
+      if best is None or t < best:
+        best = t
+    return best
+  def Calibrate(self, plans, samples=192000):
+    """Set the constants by a least squares fit to the time of the plans, and return the times."""
+    times = [self.Measure(plan, samples) for plan in plans]
+    A = numpy.array([(plan.Multiplies(), plan.Samples()) for plan in plans])
+    (self.mult_ns, self.sample_ns), residuals, rank, sv = numpy.linalg.lstsq(A, numpy.array(times), rcond=None)
+    return times
+
+# Receive filters to plan for: mode, bandwidth and the filter center from GetFilterCenter() for a 600 Hz CW tone
+benchmark_filters = (('CW', 200, 600), ('CW', 400, 600), ('CW', 1000, 600), ('SSB', 2500, 1550),
+  ('SSB', 3000, 1800), ('AM', 6000, 0), ('AM', 10000, 0), ('DGT', 400, 1500), ('DGT', 3200, 1500))
+
+def benchmark(rate=48000):
+  """Compare the current filter chain to the planned chain for some receive filters at rate.
+
+  Print the multiplies per input sample, the measured and predicted time per sample, and the
+  worst gain of a tone outside the filter relative to a tone in the filter, including aliases."""
+  if numpy is None:
+    print("The decimation benchmark needs numpy")
+    return
+  mode_rates = dict(filter_design.mode_rates)
+  pairs = []
+  t0 = time.time()
+  for mode, bw, center in benchmark_filters:
+    filter_rate = mode_rates[mode] * rate // 48000
+    current = currentPlan(rate, min(bw, filter_rate // 2), center, filter_rate)
+    plan = planDecimation(rate, bw, center)
+    pairs.append((mode, bw, current, plan))
+  print("Planned %d filters in %.0f milliseconds" % (len(pairs), (time.time() - t0) * 1E3))
+  model = CostModel()
+  plans = [p for mode, bw, current, plan in pairs for p in (current, plan)]
+  times = model.Calibrate(plans)
+  print("Cost model: %.3f ns per multiply plus %.2f ns per sample per stage" % (model.mult_ns, model.sample_ns))
+  print("Mode    BW        mult/sample  ns/sample predicted  rejection  Chain")
+  index = 0
+  for mode, bw, current, plan in pairs:
+    for name, p in (('now', current), ('plan', plan)):
+      fpass = abs(p.center) + p.bw / 2.0
+      inband = planResponse(p, [p.center])[0]
+      edges = [p.center - p.bw, p.center + p.bw]	# outside the filter, and their images at each stage
+      for stage in p.stages:
+        edges += [p.center + k * stage.rate // stage.factor for k in (-1, 1)]
+      outside = max(planResponse(p, [f for f in edges if abs(f) < p.rate / 2]))
+      print("%-4s %5d  %-4s %11.1f %10.1f %9.1f %8.1f dB  %s" % (mode, bw, name,
+          p.Multiplies(), times[index], model.Predict(p), inband - outside, p.Describe()))
+      index += 1
+
+if __name__ == '__main__':
+  benchmark()
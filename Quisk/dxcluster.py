@@ -2,11 +2,54 @@
 
 import threading
 import time
-import telnetlib
+import socket
+import select
+import errno
+import random
+import os
+import re
+import bisect
+import heapq
+import collections
+import itertools
 import sys
 import quisk_conf_defaults as conf
 
-class DxEntry():
+try:
+  intern
+except NameError:
+  from sys import intern
+
+names = {}		# one copy of each call sign, mode and kind string
+
+def internName(name):
+  try:
+    return names[name]
+  except KeyError:
+    pass
+  if len(names) > 200000:
+    names.clear()
+  if isinstance(name, str):
+    name = intern(name)
+  names[name] = name
+  return name
+
+class SpotReport(object):
+  """One report of a DX station.  The time is the spot time in seconds since the epoch."""
+  __slots__ = ('spotter', 'time', 'comment', 'mode', 'snr', 'wpm', 'kind')
+  def __init__(self, spotter, time, comment, mode='', snr=None, wpm=None, kind=''):
+    self.spotter = spotter
+    self.time = time
+    self.comment = comment
+    self.mode = mode
+    self.snr = snr
+    self.wpm = wpm
+    self.kind = kind
+
+class DxEntry(object):
+  """A DX station and its newest reports, newest first."""
+  __slots__ = ('dx', 'freq', 'timestamp', 'info')
+  max_reports = 3
   def __init__(self):
     self.info = []
     
@@ -17,25 +60,26 @@ class DxEntry():
     return self.dx
   
   def getSpotter(self, index):
-    return self.info[index][0]
+    return self.info[index].spotter
     
   def getTime(self, index):
-    return self.info[index][1]
-
-  def setTime(self, index, value):
-    L1 = list(self.info)
-    L2 = list(L1[index])
-    L2[1] = value
-    L1[index] = tuple(L2)
-    self.info = tuple(L1)
-    return 
+    return time.strftime("%H:%M UTC", time.gmtime(self.info[index].time))
+
+  def getEpoch(self, index):
+    return self.info[index].time
+
+  def setTime(self, index, value):	# value is the time in seconds since the epoch
+    self.info[index].time = value
   
   def getLocation(self, index):
-    return self.info[index][2]
+    return self.dx
   
   def getComment(self, index):
-    return self.info[index][3]
+    return self.info[index].comment
   
+  def getReport(self, index):
+    return self.info[index]
+
   def getLen(self):
     return len(self.info)
   
@@ -46,139 +90,687 @@ class DxEntry():
       return False
     
   def join (self, element):
-    for i in range (0, len(element.info)):
-      self.info.insert(0, element.info[i])
-    length = len(self.info)
+    info = self.info
+    for report in element.info:
+      info.insert(0, report)
     # limit to max history
-    if length > 3:
-      del (self.info[length-1])
+    del info[self.max_reports:]
+    if element.timestamp >= self.timestamp:	# the station moved to the frequency of the newest spot
+      self.freq = element.freq
     self.timestamp = max (self.timestamp, element.timestamp)  
     
   def isExpired(self):
-    #print(time.time()-self.timestamp)
-    #if time.time()-self.timestamp > conf.dxClExpireTime * 60:
-    #  print("DELETE ENTRY")             
     return time.time()-self.timestamp > conf.dxClExpireTime * 60
     
   def parseMessage(self, message):  
-    words = message.split()
-    sTime = ''
-    locator = ''
-    comment = ''
-    if len(words) > 3 and words[0].lower() == 'dx' and words[1].lower() == 'de':
-      spotter = words[2].strip(':')
-      self.freq = int(float(words[3])*1000)
-      self.dx = words[4]
-      locator = self.dx
-      for index in range (5, len(words)):
-        word = words[index]
-#        print(index, word)
-        try:
-          if index < len(words)-1:
-            if comment != '':
-              comment += ' '
-            comment += word
-           
-#         if sTime != '':
-#            locator = word.strip('\07')
-          #search time
-          if word[0:3].isdigit() and word[4].isalpha():
-            sTime = word.strip('\07')
-            sTime = sTime[0:2]+':'+sTime[2:4]+ ' UTC'
-          
-#          if sTime == '':
-#            print(word) 
-#            if comment != '':
-#              comment += ' '
-#            comment += word
+    spot = parseSpot(message)
+    if spot is None:
+      return False
+    self.setSpot(spot)
+    return True
+
+  def setSpot(self, spot):	# Add the report in a SpotRecord
+    self.timestamp = now = time.time()
+    self.freq = spot.freq
+    self.dx = internName(spot.dx)
+    if spot.utc is None:
+      t = now
+    else:		# the spot time on the nearest day
+      t = now - now % 86400 + spot.utc * 60
+      if t > now + 3600:		# spot was made before midnight
+        t -= 86400
+    self.info.insert(0, SpotReport(internName(spot.spotter), t, spot.comment,
+        internName(spot.mode), spot.snr, spot.wpm, internName(spot.kind)))
+
+# A spot parsed from a "DX de" line.  The frequency is in Hertz, and utc is the spot time in minutes
+# after midnight or None.  For RBN and skimmer spots, mode, snr (dB), wpm and kind (CQ, BEACON, ...) are
+# taken from the comment; otherwise mode and kind are '' and snr and wpm are None.
+SpotRecord = collections.namedtuple('SpotRecord', 'spotter freq dx comment utc locator mode snr wpm kind')
+
+# DX de SPOTTER:  FREQ  DX  comment  HHMMZ  locator
+spot_re = re.compile(r'dx\s+de\s+(\S+?):?\s+(\d+\.?\d*)\s+(\S+)\s*(.*)', re.I)
+time_re = re.compile(r'(?:^|\s)(\d\d)(\d\d)z(?:\s+(\w+))?[\s\x07]*$', re.I)
+# CW  12 dB  22 WPM  CQ; only the RBN and skimmer modes, so that a comment like "TNX 5 dB QSO" has no mode
+rbn_modes = 'cw|rtty|psk31|psk63|psk125|bpsk31|bpsk63|bpsk125|ft8|ft4|jt65|jt9|msk144|q65|js8|wspr'
+rbn_re = re.compile(r'(' + rbn_modes + r')\s+([-+]?\d+)\s*db(?:\s+(\d+)\s*(?:wpm|bps))?(?:\s+(cq|beacon|ncdxf b|dx|test)\b)?', re.I)
+
+def parseSpot(message):		# Return a SpotRecord for a "DX de" line, or None
+  m = spot_re.match(message)
+  if not m:
+    return None
+  spotter, freq, dx, comment = m.groups()
+  # The time and locator are at the end of the line, so only search the end
+  t = time_re.search(comment, max(0, len(comment) - 24))
+  if t:
+    hours, minutes, locator = t.groups()
+    utc = int(hours) * 60 + int(minutes)
+    comment = comment[:t.start()].rstrip()
+  else:
+    utc = locator = None
+    comment = comment.rstrip(' \t\r\n\x07')
+  mode = kind = ''
+  snr = wpm = None
+  r = rbn_re.match(comment)
+  if r:
+    mode, snr, wpm, kind = r.groups()
+    mode = mode.upper()
+    snr = int(snr)
+    if wpm is not None:
+      wpm = int(wpm)
+    kind = kind.upper() if kind else ''
+  return SpotRecord(spotter, int(round(float(freq) * 1000)), dx, comment, utc, locator or '', mode, snr, wpm, kind)
+  
+def bandOf(freq):	# Return the band name for a frequency in Hertz, or None
+  global band_starts, band_edges
+  if band_starts is None:
+    band_edges = sorted((f1, f2, band) for band, (f1, f2) in conf.BandEdge.items())
+    band_starts = [x[0] for x in band_edges]
+  i = bisect.bisect_right(band_starts, freq) - 1
+  if i >= 0 and freq <= band_edges[i][1]:
+    return band_edges[i][2]
+  return None
+
+band_starts = None
+band_edges = None
+
+SPOT_ADDED = 'added'		# kinds of change in DxSpotStore.getChanges()
+SPOT_UPDATED = 'updated'
+SPOT_EXPIRED = 'expired'
+
+class DxSpotStore():
+  """Keep DxEntry spots sorted by frequency.
+
+  The telnet thread inserts, updates and expires spots while the GUI thread asks for the
+  spots within the visible span.  All access is protected by a lock, and the GUI gets
+  a copy of the list so it can iterate without holding the lock.  Spots are found by
+  a dictionary keyed on the DX call sign (and the band if conf.dxClDedupBand), and expire
+  from a heap ordered by time.  A heap item is stale if its entry was later updated or removed,
+  and the heap is rebuilt when most of its items are stale.
+
+  Each insert, update and expire is recorded as (kind, entry) in a change log.  A GUI consumer
+  keeps the serial number of the last change it read, and calls getChanges() for the rest."""
+  max_changes = 10000		# length of the change log
+  def __init__(self):
+    self.lock = threading.RLock()
+    self.freqs = []		# sorted spot frequencies in Hertz
+    self.entries = []		# the DxEntry for each frequency in self.freqs
+    self.index = {}		# the DxEntry for each key
+    self.heap = []		# (timestamp, serial, entry) in time order
+    self.serial = 0		# tie breaker for equal times
+    self.changes = collections.deque(maxlen=self.max_changes)	# (kind, entry)
+    self.change_serial = 0	# serial number of the last change
+    
+  def __len__(self):
+    return len(self.entries)
+    
+  def __iter__(self):
+    with self.lock:
+      return iter(list(self.entries))
       
-        except:
-          pass
-      self.info.insert(0, (spotter, sTime, locator, comment))
-      self.timestamp = time.time()
-#      print(self.dx, self.freq, spotter, sTime, locator, comment)
+  def key(self, entry):
+    if conf.dxClDedupBand:
+      return (entry.dx, bandOf(entry.freq))
+    return entry.dx
+
+  # The methods starting with "_" must be called with the lock held.
+  def _index(self, entry):	# Return the list index of entry, or -1
+    i = bisect.bisect_left(self.freqs, entry.freq)
+    while i < len(self.freqs) and self.freqs[i] == entry.freq:
+      if self.entries[i] is entry:
+        return i
+      i += 1
+    return -1
+    
+  def _push(self, entry):	# Record the entry time in the expire heap
+    self.serial += 1
+    heapq.heappush(self.heap, (entry.timestamp, self.serial, entry))
+
+  def _record(self, kind, entry):
+    self.change_serial += 1
+    self.changes.append((kind, entry))
+
+  def _insert(self, entry):
+    i = bisect.bisect_right(self.freqs, entry.freq)
+    self.freqs.insert(i, entry.freq)
+    self.entries.insert(i, entry)
+    
+  def _remove(self, entry):
+    i = self._index(entry)
+    if i >= 0:
+      del self.freqs[i]
+      del self.entries[i]
+      key = self.key(entry)
+      if self.index.get(key) is entry:
+        del self.index[key]
       return True
-    return False   
+    return False
+
+  def insert(self, entry):
+    with self.lock:
+      self._insert(entry)
+      self.index[self.key(entry)] = entry
+      self._push(entry)
+      self._record(SPOT_ADDED, entry)
+      
+  def remove(self, entry):
+    with self.lock:
+      if self._remove(entry):
+        self._record(SPOT_EXPIRED, entry)
+        return True
+    return False
+    
+  def update(self, entry, element):
+    # Join the new spot element to the stored entry, and move the entry if its frequency changed.
+    with self.lock:
+      i = self._index(entry)
+      timestamp = entry.timestamp
+      entry.join(element)
+      if i >= 0 and self.freqs[i] != entry.freq:
+        del self.freqs[i]
+        del self.entries[i]
+        self._insert(entry)
+      if entry.timestamp != timestamp:
+        self._push(entry)
+      self._record(SPOT_UPDATED, entry)
+        
+  def find(self, element):	# Return the stored entry for the same DX station, or None
+    with self.lock:
+      return self.index.get(self.key(element))
+    
+  def merge(self, element):
+    # Join a new spot to the stored entry for the same station, or insert it.  Return the stored entry.
+    with self.lock:
+      entry = self.index.get(self.key(element))
+      if entry is None:
+        self.insert(element)
+        return element
+      self.update(entry, element)
+      return entry
+
+  def load(self, elements):
+    # Merge a list of spots, oldest first, and sort the store once.  This is faster than merge() for
+    # the spots replayed at startup.  Return the number of stored entries.
+    with self.lock:
+      if self.entries:		# only an empty store is loaded in bulk
+        for element in elements:
+          self.merge(element)
+        return len(self.entries)
+      index = self.index
+      for element in elements:
+        key = self.key(element)
+        entry = index.get(key)
+        if entry is None:
+          index[key] = element
+        else:
+          entry.join(element)
+      entries = sorted(index.values(), key=lambda entry: entry.freq)
+      self.entries = entries
+      self.freqs = [entry.freq for entry in entries]
+      self.compact()
+      for entry in entries:
+        self._record(SPOT_ADDED, entry)
+      return len(entries)
+
+  def expire(self, now=None):		# Remove expired entries and return a list of them
+    if now is None:
+      now = time.time()
+    limit = now - conf.dxClExpireTime * 60
+    expired = []
+    with self.lock:
+      heap = self.heap
+      while heap and heap[0][0] < limit:
+        timestamp, serial, entry = heapq.heappop(heap)
+        if entry.timestamp == timestamp and self.remove(entry):
+          expired.append(entry)
+      if len(heap) > 2 * len(self.entries) + 100:	# discard the stale items left by updates
+        self.compact()
+    return expired
+
+  def compact(self):	# Rebuild the expire heap with one item for each stored entry
+    with self.lock:
+      self.heap = []
+      for entry in self.entries:
+        self.serial += 1
+        self.heap.append((entry.timestamp, self.serial, entry))
+      heapq.heapify(self.heap)
+    
+  def getRange(self, freq1, freq2):	# Return the entries with freq1 < frequency < freq2
+    with self.lock:
+      i1 = bisect.bisect_right(self.freqs, freq1)
+      i2 = bisect.bisect_left(self.freqs, freq2)
+      return self.entries[i1:i2]
+
+  def getChanges(self, serial):
+    """Return (new_serial, changes) for the changes after serial.
+
+    The changes are a list of (kind, entry).  If the older changes were discarded from the log,
+    the changes are None, and the caller must read the whole store again."""
+    with self.lock:
+      last = self.change_serial
+      if serial == last:
+        return last, []
+      first = last - len(self.changes)	# serial of the change before the oldest in the log
+      if serial < first or serial > last:
+        return last, None
+      return last, list(itertools.islice(self.changes, serial - first, None))
   
-class DxCluster(threading.Thread):
-  def __init__(self, dxClHost, dxClPort, user_call_sign, dxClPassword, dxClFltrCmd ):
-    self.do_init = 1
+class DxFeed():
+  """One telnet connection to a DX cluster, RBN or skimmer server.
+
+  A feed does no I/O of its own.  DxClusterClient selects on the socket of every feed
+  in one thread, and calls connect(), onReadable(), onWritable() and close()."""
+  login_timeout = 10.0		# seconds to wait for the login and password prompts
+  idle_timeout = 900.0		# reconnect if nothing is received for this many seconds
+  min_backoff = 5.0		# seconds to wait before the first reconnect
+  max_backoff = 300.0
+  talk = False			# print connection messages
+  def __init__(self, host, port, user_call_sign, password, fltrCmd):
+    self.host = host
+    self.port = port or 23	# port zero means the telnet port
+    self.user_call_sign = user_call_sign
+    self.password = password
+    self.fltrCmd = fltrCmd
+    self.sock = None
+    self.state = 'idle'		# idle, connecting, login, password, connected or waiting
+    self.rbuf = b''
+    self.wbuf = b''
+    self.state_time = 0		# time of the last state change
+    self.rx_time = 0		# time data was last received
+    self.retry_time = 0		# time for the next connect attempt
+    self.failures = 0		# connect failures since the last good connection
+    # statistics
+    self.connects = 0
+    self.disconnects = 0
+    self.bytes = 0
+    self.lines = 0
+    self.spots = 0
+    self.errors = 0
+    self.last_error = ''
+  def getHost(self):
+    return self.host + ':' + str(self.port)
+  def fileno(self):
+    return self.sock.fileno()
+  def setState(self, state, now):
+    self.state = state
+    self.state_time = now
+  def connect(self, now):
+    self.rbuf = self.wbuf = b''
+    try:
+      self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+      self.sock.setblocking(0)
+      err = self.sock.connect_ex((self.host, self.port))
+    except Exception as e:
+      self.fail(now, str(e))
+      return
+    if err and err not in (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, getattr(errno, 'WSAEWOULDBLOCK', -1)):
+      self.fail(now, os.strerror(err))
+      return
+    self.setState('connecting', now)
+  def fail(self, now, msg):		# close the connection and wait before reconnecting
+    if self.state in ('login', 'password', 'connected'):
+      self.disconnects += 1
+      if now - self.state_time > 60.0:		# the connection was good for a while
+        self.failures = 0
+    self.errors += 1
+    self.last_error = msg
+    print("DX Cluster error %s: %s" % (self.getHost(), msg))
+    self.close()
+    delay = min(self.max_backoff, self.min_backoff * 2 ** self.failures)
+    self.failures += 1
+    self.retry_time = now + delay * random.uniform(0.5, 1.0)
+    self.setState('waiting', now)
+  def close(self):
+    if self.sock:
+      try:
+        self.sock.close()
+      except Exception:
+        pass
+      self.sock = None
+    self.setState('idle', time.time())
+  def write(self, text):
+    self.wbuf += text.encode('utf-8', 'replace')
+  def onWritable(self, now):
+    if self.state == 'connecting':
+      err = self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+      if err:
+        self.fail(now, os.strerror(err))
+        return
+      self.connects += 1
+      self.rx_time = now
+      self.setState('login', now)
+      if self.talk: print('Connected to:  %s; Port: %s\n' % (self.host, self.port))
+    if self.wbuf:
+      try:
+        n = self.sock.send(self.wbuf)
+      except socket.error as e:
+        if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+          self.fail(now, str(e))
+        return
+      self.wbuf = self.wbuf[n:]
+  def onReadable(self, now):	# Return a list of the complete lines received
+    try:
+      data = self.sock.recv(8192)
+    except socket.error as e:
+      if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK):
+        return []
+      self.fail(now, str(e))
+      return []
+    if not data:
+      self.fail(now, "Connection closed by server")
+      return []
+    self.bytes += len(data)
+    self.rx_time = now
+    self.rbuf += self.telnetOptions(data)
+    lines = self.rbuf.split(b'\n')
+    self.rbuf = lines.pop()		# a partial line or a prompt
+    if self.state in ('login', 'password') and self.login(now, b'\n'.join(lines[-1:]) + self.rbuf):
+      self.rbuf = b''			# discard the prompt
+    self.lines += len(lines)
+    return [line.decode('utf-8', 'replace') for line in lines]
+  def telnetOptions(self, data):
+    # Remove telnet commands from the data, and refuse all option requests like telnetlib
+    if IAC not in data:
+      return data
+    data = bytearray(data)
+    out = bytearray()
+    i = 0
+    while i < len(data):
+      c = data[i]
+      if c != IAC_CODE:
+        out.append(c)
+        i += 1
+      elif i + 1 < len(data) and data[i + 1] == IAC_CODE:	# escaped 255
+        out.append(c)
+        i += 2
+      elif i + 2 < len(data) and data[i + 1] in (DO, DONT, WILL, WONT):
+        if data[i + 1] == DO:
+          self.wbuf += bytes(bytearray((IAC_CODE, WONT, data[i + 2])))
+        elif data[i + 1] == WILL:
+          self.wbuf += bytes(bytearray((IAC_CODE, DONT, data[i + 2])))
+        i += 3
+      else:		# other two byte commands; an option split across reads is dropped
+        i += 2
+    return bytes(out)
+  def login(self, now, text=b''):
+    # Send the call sign at the login prompt, then the password and the filter command.
+    # Return True if a prompt was answered.
+    prompt = text.lower()
+    if self.state == 'login':
+      if b'login:' in prompt or b'call:' in prompt or now - self.state_time > self.login_timeout:
+        self.write(str(self.user_call_sign) + "\n")	# user_call_sign may be Unicode
+        if self.password:
+          self.setState('password', now)
+        else:
+          self.loggedIn(now)
+        return True
+    elif self.state == 'password':
+      if b'password' in prompt or now - self.state_time > self.login_timeout:
+        self.write(str(self.password) + "\n")
+        self.loggedIn(now)
+        return True
+    return False
+  def loggedIn(self, now):
+    if self.fltrCmd:
+      self.write(str(self.fltrCmd) + "\n")
+      if self.talk: print(str(self.fltrCmd + "\n"))
+    self.setState('connected', now)
+  def poll(self, now):		# Check timers
+    if self.state == 'waiting' and now >= self.retry_time:
+      self.connect(now)
+    elif self.state == 'connecting' and now - self.state_time > 10.0:
+      self.fail(now, "Connect timeout")
+    elif self.state in ('login', 'password'):
+      self.login(now)
+    elif self.state == 'connected' and now - self.rx_time > self.idle_timeout:
+      self.fail(now, "No data received")
+
+IAC = b'\xff'
+IAC_CODE = 255
+DONT = 254
+DO = 253
+WONT = 252
+WILL = 251
+
+class SpotNotifier():
+  """Collect spot changes and pass them to the listener as one batch per interval.
+
+  The listener is called from the cluster thread with a list of the stored DxEntry changed since
+  the last call, and it should just post the batch to the GUI with wx.CallAfter().  So the GUI is
+  updated at most once per interval however fast the spots arrive."""
+  def __init__(self, interval):
+    self.interval = interval
+    self.listener = None
+    self.lock = threading.Lock()	# local spots are added from the GUI thread
+    self.pending = []
+    self.last_post = 0.0
+    self.received = 0		# number of spots received
+    self.posted = 0		# number of calls to the listener
+  def notify(self, entry, received=False):	# received is True for a new spot, False for an expired entry
+    with self.lock:
+      self.pending.append(entry)
+      if received:
+        self.received += 1
+  def timeout(self, now):
+    # Return the time to wait before the next call to poll()
+    if not self.pending:
+      return None
+    return max(0.0, self.last_post + self.interval - now)
+  def poll(self, now):
+    if self.pending and now - self.last_post >= self.interval:
+      with self.lock:
+        batch = self.pending
+        self.pending = []
+      self.last_post = now
+      if self.listener:
+        self.posted += 1
+        self.listener(batch)
+
+class DxClusterClient(threading.Thread):
+  """Run any number of DX cluster, RBN and skimmer feeds from one thread.
+
+  All feeds are read with select(), and all spots go into one DxSpotStore, so a station
+  spotted by two feeds is one entry.  A failed feed reconnects after a random delay that
+  doubles on each failure, and the other feeds keep running."""
+  def __init__(self, feeds, user_call_sign, dxClPassword, journal=None, spotFilter=None):
+    # feeds is a list of (host, port, filter_command); journal is a spotjournal.SpotJournal or None;
+    # spotFilter is a spotfilter.SpotFilter or None
     threading.Thread.__init__(self)
+    self.journal = journal
+    self.spotFilter = spotFilter
+    self.filter_time = 0
     self.doQuit = threading.Event()
-    self.dxSpots = []
-    self.doQuit.clear()
-    self.dxClHost = dxClHost
-    self.dxClPort = dxClPort
-    self.user_call_sign = user_call_sign
-    self.dxClFltrCmd = dxClFltrCmd
+    self.dxSpots = DxSpotStore()
+    self.notifier = SpotNotifier(conf.dxClUpdateInterval)
     try:
       if not (conf.TelnetTalk == None):
         self.TelnetTalk = conf.TelnetTalk
     except:
       self.TelnetTalk = True
+    self.feeds = []
+    for host, port, fltrCmd in feeds:
+      feed = DxFeed(host, port, user_call_sign, dxClPassword, fltrCmd)
+      feed.talk = self.TelnetTalk
+      self.feeds.append(feed)
     
   def run(self):
-    self.telnetInit()
-    if self.telnetConnect():
-      if not self.dxClFltrCmd =='':
-        self.tn.write(str(self.dxClFltrCmd) + "\n")
-        if(self.TelnetTalk): print(str(self.dxClFltrCmd + "\n"))
-      
-      while not self.doQuit.isSet():
-        try:
-          self.telnetRead()
-        except:
-          self.tn.close()
-          time.sleep(20)
-          if not self.doQuit.isSet():
-            self.telnetConnect()
-    self.tn.close()
+    now = time.time()
+    for feed in self.feeds:
+      feed.connect(now)
+    while not self.doQuit.isSet():
+      rlist = [f for f in self.feeds if f.state in ('connecting', 'login', 'password', 'connected')]
+      wlist = [f for f in rlist if f.state == 'connecting' or f.wbuf]
+      timeout = self.notifier.timeout(time.time())
+      if timeout is None or timeout > 1.0:
+        timeout = 1.0
+      try:
+        if rlist:
+          readable, writable, x = select.select(rlist, wlist, [], timeout)
+        else:
+          readable = writable = ()
+          self.doQuit.wait(timeout)
+      except (select.error, socket.error, ValueError) as e:
+        print("DX Cluster select error", e)
+        readable = writable = ()
+        self.doQuit.wait(1.0)
+      now = time.time()
+      for feed in writable:
+        if feed.sock:
+          feed.onWritable(now)
+      for feed in readable:
+        if feed.sock and feed.state != 'connecting':
+          for line in feed.onReadable(now):
+            self.readLine(feed, line)
+      for feed in self.feeds:
+        feed.poll(now)
+      self.notifier.poll(now)
+      if self.spotFilter and now - self.filter_time > 2.0:
+        self.filter_time = now
+        self.spotFilter.reload()
+    for feed in self.feeds:
+      feed.close()
       
   def setListener (self, listener):  
-    self.listener = listener
+    # listener(batch) is called at most once per conf.dxClUpdateInterval seconds
+    self.notifier.listener = listener
         
-  def telnetInit(self):
-    self.tn = telnetlib.Telnet()
-      
-  def telnetConnect(self):
-    #if(self.TelnetTalk): self.tn.set_debuglevel(3)
-    HstPrt = (str(self.dxClHost), str(self.dxClPort))
-    try:
-        self.tn.open(self.dxClHost, self.dxClPort, 10)
-        if(self.TelnetTalk): print('Connected to:  %s; Port: %s\n' %HstPrt)
-        try:
-          self.tn.read_until('login:', 10)
-          self.tn.write(str(self.user_call_sign) + "\n")
-                  # user_call_sign may be Unicode
-          if conf.dxClPassword:
-            self.tn.read_until("Password: ")
-            self.tn.write(str(self.dxClPassword) + "\n")
-          return True
-        except Exception:
-          print("DX Cluster Connection error: {}:{}".format(self.dxClHost, self.dxClPort))
-          return False
-    except Exception:
-      print("DX Cluster Telnet.Open() error: {}:{}".format(self.dxClHost, self.dxClPort))
-      return False    
-
-  def telnetRead(self):
-    message = self.tn.read_until('\n', 60).decode(encoding='utf-8', errors='replace')
+  def readLine(self, feed, message):
     if self.doQuit.isSet() == False:
-      dxEntry = DxEntry();
-      if dxEntry.parseMessage(message):
+      spot = parseSpot(message)
+      if spot:
+        feed.spots += 1
         if(self.TelnetTalk): print(message)
-        for i, listElement in enumerate(self.dxSpots):
-          if (listElement.equal(dxEntry)):
-            listElement.join (dxEntry)
-            return
-          if listElement.isExpired():
-            del (self.dxSpots[i])
-        self.dxSpots.append(dxEntry)
-        if self.listener:
-          self.listener()
+        self.addSpot(spot)
+
+  def addSpot(self, spot):
+    # Filter and store a SpotRecord from a feed, or a local spot from the skimmer.  Return the stored DxEntry or None.
+    if self.spotFilter and not self.spotFilter.accept(spot):
+      return None
+    dxEntry = DxEntry()
+    dxEntry.setSpot(spot)
+    for entry in self.dxSpots.expire():
+      self.notifier.notify(entry)
+    if self.journal:		# the journal records the spot as received
+      self.journal.append(dxEntry)
+    entry = self.dxSpots.merge(dxEntry)
+    self.notifier.notify(entry, True)
+    return entry
         
   def getHost(self):
-    return self.tn.host + ':' + str(self.tn.port)
+    return ', '.join([feed.getHost() for feed in self.feeds])
         
   def stop(self):
+    # Wait for the cluster thread, so no spot is appended to the journal after it stops
     self.doQuit.set()
+    if self.is_alive() and self is not threading.current_thread():
+      self.join(2.0)
+    if self.journal:
+      self.journal.stop(2.0)
+
+def benchmark(count=10000, lines=20000):
+  """Measure the rate at which spot lines are parsed and merged with count live spots."""
+  import random
+  random.seed(1)
+  store = DxSpotStore()
+  for i in range(count):
+    entry = DxEntry()
+    entry.parseMessage("DX de K%dAB-#:  %.1f  W%dX%d  CW 12 dB 22 WPM CQ  %02d%02dZ" % (
+        i % 10, 7000.0 + i * 0.1, i % 10, i, i // 60 % 24, i % 60))
+    store.insert(entry)
+  messages = []
+  for i in range(lines):
+    n = random.randrange(count * 2)		# half are updates, half are new stations
+    messages.append("DX de N%dZZ-#:  %.1f  W%dX%d  CW 18 dB 25 WPM CQ  1200Z" % (
+        n % 10, 7000.0 + n * 0.1, n % 10, n))
+  t0 = time.time()
+  for message in messages:
+    entry = DxEntry()
+    if entry.parseMessage(message):
+      store.expire()
+      store.merge(entry)
+  t1 = time.time()
+  print("%d lines with %d live spots: %.0f lines per second, %d spots stored" % (
+      lines, count, lines / (t1 - t0), len(store)))
+  t0 = time.time()
+  for i in range(1000):
+    store.getRange(7100000, 7148000)
+  t1 = time.time()
+  print("Range query for a 48 kHz span: %.1f microseconds" % ((t1 - t0) * 1E3))
+
+def sizeOf(obj, seen):	# Return the bytes used by obj and the objects it refers to, counting each object once
+  if id(obj) in seen:
+    return 0
+  seen.add(id(obj))
+  size = sys.getsizeof(obj)
+  if isinstance(obj, (list, tuple)):
+    for item in obj:
+      size += sizeOf(item, seen)
+  elif hasattr(obj, '__dict__'):
+    size += sizeOf(obj.__dict__, seen)
+    for item in obj.__dict__.values():
+      size += sizeOf(item, seen)
+  if hasattr(obj, '__slots__'):
+    for name in obj.__slots__:
+      if hasattr(obj, name):
+        size += sizeOf(getattr(obj, name), seen)
+  return size
+
+def benchmarkMemory(count=20000):
+  """Compare the bytes per spot of DxEntry with the former list of tuples entry."""
+  class OldEntry:		# DxEntry before __slots__ and SpotReport
+    pass
+  olds = []
+  news = []
+  for i in range(count):
+    for r in range(3):		# three reports for each station
+      message = "DX de K%dAB-#:  %.1f  W%dX%d  CW %d dB 22 WPM CQ  %02d%02dZ" % (
+        r, 7000.0 + i * 0.1, i % 10, i, 10 + r, i // 60 % 24, i % 60)
+      spot = parseSpot(message)
+      old = OldEntry()
+      old.info = [(spot.spotter, '%02d:%02d UTC' % divmod(spot.utc, 60), spot.dx, spot.comment)]
+      old.freq = spot.freq
+      old.dx = spot.dx
+      old.timestamp = time.time()
+      new = DxEntry()
+      new.parseMessage(message)
+      if r == 0:
+        olds.append(old)
+        news.append(new)
+      else:
+        olds[-1].info.insert(0, old.info[0])
+        news[-1].join(new)
+  seen = set()
+  old_size = sum([sizeOf(x, seen) for x in olds])
+  seen = set()
+  new_size = sum([sizeOf(x, seen) for x in news])
+  print("%d stations with 3 reports: %.0f bytes per station before, %.0f bytes after" % (
+      count, float(old_size) / count, float(new_size) / count))
+
+# The parser must handle at least this many lines per second of the spot corpus
+PARSE_TARGET = 50000
+
+def benchmarkParser(filename=None, repeat=200):
+  """Parse the recorded spot corpus dxspots.txt and return True if the rate meets PARSE_TARGET."""
+  if filename is None:
+    filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dxspots.txt')
+  fp = open(filename)
+  lines = fp.read().splitlines()
+  fp.close()
+  spots = [parseSpot(line) for line in lines]
+  parsed = len(spots) - spots.count(None)
+  rbn = len([x for x in spots if x and x.snr is not None])
+  t0 = time.time()
+  for i in range(repeat):
+    for line in lines:
+      parseSpot(line)
+  t1 = time.time()
+  rate = len(lines) * repeat / (t1 - t0)
+  print("%d corpus lines, %d spots, %d with RBN fields: %.0f lines per second, target %d" % (
+      len(lines), parsed, rbn, rate, PARSE_TARGET))
+  return rate >= PARSE_TARGET
+
+if __name__ == '__main__':
+  ok = benchmarkParser()
+  benchmark()
+  benchmarkMemory()
+  if not ok:
+    sys.exit(1)
@@ -0,0 +1,351 @@
+# Design the I/Q receive filter coefficients, with a cache of recent designs.
+
+from __future__ import print_function
+from __future__ import division
+
+import math
+import cmath
+import time
+import collections
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+from filters import Filters
+
+windows = ('blackman', 'hamming', 'hanning', 'rectangular', 'equiripple')
+
+cache = collections.OrderedDict()	# the most recently used designs are at the end
+cache_size = 64
+cache_hits = 0
+cache_misses = 0
+
+def filterSize(rate, bw):
+  """Return the odd number of taps for a window filter of bandwidth bw."""
+  shape = 1.5       # Shape factor at 88 dB
+  trans = (bw / 2.0 / rate) * (shape - 1.0)     # 88 dB atten
+  N = int(4.0 / trans)
+  if N > 1000:
+    N = 1000
+  return (N // 2) * 2 + 1
+
+def windowedSinc(N, K, window='blackman'):
+  """Return a lowpass filter of N taps and bandwidth K / N times the sample rate.
+
+  The result is a numpy array if numpy is available, otherwise a list."""
+  pi = math.pi
+  if numpy is not None:
+    k = numpy.arange(-N // 2, N // 2 + 1, dtype=numpy.float64)
+    z = numpy.empty(len(k))
+    nonzero = k != 0
+    kn = k[nonzero]
+    z[nonzero] = 1.0 / N * numpy.sin(pi * kn * K / N) / numpy.sin(pi * kn / N)
+    z[~nonzero] = float(K) / N
+    if window == 'blackman':
+      z *= 0.42 + 0.5 * numpy.cos(2. * pi * k / N) + 0.08 * numpy.cos(4. * pi * k / N)
+    elif window == 'hamming':
+      z *= 0.54 + 0.46 * numpy.cos(2. * pi * k / N)
+    elif window == 'hanning':
+      z *= 0.5 + 0.5 * numpy.cos(2. * pi * k / N)
+    return z
+  filtD = []
+  sin = math.sin
+  cos = math.cos
+  for k in range(-N // 2, N // 2 + 1):
+    # Make a lowpass filter
+    if k == 0:
+      z = float(K) / N
+    else:
+      z = 1.0 / N * sin(pi * k * K / N) / sin(pi * k / N)
+    # Apply a windowing function
+    if window == 'blackman':
+      w = 0.42 + 0.5 * cos(2. * pi * k / N) + 0.08 * cos(4. * pi * k / N)
+    elif window == 'hamming':
+      w = 0.54 + 0.46 * cos(2. * pi * k / N)
+    elif window == 'hanning':
+      w = 0.5 + 0.5 * cos(2. * pi * k / N)
+    else:
+      w = 1
+    filtD.append(z * w)
+  return filtD
+
+def remezLowpass(N, fpass, fstop, weight=1.0, density=16, max_iter=40):
+  """Return N taps, N odd, of an equiripple lowpass filter made with the Remez exchange algorithm.
+
+  The band edges fpass and fstop are fractions of the sample rate.  The stopband error is
+  multiplied by weight, so a larger weight gives more stopband attenuation and more passband
+  ripple.  The result is a numpy array; numpy is required."""
+  M = (N - 1) // 2		# the response is a sum of cos(k * w) for k = 0 to M
+  ngrid = density * (M + 1)
+  wp = 2 * math.pi * fpass
+  ws = 2 * math.pi * fstop
+  npass = max(2, int(ngrid * wp / (wp + math.pi - ws)))
+  nstop = max(2, ngrid - npass)
+  w = numpy.concatenate((numpy.linspace(0, wp, npass), numpy.linspace(ws, math.pi, nstop)))
+  x = numpy.cos(w)
+  D = numpy.concatenate((numpy.ones(npass), numpy.zeros(nstop)))		# desired response
+  W = numpy.concatenate((numpy.ones(npass), numpy.ones(nstop) * weight))	# error weight
+  signs = (-1.0) ** numpy.arange(M + 2)
+  ext = numpy.round(numpy.linspace(0, len(w) - 1, M + 2)).astype(int)	# the extremal frequencies
+  for iteration in range(max_iter):
+    # Find the response with error +/- delta at the extremal frequencies
+    xe = x[ext]
+    b = baryWeights(xe)
+    delta = numpy.dot(b, D[ext]) / numpy.dot(b, signs / W[ext])
+    C = D[ext] - signs * delta / W[ext]
+    bc = baryWeights(xe[:-1])
+    E = W * (D - baryInterp(xe[:-1], C[:-1], bc, x))
+    # The new extremal frequencies are at the largest errors
+    new = extremals(E, M + 2)
+    if len(new) < M + 2:
+      break
+    error = numpy.abs(E[new]).max()
+    converged = numpy.array_equal(new, ext) or error - abs(delta) <= 1E-6 * error
+    ext = new
+    if converged:
+      break
+  # Sample the response at N frequencies and find the taps
+  wk = 2 * math.pi * numpy.arange(M + 1) / N
+  A = baryInterp(xe[:-1], C[:-1], bc, numpy.cos(wk))
+  n = numpy.arange(N) - M
+  return (A[0] + 2 * numpy.dot(A[1:], numpy.cos(numpy.outer(wk[1:], n)))) / N
+
+def baryWeights(x):	# Return the barycentric weights of the points x, scaled to avoid overflow
+  diff = x[:, None] - x[None, :]
+  numpy.fill_diagonal(diff, 1.0)
+  logs = numpy.log(numpy.abs(diff)).sum(axis=1)
+  return numpy.sign(diff).prod(axis=1) * numpy.exp(logs.min() - logs)
+
+def baryInterp(xk, yk, bk, x):	# Return the polynomial through (xk, yk) at the points x
+  diff = x[:, None] - xk[None, :]
+  exact = diff == 0
+  diff[exact] = 1.0
+  t = bk / diff
+  y = numpy.dot(t, yk) / t.sum(axis=1)
+  rows, cols = numpy.nonzero(exact)
+  y[rows] = yk[cols]
+  return y
+
+def extremals(E, count):
+  """Return the index of the largest error in each run of errors with the same sign, at most count."""
+  a = numpy.abs(E)
+  starts = numpy.concatenate(([0], numpy.nonzero(numpy.diff(E >= 0))[0] + 1, [len(E)]))
+  keep = [start + int(a[start:end].argmax()) for start, end in zip(starts[:-1], starts[1:])]
+  while len(keep) > count:	# drop the smaller end to keep the signs alternating
+    if a[keep[0]] < a[keep[-1]]:
+      del keep[0]
+    else:
+      del keep[-1]
+  return numpy.array(keep)
+
+def measureLowpass(taps, fpass, fstop):
+  """Return the passband ripple and the stopband attenuation in dB of a lowpass filter."""
+  size = 8192
+  while size < len(taps) * 16:
+    size *= 2
+  H = numpy.abs(numpy.fft.rfft(numpy.asarray(taps, dtype=numpy.float64), size))
+  f = numpy.arange(len(H)) / float(size)
+  passband = H[f <= fpass]
+  stopband = H[f >= fstop]
+  ripple = 20 * math.log10(passband.max() / max(passband.min(), 1E-30))
+  atten = -20 * math.log10(max(stopband.max(), 1E-30) / passband.max())
+  return ripple, atten
+
+def estimateTaps(fpass, fstop, ripple, atten):
+  """Return the estimate by Kaiser of the taps of an equiripple lowpass filter.
+
+  The band edges are fractions of the sample rate, the ripple is dB peak to peak and the
+  attenuation is in dB."""
+  dp = (10 ** (ripple / 20.0) - 1) / (10 ** (ripple / 20.0) + 1)
+  ds = 10 ** (-atten / 20.0)
+  return int((-20 * math.log10(math.sqrt(dp * ds)) - 13) / (14.6 * (fstop - fpass))) + 1
+
+def equirippleLowpass(fpass, fstop, ripple=0.2, atten=88.0, max_taps=1001):
+  """Return the shortest equiripple lowpass filter that meets the specification.
+
+  The band edges are fractions of the sample rate.  The passband has at most ripple dB peak to
+  peak, and the stopband has at least atten dB attenuation.  The size is limited to max_taps."""
+  dp = (10 ** (ripple / 20.0) - 1) / (10 ** (ripple / 20.0) + 1)
+  ds = 10 ** (-atten / 20.0)
+  weight = dp / ds
+  # Start with the estimate by Kaiser, then search for the shortest filter
+  N = estimateTaps(fpass, fstop, ripple, atten)
+  N = min(max_taps, max(5, (N // 2) * 2 + 1))
+  def meets(taps):
+    r, a = measureLowpass(taps, fpass, fstop)
+    return r <= ripple + 0.01 and a >= atten - 0.01
+  best = remezLowpass(N, fpass, fstop, weight)
+  if meets(best):
+    while N > 5:
+      taps = remezLowpass(N - 2, fpass, fstop, weight)
+      if not meets(taps):
+        break
+      N -= 2
+      best = taps
+  else:
+    while N < max_taps:
+      N += 2
+      best = remezLowpass(N, fpass, fstop, weight)
+      if meets(best):
+        break
+  return best
+
+def equirippleFilter(rate, bw, ripple=0.2, atten=88.0, shape=1.5, max_taps=1001):
+  """Return the shortest equiripple lowpass filter for bandwidth bw that meets the specification.
+
+  The passband is bw / 2 with at most ripple dB peak to peak, and the stopband starts at
+  shape * bw / 2 with at least atten dB attenuation.  The size is limited to max_taps."""
+  fpass = bw / 2.0 / rate
+  fstop = min(fpass * shape, 0.5)
+  return equirippleLowpass(fpass, fstop, ripple, atten, max_taps)
+
+def tuneFilter(filtD, center, rate):
+  """Tune a lowpass filter to center Hertz and return the I and Q bandpass filters as lists."""
+  NN = len(filtD)
+  D = (NN - 1.0) / 2.0
+  if numpy is not None:
+    tune = numpy.exp(-1j * 2.0 * math.pi * center / rate * (numpy.arange(NN) - D))
+    z = 2.0 * tune * numpy.asarray(filtD, dtype=numpy.float64)
+    return z.real.tolist(), z.imag.tolist()
+  filtI = []
+  filtQ = []
+  tune = -1j * 2.0 * math.pi * center / rate
+  for i in range(NN):
+    z = 2.0 * cmath.exp(tune * (i - D)) * filtD[i]
+    filtI.append(z.real)
+    filtQ.append(z.imag)
+  return filtI, filtQ
+
+def designFilter(rate, N, bw, center, window='blackman'):
+  """Make an I/Q filter with rectangular passband, without using the cache."""
+  lowpass = bw * 24000 // rate // 2
+  if lowpass in Filters:
+    filtD = Filters[lowpass]
+  else:
+    if window == 'equiripple' and N is None and numpy is not None:
+      filtD = equirippleFilter(rate, bw)
+    else:
+      if window == 'equiripple':	# a fixed size or no numpy
+        window = 'blackman'
+      if N is None:
+        N = filterSize(rate, bw)
+      K = bw * N // rate
+      filtD = windowedSinc(N, K, window)
+  if center:
+    # Make a bandpass filter by tuning the low pass filter to new center frequency.
+    # Make two quadrature filters.
+    return tuneFilter(filtD, center, rate)
+  if numpy is not None and not isinstance(filtD, list):
+    filtD = filtD.tolist()
+  return filtD, filtD
+
+def makeFilterCoef(rate, N, bw, center, window='blackman'):
+  """Return the (I, Q) coefficient lists of an I/Q filter with rectangular passband.
+
+  The filter is a custom filter from filters.py if there is one for this bandwidth, otherwise a
+  windowed sinc of N taps, or a size chosen from the bandwidth if N is None.  A non-zero center
+  tunes the filter to a bandpass.  The most recent designs are kept in a cache; do not change the
+  returned lists."""
+  global cache_hits, cache_misses
+  key = (rate, N, bw, center, window)
+  try:
+    coefs = cache.pop(key)
+  except KeyError:
+    cache_misses += 1
+    coefs = designFilter(rate, N, bw, center, window)
+    if len(cache) >= cache_size:
+      cache.popitem(last=False)
+  else:
+    cache_hits += 1
+  cache[key] = coefs
+  return coefs
+
+def benchmark(repeat=20):
+  """Print the time to design the CW and SSB filters, with and without numpy and the cache."""
+  global numpy
+  designs = [(48000, None, bw, 700) for bw in (100, 200, 250, 300, 500)] + \
+            [(48000, None, bw, 300 + bw // 2) for bw in (1800, 2400, 2700, 3000)]
+  results = []
+  for use_numpy in (False, True):
+    saved = numpy
+    if not use_numpy:
+      numpy = None
+    elif numpy is None:
+      results.append("(no numpy)")
+      continue
+    t0 = time.time()
+    for i in range(repeat):
+      for rate, N, bw, center in designs:
+        designFilter(rate, N, bw, center)
+    results.append("%.0f" % ((time.time() - t0) / repeat / len(designs) * 1E6))
+    numpy = saved
+  cache.clear()
+  for rate, N, bw, center in designs:
+    makeFilterCoef(rate, N, bw, center)
+  t0 = time.time()
+  for i in range(repeat):
+    for rate, N, bw, center in designs:
+      makeFilterCoef(rate, N, bw, center)
+  results.append("%.1f" % ((time.time() - t0) / repeat / len(designs) * 1E6))
+  print("Filter design microseconds: Python %s, numpy %s, cache %s" % tuple(results))
+
+# The filter sample rate for each mode, from get_filter_rate() in quisk.c for 48000 sps
+mode_rates = (('CW', 6000), ('SSB', 12000), ('AM', 24000), ('FM', 24000), ('DGT', 48000))
+
+def report(samples=48000):
+  """Compare the current filters to equiripple filters for the bandwidths in quisk_conf_defaults.
+
+  For each mode and bandwidth, print the taps, ripple and attenuation of the custom or Blackman
+  filter used now, the taps of the shortest equiripple filter with the same specification, and the
+  time per sample of each.  The custom filters in filters.py are specified as 0.2 dB ripple, 100 dB
+  attenuation and shape factor 1.2.  The Blackman filters are meant for 88 dB at shape factor 1.5,
+  and are compared to equiripple filters with 0.2 dB ripple.  The time is for a complex FIR made
+  with numpy.convolve; the cost of the C filter loop is proportional to the taps in the same way."""
+  import quisk_conf_defaults as conf
+  if numpy is None:
+    print("The filter report needs numpy")
+    return
+  signal = numpy.exp(1j * numpy.arange(samples) * 0.1)
+  def cost(taps):
+    taps = numpy.asarray(taps, dtype=numpy.complex128)
+    t0 = time.time()
+    numpy.convolve(signal, taps, 'valid')
+    return (time.time() - t0) / samples * 1E9
+  print("Mode   Rate    BW   Now: kind     taps ripple  atten  ns/sample   Equiripple: taps ripple  atten  ns/sample")
+  total_now = total_eq = 0
+  done = set()
+  for mode, rate in mode_rates:
+    for bw in getattr(conf, 'FilterBw' + mode):
+      if not bw:
+        continue
+      bw = min(bw, rate // 2)
+      if (rate, bw) in done:
+        continue
+      done.add((rate, bw))
+      lowpass = bw * 24000 // rate // 2
+      if lowpass in Filters:
+        kind = 'custom'
+        now = Filters[lowpass]
+        atten = 100.0
+        shape = 1.2
+      else:
+        kind = 'blackman'
+        N = filterSize(rate, bw)
+        now = windowedSinc(N, bw * N // rate)
+        atten = 88.0
+        shape = 1.5
+      fpass = bw / 2.0 / rate
+      fstop = min(fpass * shape, 0.5)
+      eq = equirippleFilter(rate, bw, 0.2, atten, shape)
+      r1, a1 = measureLowpass(now, fpass, fstop)
+      r2, a2 = measureLowpass(eq, fpass, fstop)
+      total_now += len(now)
+      total_eq += len(eq)
+      print("%-4s %6d %5d  %-9s %5d %6.2f %6.1f %10.1f   %17d %6.2f %6.1f %10.1f" % (mode, rate, bw,
+          kind, len(now), r1, a1, cost(now), len(eq), r2, a2, cost(eq)))
+  print("Total taps: now %d, equiripple %d" % (total_now, total_eq))
+
+if __name__ == '__main__':
+  benchmark()
+  report()
@@ -0,0 +1,42 @@
+# Write the custom filter table in filters_data.py to the binary file filters.bin read by filters.py.
+# Run this after changing filters_data.py:  python make_filters.py
+
+from __future__ import print_function
+
+import sys
+import os
+import struct
+import array
+
+from filters_data import Filters
+
+# The file is "QFLT", the number of filters, then an index entry of key, offset and count for each
+# filter, then the coefficients.  The offset is the byte position of the first coefficient.
+# All numbers are little-endian; the coefficients are 8-byte floats.
+magic = b'QFLT'
+header = '<4sI'
+entry = '<iII'
+
+def main(path=None):
+  if path is None:
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'filters.bin')
+  keys = sorted(Filters)
+  offset = struct.calcsize(header) + struct.calcsize(entry) * len(keys)
+  index = []
+  data = []
+  for key in keys:
+    coefs = array.array('d', Filters[key])
+    if sys.byteorder != 'little':
+      coefs.byteswap()
+    index.append(struct.pack(entry, key, offset, len(coefs)))
+    data.append(coefs.tostring() if hasattr(coefs, 'tostring') else coefs.tobytes())
+    offset += len(coefs) * 8
+  fp = open(path, 'wb')
+  fp.write(struct.pack(header, magic, len(keys)))
+  fp.write(b''.join(index))
+  fp.write(b''.join(data))
+  fp.close()
+  print("Wrote %d filters to %s" % (len(keys), path))
+
+if __name__ == '__main__':
+  main()
@@ -3649,6 +3649,127 @@ static PyObject * get_multirx_graph(PyObject * self, PyObject * args)	// Called
 	return retrn;
 }
 
+// The raw sample tap is a ring buffer of every captured I/Q sample for a Python consumer such as the
+// CW skimmer.  The sound thread writes with quisk_raw_tap() and only moves raw_tap_write, and the GUI
+// thread reads with get_raw_tap() and only moves raw_tap_read.  If the ring is full, the samples are
+// discarded until the next read and raw_tap_gaps is incremented.  So the gap is always after the samples
+// returned by get_raw_tap(), and the reader knows the next samples do not follow them.  The barriers
+// make the samples visible before the index that covers them, as the tap is also used on ARM.
+static complex double * raw_tap_buf = NULL;
+static volatile int raw_tap_size = 0;		// the size of the ring, or zero when the tap is off
+static volatile int raw_tap_write = 0;
+static volatile int raw_tap_read = 0;
+static volatile int raw_tap_gaps = 0;		// the number of blocks discarded
+static volatile int raw_tap_drop = 0;		// discard samples until the next read
+static volatile int raw_tap_reset = 0;		// set_raw_tap() asks the sound thread to empty the ring
+static volatile int raw_tap_busy = 0;		// the sound thread is in quisk_raw_tap()
+
+void quisk_raw_tap(complex double * cSamples, int nSamples)	// Called by the sound thread
+{
+	int i, w, size, space;
+
+	raw_tap_busy = 1;
+	__sync_synchronize();	// set_raw_tap() sees busy, or we see the tap turned off
+	size = raw_tap_size;
+	if ( ! size) {
+		raw_tap_busy = 0;
+		return;
+	}
+	if (raw_tap_reset) {	// empty the ring; the reader ignores it until raw_tap_reset is clear
+		raw_tap_write = raw_tap_read;
+		raw_tap_drop = 0;
+		__sync_synchronize();
+		raw_tap_reset = 0;
+	}
+	w = raw_tap_write;
+	space = raw_tap_read - w - 1;
+	__sync_synchronize();	// the reader has copied the samples before raw_tap_read
+	if (space < 0)
+		space += size;
+	if (raw_tap_drop || nSamples > space) {		// the reader is late
+		raw_tap_drop = 1;
+		raw_tap_gaps++;
+		raw_tap_busy = 0;
+		return;
+	}
+	for (i = 0; i < nSamples; i++) {
+		if (quisk_invert_spectrum)
+			raw_tap_buf[w] = conj(cSamples[i]);
+		else
+			raw_tap_buf[w] = cSamples[i];
+		if (++w >= size)
+			w = 0;
+	}
+	__sync_synchronize();	// write the samples before raw_tap_write
+	raw_tap_write = w;
+	raw_tap_busy = 0;
+}
+
+static PyObject * set_raw_tap(PyObject * self, PyObject * args)	// Called by the GUI thread
+{	// Turn on the raw sample tap with a ring of size samples, or turn it off with size zero.
+	// The tap is off while the ring is changed, and a larger ring is made if size is larger than before.
+	// The sound thread empties the ring the next time it runs.
+	int size;
+	static int buf_size = 0;
+
+	if (!PyArg_ParseTuple (args, "i", &size))
+		return NULL;
+	raw_tap_size = 0;
+	__sync_synchronize();
+	while (raw_tap_busy)		// wait until the sound thread is done with the ring
+		QuiskSleepMicrosec(100);
+	if (size > buf_size) {
+		free(raw_tap_buf);
+		buf_size = 0;
+		raw_tap_buf = (complex double *) malloc(sizeof(complex double) * size);
+		if ( ! raw_tap_buf)
+			return PyErr_NoMemory();
+		buf_size = size;
+	}
+	if (size > 0) {
+		raw_tap_reset = 1;
+		__sync_synchronize();	// the sound thread sees the reset before the size
+		raw_tap_size = size;
+	}
+	return PyInt_FromLong(raw_tap_size);
+}
+
+static PyObject * get_raw_tap(PyObject * self, PyObject * args)	// Called by the GUI thread
+{	// Return (samples, gaps).  The samples are bytes of complex doubles, and gaps is the total
+	// number of blocks discarded because the ring was full.  If gaps changed, samples were lost after these samples.
+	int r, w, n, size;
+	char * pt;
+	PyObject * data;
+
+	if (!PyArg_ParseTuple (args, ""))
+		return NULL;
+	size = raw_tap_size;
+	if ( ! size || raw_tap_reset)		// the tap is off, or the ring is not yet empty
+		return Py_BuildValue("Ni", PyBytes_FromStringAndSize(NULL, 0), raw_tap_gaps);
+	__sync_synchronize();	// read raw_tap_write after the reset is done
+	r = raw_tap_read;
+	w = raw_tap_write;
+	__sync_synchronize();	// read the samples after raw_tap_write
+	n = w - r;
+	if (n < 0)
+		n += size;
+	data = PyBytes_FromStringAndSize(NULL, sizeof(complex double) * n);
+	if ( ! data)
+		return NULL;
+	pt = PyBytes_AS_STRING(data);
+	if (w >= r) {
+		memcpy(pt, raw_tap_buf + r, sizeof(complex double) * n);
+	}
+	else {
+		memcpy(pt, raw_tap_buf + r, sizeof(complex double) * (size - r));
+		memcpy(pt + sizeof(complex double) * (size - r), raw_tap_buf, sizeof(complex double) * w);
+	}
+	raw_tap_drop = 0;
+	__sync_synchronize();	// copy the samples before the sound thread may write over them
+	raw_tap_read = w;
+	return Py_BuildValue("Ni", data, raw_tap_gaps);
+}
+
 static PyObject * get_graph(PyObject * self, PyObject * args)	// Called by the GUI thread
 {
 	int i, j, k, m, n, index, ffts, ii, mm, m0, deltam;
@@ -4226,6 +4347,8 @@ static PyMethodDef QuiskMethods[] = {
 	{"is_key_down", is_key_down, METH_VARARGS, "Check whether the key is down; return 0 or 1."},
 	{"get_state", get_state, METH_VARARGS, "Return a count of read and write errors."},
 	{"get_graph", get_graph, METH_VARARGS, "Return a tuple of graph data."},
+	{"set_raw_tap", set_raw_tap, METH_VARARGS, "Turn the raw sample tap on or off."},
+	{"get_raw_tap", get_raw_tap, METH_VARARGS, "Return the raw samples captured since the last call."},
 	{"set_multirx_mode", set_multirx_mode, METH_VARARGS, "Select demodulation mode for sub-receivers."},
 	{"set_multirx_freq", set_multirx_freq, METH_VARARGS, "Select how to play audio from sub-receivers."},
 	{"set_multirx_play_method", set_multirx_play_method, METH_VARARGS, "Select how to play audio from sub-receivers."},
@@ -204,6 +204,7 @@ typedef int  (* ty_sample_read)(complex double *);
 void quisk_open_sound(void);
 void quisk_close_sound(void);
 int quisk_process_samples(complex double *, int);
+void quisk_raw_tap(complex double *, int);
 void quisk_play_samples(double *, int);
 void quisk_play_zeros(int);
 void quisk_start_sound(void);
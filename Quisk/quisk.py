@@ -33,7 +33,7 @@ except ImportError:
 import _quisk as QS
 from types import *
 from quisk_widgets import *
-from filters import Filters
+import filter_design
 import dxcluster
 import configure
 
@@ -2227,13 +2227,12 @@ class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.
         self.stationList.append((mem_f, conf.Xsym_stat_mem, '', mem_mode, ''))
     #add dx spots
     if application.dxCluster:
-      for entry in application.dxCluster.dxSpots:
-        if freq1 < entry.getFreq() < freq2:
-          for i in range (0, entry.getLen()):
-            descr = entry.getSpotter(i) + '\t' + entry.getTime(i) + '\t' + entry.getLocation(i) + '\n' + entry.getComment(i)
-            if i < entry.getLen()-1:
-              descr += '\n'
-          self.stationList.append((entry.freq, conf.Xsym_stat_dx, entry.dx, '', descr))           
+      for entry in application.dxCluster.dxSpots.getRange(freq1, freq2):
+        for i in range (0, entry.getLen()):
+          descr = entry.getSpotter(i) + '\t' + entry.getTime(i) + '\t' + entry.getLocation(i) + '\n' + entry.getComment(i)
+          if i < entry.getLen()-1:
+            descr += '\n'
+        self.stationList.append((entry.freq, conf.Xsym_stat_dx, entry.dx, '', descr))           
     # draw stations on graph
     self.stationList.sort(cmp=None, key=None, reverse=False)
     lastX = []
@@ -4619,55 +4618,7 @@ The new code supports multiple corrections per band.""")
   def MakeFilterCoef(self, rate, N, bw, center):
     """Make an I/Q filter with rectangular passband."""
     center = abs(center)
-    lowpass = bw * 24000 // rate // 2
-    if lowpass in Filters:
-      filtD = Filters[lowpass]
-      #print ("Custom filter key %d rate %d bandwidth %d size %d" % (lowpass, rate, bw, len(filtD)))
-    else:
-      #print ("Window filter key %d rate %d bandwidth %d" % (lowpass, rate, bw))
-      if N is None:
-        shape = 1.5       # Shape factor at 88 dB
-        trans = (bw / 2.0 / rate) * (shape - 1.0)     # 88 dB atten
-        N = int(4.0 / trans)
-        if N > 1000:
-          N = 1000
-        N = (N // 2) * 2 + 1
-      K = bw * N // rate
-      filtD = []
-      pi = math.pi
-      sin = math.sin
-      cos = math.cos
-      for k in range(-N//2, N//2 + 1):
-        # Make a lowpass filter
-        if k == 0:
-          z = float(K) / N
-        else:
-          z = 1.0 / N * sin(pi * k * K / N) / sin(pi * k / N)
-        # Apply a windowing function
-        if 1:	# Blackman window
-          w = 0.42 + 0.5 * cos(2. * pi * k / N) + 0.08 * cos(4. * pi * k / N)
-        elif 0:	# Hamming
-          w = 0.54 + 0.46 * cos(2. * pi * k / N)
-        elif 0:	# Hanning
-          w = 0.5 + 0.5 * cos(2. * pi * k / N)
-        else:
-          w = 1
-        z *= w
-        filtD.append(z)
-    if center:
-      # Make a bandpass filter by tuning the low pass filter to new center frequency.
-      # Make two quadrature filters.
-      filtI = []
-      filtQ = []
-      tune = -1j * 2.0 * math.pi * center / rate;
-      NN = len(filtD)
-      D = (NN - 1.0) / 2.0;
-      for i in range(NN):
-        z = 2.0 * cmath.exp(tune * (i - D)) * filtD[i]
-        filtI.append(z.real)
-        filtQ.append(z.imag)
-      return filtI, filtQ
-    return filtD, filtD
+    return filter_design.makeFilterCoef(rate, N, bw, center, conf.filter_window)
   def SetFilterByMode(self, mode):
     index = self.modeFilter[mode]
     try:
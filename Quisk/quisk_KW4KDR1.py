@@ -35,8 +35,7 @@ if sys.path[0] != "'.'":		# Make sure the current working directory is on path
 import wxversion				# Thanks to Mario, DH5YM
 wxversion.ensureMinimal('2.8')
 import wx, wx.html, wx.lib.buttons, wx.lib.stattext, wx.lib.colourdb, wx.grid, wx.richtext
-import math, cmath, time, traceback, string
-from datetime import datetime
+import math, cmath, time, traceback, string, bisect, collections, array
 import threading, pickle, webbrowser
 # from datetime import datetime, timedelta
 #import calendar
@@ -48,8 +47,12 @@ else:				# Python version 2.x
 import _quisk as QS
 from types import *
 from quisk_widgets import *
-from filters import Filters
+import filter_design
 import dxcluster
+import spotjournal
+import spotfilter
+import quisk_render
+import skimmer
 import configure
 REVDATE = "20190911"
 DEBUGSHELL = False
@@ -699,15 +702,31 @@ class ConfigStatus(wx.ScrolledWindow):
     self.MakeRow2("Sample interrupts", self.interupts, cfile)
     self.MakeRow2("Microphone level dB", level, application.config_text)
     self.MakeRow2("FFT number of points", self.fft_size, err_msg)
-    if conf.dxClHost:		# connection to dx cluster
+    if application.dxCluster:		# connection to dx cluster
       nSpots = len(application.dxCluster.dxSpots)
       if nSpots > 0:
         msg = str(nSpots) + ' DX spot' + ('' if nSpots==1 else 's') + ' received from ' + application.dxCluster.getHost()
       else:
-        msg = "No DX Cluster data from %s" % conf.dxClHost
+        msg = "No DX Cluster data from %s" % application.dxCluster.getHost()
       self.MakeRow2("FFT number of errors", self.fft_error, msg)
+      notifier = application.dxCluster.notifier
+      msg = "%d spots received, %d screen updates" % (notifier.received, notifier.posted)
+      self.MakeRow2("DX spot updates", notifier.posted, msg)
+      for feed in application.dxCluster.feeds:
+        msg = "%s %s, %d connects, %d lines, %d errors %s" % (feed.getHost(), feed.state,
+            feed.connects, feed.lines, feed.errors, feed.last_error)
+        self.MakeRow2("DX spots", feed.spots, msg)
+      spotFilter = application.dxCluster.spotFilter
+      if spotFilter:
+        msg = "%d spots filtered, %d kept" % (spotFilter.checked, spotFilter.passed)
+        self.MakeRow2("DX spots kept", spotFilter.passed, msg)
+        for rule, hits in spotFilter.getCounts():
+          self.MakeRow2("DX spots rejected", hits, "Filter:  " + rule)
     else:
       self.MakeRow2("FFT number of errors", self.fft_error)
+    acquired, frames, paints, dropped = application.render.Rates(time.time())
+    msg = "FFT rows %.1f, frames %.1f, window paints %.1f, rows dropped %.1f per second" % (acquired, frames, paints, dropped)
+    self.MakeRow2("Graph frames per second", "%.1f" % frames, msg)
     self.mem_y += self.dy
     if not self.tabstops2:
       return
@@ -1004,15 +1023,87 @@ class ConfigSound(wx.ScrolledWindow):
           self.y += self.dy
 
 
+class RBNTable(wx.grid.PyGridTableBase):
+  """Virtual table for the RBNList grid.
+
+  There is one row for each DX station showing its newest report.  Rows are kept sorted
+  on the selected column, so a new spot is a bisect and an insert.  Each row is a list
+  [DE, DX, frequency Hertz, comment, time text, time in seconds since the epoch]."""
+  col_labels = ('DE', 'DX', 'FREQ (MHZ)', 'Mode / SNR / WPM', 'Time')
+  def __init__(self):
+    wx.grid.PyGridTableBase.__init__(self)
+    self.rows = []		# the rows in sorted order
+    self.keys = []		# the sort key for each row
+    self.rowForDX = {}		# the row for each DX call sign
+    self.sortcol = 2		# default sort = 'freq'
+    self.grid_rows = 0		# the number of rows last reported to the grid
+    self.dirty = None		# the first row index changed since the grid was refreshed
+  def GetNumberRows(self):
+    return len(self.rows)
+  def GetNumberCols(self):
+    return len(self.col_labels)
+  def GetColLabelValue(self, col):
+    return self.col_labels[col]
+  def IsEmptyCell(self, row, col):
+    return False
+  def GetValue(self, row, col):
+    try:
+      r = self.rows[row]
+    except IndexError:
+      return ''
+    if col == 2:
+      return self.FormatFloat(r[2] * 1E-6)
+    return r[col]
+  def SetValue(self, row, col, value):
+    pass
+  def FormatFloat(self, freq):
+    freq = "%.6f" % freq
+    for i in range(3):
+      if freq[-1] == '0':
+        freq = freq[:-1]
+      else:
+        break
+    return freq
+  def SortKey(self, row):		# The DX call is unique and makes every key unique
+    if self.sortcol == 1:	# DX
+      return (row[1], )
+    elif self.sortcol == 4:	# Time, newest first
+      return (-row[5], row[1])
+    return (row[2], row[1])	# Freq
+  def Changed(self, index):
+    if self.dirty is None or index < self.dirty:
+      self.dirty = index
+  def Insert(self, row):
+    key = self.SortKey(row)
+    i = bisect.bisect_right(self.keys, key)
+    self.keys.insert(i, key)
+    self.rows.insert(i, row)
+    self.rowForDX[row[1]] = row
+    self.Changed(i)
+  def Remove(self, row):
+    i = bisect.bisect_left(self.keys, self.SortKey(row))
+    del self.keys[i]
+    del self.rows[i]
+    del self.rowForDX[row[1]]
+    self.Changed(i)
+  def Sort(self, col):
+    self.sortcol = col
+    self.rows.sort(key=self.SortKey)
+    self.keys = [self.SortKey(r) for r in self.rows]
+    self.Changed(0)
+  def Expire(self, limit):		# Remove rows with a time before limit
+    for row in [r for r in self.rows if r[5] < limit]:
+      self.Remove(row)
+
 class RBNList(wx.grid.Grid): #Grid view of Reverse Beacon Network Reports
   def __init__(self, parent, width):
     wx.grid.Grid.__init__(self, parent)
-    self.RowCnt = -1
     self.slctdrow = 0
-    self.slctdcol = 2 #default sort = 'freq'
     #self.fixSize = False
     self.doResize = False
     self.dbl_clk_delay = 600
+    self.expire_time = 0
+    self.serials = {}		# the last change serial read from each DxSpotStore
     self.timer1 = wx.Timer(self)
     font = wx.Font(8, wx.FONTFAMILY_SWISS, wx.NORMAL,
           wx.FONTWEIGHT_BOLD, face=conf.quisk_typeface) #conf.favorites_font_size
@@ -1028,24 +1119,16 @@ class RBNList(wx.grid.Grid): #Grid view of Reverse Beacon Network Reports
     self.Bind(wx.grid.EVT_GRID_LABEL_LEFT_CLICK, self.OnLeftClickLabel)
     self.Bind(wx.EVT_SIZE, self.OnSize)
     self.Bind(wx.EVT_IDLE, self.OnIdle)
-    self.CreateGrid(0, 5)
+    self.table = RBNTable()
+    self.SetTable(self.table, True)
     self.EnableDragRowSize(False)
     self.SetSelectionMode(wx.grid.Grid.SelectRows)
 #    self.SetTabBehaviour(wx.grid.Grid.Tab_Stop)
-#    self.SetSortingColumn(2, ascending=True)
     w = self.GetTextExtent(' 999 ')[0]
     self.SetRowLabelSize(w)
-    self.SetColLabelValue(0,  'DE')
-    self.SetColLabelValue(1,  'DX')
-    self.SetColLabelValue(2,  'FREQ (MHZ)')	# This column has a choice editor
-    self.SetColLabelValue(3,  'Mode / SNR / WPM')
-    self.SetColLabelValue(4,  'Time')
-    #self.SetColLabelValue(5,  'Tone Hz')
-    #self.SetLabelTextColour( wx.RED)
-    
     my_col_property_settings = wx.grid.GridCellAttr()
     my_col_property_settings.SetTextColour(wx.RED)
-    self.SetColAttr(2, my_col_property_settings)
+    self.SetColAttr(self.table.sortcol, my_col_property_settings)
     w = self.GetTextExtent("xFrequencyx")[0]
     self.SetColSize(0, w-15) #DE
     self.SetColSize(1, w-15) #DX
@@ -1056,29 +1139,6 @@ class RBNList(wx.grid.Grid): #Grid view of Reverse Beacon Network Reports
     self.SetColSize(3, ww+70) #Comment
     self.SetColSize(4, w)  #Time
 
-#    wx.grid.PyGridTableBase.__init__(self)
-    self.data = []
-    self.colnames = []
-    self.plugins = {}
-    # we need to store the row length and column length to
-    # see if the table has changed size
-    self._rows = self.GetNumberRows()
-    self._cols = 5 #self.GetNumberCols()
-    for i in range(self._cols):
-      self.colnames.append(self.GetColLabelValue(i))
-      
-  def GetNumberCols(self):
-    return len(self.colnames)
-
-  def GetNumberRows(self):
-    rowcnt = len(self.data) 
-    if len(self.data) >25:
-      rowcnt = 25
-    return rowcnt
-
-  def SetValue(self, row, col, value):
-    self.data[row][1][self.GetColLabelValue(col)] = value
-
   def start_timer(self):
     self.timer1.Start(self.dbl_clk_delay)  
   
@@ -1148,178 +1208,70 @@ class RBNList(wx.grid.Grid): #Grid view of Reverse Beacon Network Reports
     pass
 
   def OnLeftClickLabel(self, event):
-    
     col =event.GetCol()
-    if (col != self.slctdcol) and (col !=0) and (col !=3):
-      #print(col, self.slctdcol) # for testing only
+    if col not in (1, 2, 4):	# Sort on DX, Freq or Time
+      return
+    if col != self.table.sortcol:
       my_col_property_settingsR = wx.grid.GridCellAttr()
       my_col_property_settingsB = wx.grid.GridCellAttr()
       my_col_property_settingsR.SetTextColour(wx.RED)
       my_col_property_settingsB.SetTextColour(wx.BLACK)
       self.SetColAttr(col, my_col_property_settingsR)
-      #my_col_property_settings.SetTextColour(wx.BLACK)
-      self.SetColAttr(self.slctdcol, my_col_property_settingsB)
-    if col == 1:
-      self.slctdcol = col
-    if col == 2:
-      self.slctdcol = col
-    if col == 4:
-      self.slctdcol = col   
-    self.SortColumn(self.slctdcol)
-    #pass
-
-  def FormatFloat(self, freq):
-    freq = "%.6f" % freq
-    for i in range(3):
-      if freq[-1] == '0':
-        freq = freq[:-1]
-      else:
-        break
-    return freq
-
-  def AddRow(self):
-    self.AppendRows()
-    self.RowCnt += 1
-    if self.RowCnt >0:
-      i = self.RowCnt
-      while i>0:
-        colcnt =5
-        for c in range(0, colcnt):
-          self.SetCellValue(i, c, self.GetCellValue(i-1, c))
-        i -=1  
-
-  def UpDtRow(self, row, i, entry):
-    self.SetCellValue(row, 0, entry.getSpotter(i).strip()) #DE
-    self.SetCellValue(row, 1, entry.getLocation(i).strip()) #DX entry.getLocation(i)
-    freq = entry.getFreq()  #fields[1]
-    try:
-      freq = float(freq)
-    except:
-      pass
-    if freq > 30000.0:    # Must be in Hertz
-      freq *= 1E-6
-    self.SetCellValue(row, 2, self.FormatFloat(freq).strip()) #FREQ getFreq()
-    self.SetCellValue(row, 3, entry.getComment(i).strip()) #Comment 
-    self.SetCellValue(row, 4, entry.getTime(i).strip()) #Time 
-  
-  def GetTimeStmp(self, i):
-    words = ""
-    try:
-      words = self.GetCellValue(i, 4).split()
-    except:
-      print('Bad Row Value:',i)
-    if len(words) > 0:
-      word = words[0]
-      #print(word, word[0:2], word[3:5])
-      word = word.strip('\07')
-      timeStamp = (float(word[0:2])*60*60)+(float(word[3:5])*60) # measured in seconds
-      #print(word, timeStamp, seconds, seconds-timeStamp)
-      return timeStamp
-    else:
-      return 0.0
+      self.SetColAttr(self.table.sortcol, my_col_property_settingsB)
+    self.table.Sort(col)
+    self.UpdateGrid()
 
-  def AddEntry(self, entry):
-    #print('AddEntry', self.RowCnt)
+  def ReadChanges(self, store):
+    # Add the spots that changed in the DxSpotStore since the last call
+    table = self.table
+    serial, changes = store.getChanges(self.serials.get(store, 0))
+    self.serials[store] = serial
+    if changes is None:		# changes were lost; read all spots
+      changes = [(dxcluster.SPOT_ADDED, entry) for entry in store]
+    now = time.time()
     #First, clean up current listing, by deleting expired entries
-    if self.RowCnt > -1:
-      offset=0
-      strnow=strftime("%H:%M:%S", gmtime())
-      #print(strnow)
-      #print(strnow[0:2], strnow[3:5])
-      seconds = (float(strnow[0:2])*60 +float(strnow[3:5]))*60
-      i = 0
-      while (i <(self.RowCnt+1-offset)):
-        timeStamp = self.GetTimeStmp(i-offset)
-        if (timeStamp==0.0):
-##          print("AddEntry1 row %d of: %d & offset: %d" %(i+1, self.RowCnt+1, offset))
-          deStn = self.GetCellValue(i-offset, 0).strip() #use if needed to aid debugging
-          dxStn = self.GetCellValue(i-offset, 1).strip() #use if needed to aid debugging
-          freq = self.GetCellValue(i-offset, 2).strip() #use if needed to aid debugging
-          time = self.GetCellValue(i-offset, 4).strip() #use if needed to aid debugging
-##          print("    DE: %s; DX: %s; Freq: %s; time: %s" %(deStn, dxStn, freq, time))
-        if (seconds-timeStamp > (conf.dxClExpireTime+8) * 60): # Allow entry to remain on grid listing 8 minutes longer than the station view
-          self.DeleteRows(i-offset)
-          offset += 1
-        else:
-          #Now make sure we did not cross over from one day to the next
-          if (seconds < timeStamp) and ((seconds+86400)-timeStamp > conf.dxClExpireTime * 60):
-            self.DeleteRows(i-offset)
-            offset += 1
-        i += 1    
-      self.RowCnt -= offset 
-    #Now add new entries , but Ignore entries in this listing that are currently registered
-    for i in range (0, entry.getLen()):
-      newEntry = True #assume that this spot is a new entry
-      update = False
-      #print('Check:', entry.getSpotter(i).strip(), entry.getLocation(i).strip())
-      dxStn = entry.getLocation(i).strip()
-      entryTime = entry.getTime(i).strip()
-      #print("entryTime: %s" %entryTime)
-      if (entryTime == ""):
-        entryTime = strftime("%H:%M UTC", gmtime()) #01:12 UTC
-        entry.setTime(i, entryTime) 
-        print("    Fixed DX: %s EntryTime: %s" %(dxStn, entryTime))
-      for r in range(0, self.RowCnt+1): #loop through current grid entries
-        if self.GetCellValue(r, 1).strip() == dxStn:
-          newEntry = False   #this spot already is already listes listed
-          words = entry.getTime(i).strip().split()
-          if not(words == None):#make sure we've got something to work with
-            try:
-              word = words[0]
-              #print(word, word[0:2], word[3:5])
-              word = word.strip('\07')
-              timeStamp = (float(word[0:2])*60*60)+(float(word[3:5])*60) # measured in seconds
-              LstRptTime = self.GetTimeStmp(r)
-##              if(timeStamp==0.0): print("AddEntry2 row %d of: %d" %(r, self.RowCnt+1))
-              fix =""
-              if LstRptTime < timeStamp: # simple time test
-                fix ="+"
-                update = True
-              elif (timeStamp < 3600) and (LstRptTime > 82800): #new day compare
-                fix ="+"
-                update = True
-              #print(dxStn, word, timeStamp, LstRptTime, fix)
-              if update:
-                self.UpDtRow(r, i, entry)
-              break #found match, so don't need to look anymore
-            except:
-              print("Line-1223 IndexError: list index out of range")
-              print("Entry row %d of: %d; Station: %s; Time: %s" %(1, entry.getLen(), dxStn, entry.getTime(i)))
-      if newEntry:
-        #print('New')
-        self.AddRow()
-        self.UpDtRow(0, i, entry)
-      if newEntry or update:  
-        self.SortColumn(self.slctdcol)
-
+    if now - self.expire_time > 10.0:
+      self.expire_time = now
+      table.Expire(now - (conf.dxClExpireTime + 8) * 60) # Allow entry to remain on grid listing 8 minutes longer than the station view
+    for kind, entry in changes:
+      if kind != dxcluster.SPOT_EXPIRED:	# the grid expires its own rows
+        self.AddEntry(entry, now)
+    self.UpdateGrid()
 
+  def AddEntry(self, entry, now):
+    # Show the newest report for the DX station, but ignore reports older than the current row
+    table = self.table
+    dxStn = entry.getDX()
+    timeStamp = entry.getEpoch(0)	# spots without a time have the time they were received
+    old = table.rowForDX.get(dxStn)
+    if old is not None:
+      if timeStamp <= old[5]:
+        return
+      table.Remove(old)
+    table.Insert([entry.getSpotter(0).strip(), dxStn, entry.getFreq(),
+        entry.getComment(0), entry.getTime(0), timeStamp])
 
-  def SortColumn(self, col):
-    """
-    col -> sort the data based on the column indexed by col
-    """
-    #print('Start Sort')
-    name = self.colnames[col]
-    _data = []
-
-    #for row in self.data:
-    # rowname, entry = row
-    #  _data.append((entry.get(name, None), row))
-    for i in range(0, self.RowCnt+1):
-      _data.append((self.GetCellValue(i, 0), self.GetCellValue(i, 1),self.GetCellValue(i, 2), self.GetCellValue(i, 3), self.GetCellValue(i, 4))) 
-
-    if col ==2: #Freq
-      _data.sort(key=lambda x: float(x[col]))
-    elif col ==4: #Time
-      _data.sort(key=lambda x: datetime.strptime(x[col][0:5], "%H:%M"), reverse=True)
-    elif col ==1: #DX 
-      _data.sort(key=lambda x: x[col])  
-    self.data = []
-    for x in range(self.RowCnt+1):
-      #print(x, _data[x])
-      for y in range(5):
-        self.SetCellValue(x, y, str(_data[x][y]) )
-    #print('End Sort')
+  def UpdateGrid(self):
+    # Tell the grid about added or deleted rows, and repaint only the visible rows that changed
+    table = self.table
+    nrows = table.GetNumberRows()
+    if nrows > table.grid_rows:
+      msg = wx.grid.GridTableMessage(table, wx.grid.GRIDTABLE_NOTIFY_ROWS_APPENDED, nrows - table.grid_rows)
+      self.ProcessTableMessage(msg)
+    elif nrows < table.grid_rows:
+      msg = wx.grid.GridTableMessage(table, wx.grid.GRIDTABLE_NOTIFY_ROWS_DELETED, nrows, table.grid_rows - nrows)
+      self.ProcessTableMessage(msg)
+    table.grid_rows = nrows
+    if table.dirty is None:
+      return
+    win = self.GetGridWindow()
+    w, h = win.GetClientSizeTuple()
+    x, top = self.CalcUnscrolledPosition(0, 0)
+    y = table.dirty * self.GetDefaultRowSize() - top
+    table.dirty = None
+    if y < h:
+      y = max(y, 0)
+      win.RefreshRect(wx.Rect(0, y, w, h - y), False)
 
 
 
@@ -1424,6 +1376,7 @@ class ConfigFavorites(wx.grid.Grid):
         if col <= 5:
           self.SetCellValue(row, col, fields[col].strip())
     self.MakeRepeaterDict()
+    self.MakeStations()
   def WriteOut(self):
     ncols = self.GetNumberCols()
     if ncols != 6:
@@ -1534,8 +1487,21 @@ class ConfigFavorites(wx.grid.Grid):
         freq = int(freq * 1E6 + 0.5)	# frequency in Hertz
         freq = (freq + 500) / 1000		# frequency in units of 1 kHz
         self.RepeaterDict[freq * 1000] = (offset, tone)
+  def MakeStations(self):	# Make the list of favorites for the station screen
+    self.stations = []
+    for row in range(self.GetNumberRows()):
+      freq = self.GetCellValue(row, 1)
+      if freq:
+        try:
+          freq = str2freq(freq)
+        except ValueError:
+          continue
+        self.stations.append((freq, conf.Xsym_stat_fav, self.GetCellValue(row, 0),
+            self.GetCellValue(row, 2), self.GetCellValue(row, 3)))
+    application.stationIndex = None
   def OnChange(self, event=None):
     self.MakeRepeaterDict()
+    self.MakeStations()
     self.changed = True
     if self.timer.IsRunning():
       self.timer.Stop()
@@ -1684,6 +1650,59 @@ class FilterDisplay():
 
 
 ### JMH 20190803 new code taken from quisk-4.1.41    
+class VisibilityTracker:
+  """Keep track of which windows can be seen, so that hidden windows are not drawn.
+
+  A window is visible if it and its parents are shown and its top level frame is not minimized.
+  The answer is kept for max_age seconds because it is needed for every FFT row."""
+  def __init__(self, max_age=0.25):
+    self.max_age = max_age
+    self.cache = {}
+  def AddFrame(self, frame):
+    frame.Bind(wx.EVT_ICONIZE, self.OnChange)
+  def OnChange(self, event=None):
+    self.cache.clear()
+    if event:
+      event.Skip()
+  def IsVisible(self, window):
+    now = time.time()
+    try:
+      t, visible = self.cache[id(window)]
+    except KeyError:
+      pass
+    else:
+      if now - t < self.max_age:
+        return visible
+    visible = window.IsShownOnScreen() and not wx.GetTopLevelParent(window).IsIconized()
+    self.cache[id(window)] = (now, visible)
+    return visible
+
+class StaticLayer:
+  """A bitmap of the parts of a window that do not change with the FFT data.
+
+  Paint() draws the layer again only when the key changes, and otherwise copies the bitmap.
+  The key must contain everything the draw function uses, such as the VFO, zoom and size."""
+  def __init__(self):
+    self.key = None
+    self.size = (0, 0)
+    self.bitmap = None
+    self.dc = None
+    self.draws = 0		# number of times the layer was drawn
+  def Paint(self, dc, key, size, draw, brush):
+    width, height = size
+    if key != self.key:
+      if self.size != (width, height):
+        self.size = (width, height)
+        self.bitmap = wx.EmptyBitmap(max(1, width), max(1, height))
+        self.dc = wx.MemoryDC()
+        self.dc.SelectObject(self.bitmap)
+      self.dc.SetBackground(brush)
+      self.dc.Clear()
+      draw(self.dc)
+      self.key = key
+      self.draws += 1
+    dc.Blit(0, 0, width, height, self.dc, 0, 0)
+
 class GraphDisplay(wx.Window):
   """Display the FFT graph within the graph screen."""
   def __init__(self, parent, x, y, graph_width, height, chary):
@@ -1695,7 +1714,8 @@ class GraphDisplay(wx.Window):
     self.chary = chary
     self.graph_width = graph_width
     self.display_text = ""
-    self.line = [(0, 0), (1,1)]		# initial fake graph data
+    self.trace = quisk_render.SpectrumTrace(conf.graph_average_mode)
+    self.line = self.trace.line		# initial fake graph data
     self.SetBackgroundColour(conf.color_graph)
     self.Bind(wx.EVT_PAINT, self.OnPaint)
     self.Bind(wx.EVT_LEFT_DOWN, parent.OnLeftDown)
@@ -1731,6 +1751,7 @@ class GraphDisplay(wx.Window):
       self.SetFocus()	# Set focus so we get mouse wheel events
   def OnPaint(self, event):
     #print 'GraphDisplay', self.GetUpdateRegion().GetBox()
+    t0 = time.time()
     dc = wx.AutoBufferedPaintDC(self)
     dc.Clear()
     # Draw the tuning line and filter display to the screen.
@@ -1748,6 +1769,8 @@ class GraphDisplay(wx.Window):
       dc.SetTextForeground(conf.color_graph_msg_fg)
       dc.SetBackgroundMode(wx.SOLID)
       dc.DrawText(self.display_text, 0, 0)
+    del dc		# copy the buffer to the screen before timing
+    application.render.Painted(time.time() - t0)
   def DrawFilter(self, dc):
     dc.SetPen(wx.TRANSPARENT_PEN)
     dc.SetLogicalFunction(wx.COPY)
@@ -1770,21 +1793,21 @@ class GraphDisplay(wx.Window):
     self.height = height
     self.SetSize((self.graph_width, height))
   def OnGraphData(self, data):
-    x = 0
-    for y in data:	# y is in dB, -130 to 0
-      if(math.isnan(y)):
-        print(y)
-        return
-      y = self.zeroDB - int(y * self.scale / 10.0 + 0.5)
-      try:
-        y0 = self.line[x][1]
-      except IndexError:
-        self.line.append([x, y])
-      else:
-        if y > y0:
-          y = min(y, y0 + self.peak_hold)
-        self.line[x] = [x, y]
-      x = x + 1
+    if not application.visibility.IsVisible(self):
+      return
+    # data is in dB, -130 to 0; the line is updated in place with peak hold or averaging
+    if application.rasterizer:
+      trace = self.trace
+      application.raster_targets[id(self)] = self
+      application.rasterizer.Submit('G', id(self), data, (trace.mode, trace.hold, trace.alpha, self.zeroDB, self.scale))
+      return
+    line = self.trace.Update(data, self.zeroDB, self.scale)
+    if line is None:		# data has a NaN
+      return
+    self.line = line
+    self.Refresh()
+  def OnRaster(self, row, extra):	# The rasterizer made the y values of the line
+    self.line = self.trace.SetY(row)
     self.Refresh()
   def SetTuningLine(self, tune_tx, tune_rx):
     dc = wx.ClientDC(self)
@@ -1840,6 +1863,7 @@ class GraphScreen(wx.Window):
     self.font = wx.Font(conf.graph_font_size, wx.FONTFAMILY_SWISS, wx.NORMAL,
           wx.FONTWEIGHT_NORMAL, False, conf.quisk_typeface)
     self.SetFont(self.font)
+    self.layer = StaticLayer()	# the axis, ticks, labels and band plan
     w = self.GetCharWidth() * 14 // 10
     h = self.GetCharHeight()
     self.charx = w
@@ -1879,8 +1903,12 @@ class GraphScreen(wx.Window):
     self.display.Refresh()
   def OnPaint(self, event):
     dc = wx.PaintDC(self)
-    dc.SetBackground(self.backgroundBrush)
-    dc.Clear()
+    size = self.GetClientSize()
+    # The display is in the key because MultiRxGraph draws Y ticks only for its graph
+    key = (self.VFO, self.zoom, self.zoom_deltaf, self.sample_rate, tuple(size), self.chary,
+        self.originY, self.zeroDB, self.scale, id(self.display))
+    self.layer.Paint(dc, key, size, self.DrawLayer, self.backgroundBrush)
+  def DrawLayer(self, dc):
     dc.SetFont(self.font)
     dc.SetTextForeground(conf.color_graphlabels)
     if self.in_splitter:
@@ -2259,14 +2287,18 @@ class GraphScreen(wx.Window):
   def ChangeHwFrequency(self, tune, vfo, source='', band='', event=None):
     application.ChangeHwFrequency(tune, vfo, source, band, event)
   def PeakHold(self, name):
+    alpha = 1.0		# weight of new data for graph_average_mode 'average'
     if name == 'GraphP1':
       self.display.peak_hold = int(self.display.scale * conf.graph_peak_hold_1)
+      alpha = min(alpha, conf.graph_peak_hold_1)
     elif name == 'GraphP2':
       self.display.peak_hold = int(self.display.scale * conf.graph_peak_hold_2)
+      alpha = min(alpha, conf.graph_peak_hold_2)
     else:
       self.display.peak_hold = 9999
     if self.display.peak_hold < 1:
       self.display.peak_hold = 1
+    self.display.trace.SetHold(self.display.peak_hold, alpha)
     
 
 class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.  Many Thanks!!
@@ -2276,13 +2308,21 @@ class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.
     self.lines = lines
     self.mouse_x = 0
     self.stationList = []
+    self.dxStations = {}	# for each DxSpotStore: (change serial, (freq1, freq2), {entry: station}, generation)
+    self.layout = []		# the stations as drawn: (x, y, text_x, text_y, text)
+    self.layout_key = None	# the layout is made again when this changes
+    self.stationXs = []		# the x position of each station in stationList, in order
+    self.popupKey = None		# the stations shown in the station info popup
     graph = self.graph = application.graph
     height = lines * (graph.GetCharHeight() + self.lineMargin)	# The height may be zero
     wx.Window.__init__(self, parent, size=(graph.width, height), style = wx.NO_BORDER)
     self.font = wx.Font(conf.graph_font_size, wx.FONTFAMILY_SWISS, wx.NORMAL,
           wx.FONTWEIGHT_NORMAL, face=conf.quisk_typeface)
     self.SetFont(self.font)
+    self.extents = quisk_render.getTextExtents(self.font.GetNativeFontInfoDesc())
     self.SetBackgroundColour(conf.color_graph)
+    self.backgroundBrush = wx.Brush(conf.color_graph)
+    self.layer = StaticLayer()	# the lines between the rows of stations
     self.width = application.screen_width
     self.Bind(wx.EVT_PAINT, self.OnPaint)
     if lines:
@@ -2304,75 +2344,105 @@ class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.
     dc = wx.PaintDC(self)
     if not self.lines:
       return
-    dc.SetFont(self.font)
     graph = self.graph
+    hl = self.GetCharHeight()
+    size = self.GetClientSize()
+    key = (tuple(size), graph.originX, graph.graph_width, hl)
+    self.layer.Paint(dc, key, size, self.DrawLayer, self.backgroundBrush)
+    dc.SetFont(self.font)
     dc.SetTextForeground(conf.color_graphlabels)
     dc.SetPen(graph.pen_tick)
-    originX = graph.originX
-    originY = graph.originY
-    endX = originX + graph.graph_width    # end of fft data
     sample_rate = int(graph.sample_rate * graph.zoom)
     VFO = graph.VFO + graph.zoom_deltaf
-    hl = self.GetCharHeight()
-    y = 0
-    for i in range (self.lines):
-      dc.DrawLine(originX, y, endX, y)
-      y += hl + self.lineMargin
-    # create a sorted list of favorites in the frequency range  
     freq1 = VFO - sample_rate // 2
     freq2 = VFO + sample_rate // 2
-    self.stationList = []
-    fav = application.config_screen.favorites
-    for row in range (fav.GetNumberRows()):
-      fav_f = fav.GetCellValue(row, 1) 
-      if fav_f:
-        try:
-          fav_f = str2freq(fav_f)
-          if freq1 < fav_f < freq2:
-            self.stationList.append((fav_f, conf.Xsym_stat_fav, fav.GetCellValue(row, 0),
-                fav.GetCellValue(row, 2), fav.GetCellValue(row, 3)))
-        except ValueError:
-          pass            
-    # add memory stations
-    for mem_f, mem_band, mem_vfo, mem_txfreq, mem_mode in application.memoryState:
-      if freq1 < mem_f < freq2:
-        self.stationList.append((mem_f, conf.Xsym_stat_mem, '', mem_mode, ''))
-    #add dx spots
+    freqs, stations = application.GetStationIndex()
+    key = [graph.x0, graph.data_width, VFO, sample_rate, hl, application.stationGeneration]
+    #add dx spots; the key changes only when a DX station in the span changes
     if application.dxCluster:
-      self.RefreshDxStationList(application.dxCluster, freq1, freq2)
-    if application.dxCluster2:
-      self.RefreshDxStationList(application.dxCluster2, freq1, freq2)
-    # draw stations on graph
-    self.stationList.sort(cmp=None, key=None, reverse=False)
+      key.append(self.RefreshDxStationList(application.dxCluster, freq1, freq2))
+    if key != self.layout_key:
+      self.layout_key = key
+      # the favorites and memories in the frequency range, then the DX stations
+      self.stationList = stations[bisect.bisect_right(freqs, freq1):bisect.bisect_left(freqs, freq2)]
+      for serial, span, dx_stations, generation in self.dxStations.values():
+        self.stationList.extend(dx_stations.values())
+      self.stationList.sort()
+      self.MakeLayout(dc, VFO, sample_rate, hl)
+    for x, y, text_x, text_y, text in self.layout:
+      dc.DrawLine(x, y, x, y + 4)
+      dc.DrawText(text, text_x, text_y)
+  def MakeLayout(self, dc, VFO, sample_rate, hl):	# Place the station names on the lines
+    graph = self.graph
+    extents = self.extents
+    measure = dc.GetPartialTextExtents
+    dots = extents.Width('..', measure)
+    self.stationXs = [graph.x0 + int(float(station[0] - VFO) / sample_rate * graph.data_width)
+        for station in self.stationList]
+    self.layout = []
     lastX = []
     line = 0
     for i in range (0, self.lines):
       lastX.append(graph.width)
     for statFreq, symbol, statName, statMode, statDscr in reversed (self.stationList):
-      ws = dc.GetTextExtent(symbol)[0]
+      ws = extents.Width(symbol, measure)
       statX = graph.x0 + int(float(statFreq - VFO) / sample_rate * graph.data_width)
-      w, h = dc.GetTextExtent(statName)
       # shorten name until it fits into remaining space
-      maxLen = 25
-      tName = statName 
-      while (w > lastX[line] - statX - ws - 4) and maxLen > 0:
-        maxLen -= 1
-        tName = statName[:maxLen] + '..'
-        w, h = dc.GetTextExtent(tName)
-      dc.DrawLine(statX, line * (hl+self.lineMargin), statX, line * (hl+self.lineMargin) + 4)                    
-      dc.DrawText(symbol + ' ' + tName, statX - ws//2, line * (hl+self.lineMargin) + self.lineMargin//2+1)
+      tName = quisk_render.truncateText(statName, extents.Partial(statName, measure), lastX[line] - statX - ws - 4, dots)
+      y = line * (hl+self.lineMargin)
+      self.layout.append((statX, y, statX - ws//2, y + self.lineMargin//2+1, symbol + ' ' + tName))
       lastX[line] = statX
       line = (line+1)%self.lines
+  def DrawLayer(self, dc):
+    graph = self.graph
+    dc.SetPen(graph.pen_tick)
+    originX = graph.originX
+    endX = originX + graph.graph_width    # end of fft data
+    hl = self.GetCharHeight()
+    y = 0
+    for i in range (self.lines):
+      dc.DrawLine(originX, y, endX, y)
+      y += hl + self.lineMargin
   #JMH 20190304 added to support dual telnet DX cluster links   
   def RefreshDxStationList(self, dxCluster, freq1, freq2):
-    for entry in dxCluster.dxSpots:
-      application.rbnlist.AddEntry(entry)
+    # Keep the DX stations in the span up to date using the store changes since the last paint.
+    # Return a generation that changes only when the DX stations in the span change.
+    store = dxCluster.dxSpots
+    serial, span, stations, generation = self.dxStations.get(store, (0, None, None, 0))
+    serial, changes = store.getChanges(serial)
+    if changes is None or span != (freq1, freq2):
+      stations = {}
+      for entry in store.getRange(freq1, freq2):
+        stations[entry] = self.MakeDxStation(entry)
+      generation += 1
+    else:
+      for kind, entry in changes:
+        if kind != dxcluster.SPOT_EXPIRED and freq1 < entry.getFreq() < freq2:
+          stations[entry] = self.MakeDxStation(entry)
+          generation += 1
+        elif stations.pop(entry, None) is not None:
+          generation += 1
+    self.dxStations[store] = (serial, (freq1, freq2), stations, generation)
+    return generation
+  def Shows(self, batch):	# Return True if a DxEntry in batch is or was within the displayed span
+    graph = self.graph
+    sample_rate = int(graph.sample_rate * graph.zoom)
+    VFO = graph.VFO + graph.zoom_deltaf
+    freq1 = VFO - sample_rate // 2
+    freq2 = VFO + sample_rate // 2
+    for entry in batch:
       if freq1 < entry.getFreq() < freq2:
-        for i in range (0, entry.getLen()):
-          descr = entry.getSpotter(i) + '\t' + entry.getTime(i) + '\t' + entry.getLocation(i) + '\n' + entry.getComment(i)
-          if i < entry.getLen()-1:
-            descr += '\n'
-        self.stationList.append((entry.freq, conf.Xsym_stat_dx, entry.dx, '', descr))
+        return True
+      for serial, span, stations, generation in self.dxStations.values():
+        if entry in stations:
+          return True
+    return False
+  def MakeDxStation(self, entry):
+    for i in range (0, entry.getLen()):
+      descr = entry.getSpotter(i) + '\t' + entry.getTime(i) + '\t' + entry.getLocation(i) + '\n' + entry.getComment(i)
+      if i < entry.getLen()-1:
+        descr += '\n'
+    return (entry.freq, conf.Xsym_stat_dx, entry.dx, '', descr)
     
   def OnLeftDown(self, event):
     if self.firstStationInRange != None:
@@ -2400,44 +2470,21 @@ class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.
     # show detailed station info
     if abs(self.lastStationX - mouse_x) > 30:
       self.firstStationInRange = None   
-    found = False
     graph = self.graph
-    sample_rate = int(graph.sample_rate * graph.zoom)
-    VFO = graph.VFO + graph.zoom_deltaf
     if abs(x) > 5: # ignore small mouse moves
-      for index in range (0, len(self.stationList)):
-        statFreq, symbol, statName, statMode, statDscr = self.stationList[index]
-        statX = graph.x0 + int(float(statFreq - VFO) / sample_rate * graph.data_width)
-        if abs(mouse_x-statX) < 10: 
-          self.lastStationX = mouse_x
-          if found == False:
-            self.firstStationInRange = index
-            self.nrStationInRange = 0
-            self.stationInfo.Clear()
-            found = True
-          self.nrStationInRange += 1
-          attr = self.stationInfo.GetBasicStyle()
-          attr.SetFlags(wx.TEXT_ATTR_TABS)
-          attr.SetTabs((40, 400, 700))
-          self.stationInfo.SetBasicStyle(attr)
-          self.stationInfo.BeginSymbolBullet(symbol, 0, 40) 
-          self.stationInfo.BeginBold()      
-          self.stationInfo.WriteText(statName + '\t')
-          self.stationInfo.EndBold()
-          self.stationInfo.WriteText (str(statFreq) + ' Hz\t' + statMode)
-          self.stationInfo.Newline()
-          self.stationInfo.EndSymbolBullet() 
-          self.stationInfo.BeginLeftIndent(40)
-          if len(statDscr) > 0:
-            self.stationInfo.WriteText(statDscr)
-            self.stationInfo.Newline()
-          self.stationInfo.EndLeftIndent()   
-          self.mouse_x = mouse_x   
+      # the stations within 10 pixels; stationXs is sorted because stationList is sorted by frequency
+      index1 = bisect.bisect_right(self.stationXs, mouse_x - 10)
+      index2 = bisect.bisect_left(self.stationXs, mouse_x + 10)
+      if index1 < index2:
+        self.lastStationX = mouse_x
+        self.firstStationInRange = index1
+        self.nrStationInRange = index2 - index1
+        self.mouse_x = mouse_x
+        stations = self.stationList[index1:index2]
+        if stations != self.popupKey:	# the popup is made again only if the stations changed
+          self.popupKey = stations
+          self.MakePopup(stations)
     if self.firstStationInRange != None:
-      line = self.stationInfo.GetVisibleLineForCaretPosition(self.stationInfo.GetCaretPosition()) 
-      cy = line.GetAbsolutePosition()[1]
-      self.stationWindow.SetClientSize((340, cy+2))
-      self.stationInfo.SetClientSize((340, cy+2))
       # convert coordinates to screen
       sx, sy = self.ClientToScreenXY(mouse_x, mouse_y) 
       w, h = self.stationInfo.GetClientSize()
@@ -2446,6 +2493,29 @@ class StationScreen(wx.Window):		# This code was contributed by Christof, DJ4CM.
         self.stationWindow.Show()
     else:
       self.stationWindow.Hide()
+  def MakePopup(self, stations):	# Write the station information and size the popup window
+    self.stationInfo.Clear()
+    attr = self.stationInfo.GetBasicStyle()
+    attr.SetFlags(wx.TEXT_ATTR_TABS)
+    attr.SetTabs((40, 400, 700))
+    self.stationInfo.SetBasicStyle(attr)
+    for statFreq, symbol, statName, statMode, statDscr in stations:
+      self.stationInfo.BeginSymbolBullet(symbol, 0, 40) 
+      self.stationInfo.BeginBold()      
+      self.stationInfo.WriteText(statName + '\t')
+      self.stationInfo.EndBold()
+      self.stationInfo.WriteText (str(statFreq) + ' Hz\t' + statMode)
+      self.stationInfo.Newline()
+      self.stationInfo.EndSymbolBullet() 
+      self.stationInfo.BeginLeftIndent(40)
+      if len(statDscr) > 0:
+        self.stationInfo.WriteText(statDscr)
+        self.stationInfo.Newline()
+      self.stationInfo.EndLeftIndent()   
+    line = self.stationInfo.GetVisibleLineForCaretPosition(self.stationInfo.GetCaretPosition()) 
+    cy = line.GetAbsolutePosition()[1]
+    self.stationWindow.SetClientSize((340, cy+2))
+    self.stationInfo.SetClientSize((340, cy+2))
   def OnLeaveWindow(self, event):
     self.stationWindow.Hide() 
                               
@@ -2481,41 +2551,23 @@ class WaterfallDisplay(wx.Window):
     # Size of top faster scroll region is (top_key + 2) * (top_key - 1) // 2
     self.top_key = 8
     self.top_size = (self.top_key + 2) * (self.top_key - 1) // 2
-    # Make the palette
-    if conf.waterfall_palette == 'B':
-      pal2 = conf.waterfallPaletteB
-    elif conf.waterfall_palette == 'C':
-      pal2 = conf.waterfallPaletteC
-    else:
-      pal2 = conf.waterfallPalette
-    red = []
-    green = []
-    blue = []
-    n = 0
-    for i in range(256):
-      if i > pal2[n+1][0]:
-         n = n + 1
-      red.append((i - pal2[n][0]) *
-       (pal2[n+1][1] - pal2[n][1]) //
-       (pal2[n+1][0] - pal2[n][0]) + pal2[n][1])
-      green.append((i - pal2[n][0]) *
-       (pal2[n+1][2] - pal2[n][2]) //
-       (pal2[n+1][0] - pal2[n][0]) + pal2[n][2])
-      blue.append((i - pal2[n][0]) *
-       (pal2[n+1][3] - pal2[n][3]) //
-       (pal2[n+1][0] - pal2[n][0]) + pal2[n][3])
-    self.red = red
-    self.green = green
-    self.blue = blue
-    bmp = wx.EmptyBitmap(1, 1)
-    bmp.x_origin = 0
-    self.bitmaps = [bmp] * application.screen_height
+    # The palette is shared by all waterfalls
+    self.palette = quisk_render.getPalette()
+    # The rows are kept in one bitmap used as a ring buffer; see quisk_render.WaterfallRing
+    self.ring = None
+    self.ring_dc = None
+    # While the waterfall is hidden, rows of dB are kept here as float32 arrays and colored when it is shown
+    self.pending = collections.deque(maxlen=application.screen_height)
+    self.pending_per_paint = 50		# Rows to color in each paint when the waterfall is shown
     if sys.platform == 'win32':
       self.Bind(wx.EVT_ENTER_WINDOW, self.OnEnter)
   def OnEnter(self, event):
     if not application.w_phase:
       self.SetFocus()	# Set focus so we get mouse wheel events
   def OnPaint(self, event):
+    t0 = time.time()
+    if self.pending:
+      self.AddPending()
     sample_rate = int(self.sample_rate * self.zoom)
     FD = self.parent.fltr_disp
     dc = wx.BufferedPaintDC(self)
@@ -2534,47 +2586,78 @@ class WaterfallDisplay(wx.Window):
       dc.DrawLine(self.tune_rx, 0, self.tune_rx, self.margin)
     x_origin = int(float(self.VFO) / sample_rate * self.data_width + 0.5)
     y = self.margin
-    index = 0
-    if conf.waterfall_scroll_mode:	# Draw the first few lines multiple times
-      for i in range(self.top_key, 1, -1):
-        b = self.bitmaps[index]
-        x = b.x_origin - x_origin
-        for j in range(0, i):
-          dc.DrawBitmap(b, x, y)
-          y += 1
-        index += 1
-    while y < self.height:
-      b = self.bitmaps[index]
-      x = b.x_origin - x_origin
-      dc.DrawBitmap(b, x, y)
-      y += 1
-      index += 1
+    ring = self.ring
+    if ring:
+      width = ring.width
+      age = 0
+      if conf.waterfall_scroll_mode:	# Draw the first few lines multiple times
+        for i in range(self.top_key, 1, -1):
+          row = ring.Row(age)
+          x = ring.x_origins[row] - x_origin
+          if hasattr(dc, 'StretchBlit'):
+            dc.StretchBlit(x, y, width, i, self.ring_dc, 0, row, width, 1)
+          else:		# wxPython 2.8 has no StretchBlit
+            for k in range(i):
+              dc.Blit(x, y + k, width, 1, self.ring_dc, 0, row)
+          y += i
+          age += 1
+      for row, count, x in ring.Spans(age, self.height - y, x_origin):
+        dc.Blit(x, y, width, count, self.ring_dc, 0, row)
+        y += count
     dc.SetPen(self.tuningPen)
     dc.SetLogicalFunction(wx.XOR)
     dc.DrawLine(self.tune_tx, self.margin, self.tune_tx, self.height)
     if self.tune_rx:
       dc.DrawLine(self.tune_rx, self.margin, self.tune_rx, self.height)
+    del dc		# copy the buffer to the screen before timing
+    application.render.Painted(time.time() - t0)
   def SetHeight(self, height):
     self.height = height
     self.SetSize((self.graph_width, height))
-  def OnGraphData(self, data, y_zero, y_scale):
-    sample_rate = int(self.sample_rate * self.zoom)
+  def AddPending(self):		# Add some of the rows saved while the waterfall was hidden
+    pending = self.pending
+    for i in range(min(self.pending_per_paint, len(pending))):
+      self.AddRow(*pending.popleft())
+    if pending:
+      self.Refresh(False)		# add more rows on the next paint
+  def AddRow(self, data, gain, y_zero, y_scale, x_origin):
     #T('graph start')
-    row = ''		# Make a new row of pixels for a one-line image
-    gain = self.rf_gain
-    for x in data:	# x is -130 to 0, or so (dB)
-      if( math.isnan(x)):
-        print(x)
-        x = 0
-      l = int((x - gain + y_zero // 3 + 100) * y_scale / 10)
-      l = max(l, 0)
-      l = min(l, 255)
-      row = row + "%c%c%c%c" % (chr(self.red[l]), chr(self.green[l]), chr(self.blue[l]), chr(255))
+    # Make a new row of pixels for a one-line image; x is -130 to 0, or so (dB)
+    if application.rasterizer:
+      application.raster_targets[id(self)] = self
+      application.rasterizer.Submit('W', id(self), data, (conf.waterfall_palette, gain, y_zero, y_scale), x_origin)
+      return
+    row = self.palette.Colorize(data, gain, y_zero, y_scale)
     #T('graph string')
-    bmp = wx.BitmapFromBufferRGBA(len(row) // 4, 1, row)
-    bmp.x_origin = int(float(self.VFO) / sample_rate * self.data_width + 0.5)
-    self.bitmaps.insert(0, bmp)
-    del self.bitmaps[-1]
+    self.DrawRow(row, x_origin)
+  def OnRaster(self, row, x_origin):	# The rasterizer made a row of pixels
+    self.DrawRow(row, x_origin)
+    self.Refresh(False)
+  def DrawRow(self, row, x_origin):
+    width = len(row) // 4
+    if not self.ring or self.ring.width != width:
+      self.MakeRing(width)
+    bmp = wx.BitmapFromBufferRGBA(width, 1, row)
+    y = self.ring.Add(x_origin)
+    self.ring_dc.DrawBitmap(bmp, 0, y)
+  def MakeRing(self, width):
+    height = application.screen_height
+    self.ring = quisk_render.WaterfallRing(width, height)
+    self.ring_bitmap = wx.EmptyBitmap(width, height)
+    self.ring_dc = wx.MemoryDC()
+    self.ring_dc.SelectObject(self.ring_bitmap)
+    self.ring_dc.SetBackground(wx.Brush('Black'))
+    self.ring_dc.Clear()
+  def OnGraphData(self, data, y_zero, y_scale):
+    sample_rate = int(self.sample_rate * self.zoom)
+    x_origin = int(float(self.VFO) / sample_rate * self.data_width + 0.5)
+    if not application.visibility.IsVisible(self):
+      self.pending.append((array.array('f', data), self.rf_gain, y_zero, y_scale, x_origin))
+      return
+    if self.pending:		# keep the order of the rows; OnPaint adds them
+      self.pending.append((array.array('f', data), self.rf_gain, y_zero, y_scale, x_origin))
+    else:
+      self.AddRow(data, self.rf_gain, y_zero, y_scale, x_origin)
     #self.ScrollWindow(0, 1, None)
     #self.Refresh(False, (0, 0, self.graph_width, self.top_size + self.margin))
     self.Refresh(False)
@@ -2649,6 +2732,8 @@ class WaterfallScreen(wx.SplitterWindow):
   def OnGraphData(self, data):
     self.pane1.OnGraphData(data)
     self.pane2.OnGraphData(data)
+  def OnWaterfallData(self, data):	# An older row for the waterfall; the graph only draws the newest row
+    self.pane2.OnGraphData(data)
   def ChangeRfGain(self, gain):		# Set the correction for RF gain
     self.pane2.display.rf_gain = gain
 
@@ -3115,6 +3200,8 @@ class MultiReceiverScreen(wx.SplitterWindow):
     self.rx_zero.OnIdle(event)
     for pane in self.receiver_list:
       pane.OnIdle(event)
+  def OnWaterfallData(self, data):	# An older row of the principal receiver for the waterfall
+    self.waterfall.OnWaterfallData(data)
   def OnGraphData(self, data, index=None):
     if index is None:		# data is for the principal receiver
       self.waterfall.OnGraphData(data)	# Save data for switch to waterfall
@@ -3249,6 +3336,8 @@ class ScopeScreen(wx.Window):
     t = "%s   Y: %.0E/div" % (t, self.yvalue)
     dc.DrawText(t, self.originX, self.height - self.chary)
   def OnGraphData(self, data):
+    if self.running and not application.visibility.IsVisible(self):
+      return
     if not self.running:
       if self.fpout:
         for cpx in data:
@@ -3596,7 +3685,6 @@ class App(wx.App):
     self.init_path = None
     self.bottom_widgets = None
     self.dxCluster = None
-    self.dxCluster2 = None
     self.startup_quisk = False
     #self.Auto0bt = 0 #JMH 20181226 added to support Auto zero beat on frequency change by left click on graph (specturm) display
     if sys.stdout.isatty():
@@ -3676,6 +3764,8 @@ class App(wx.App):
     self.bandState = {}			# for key band, the current (self.VFO, self.txFreq, self.mode)
     self.bandState.update(conf.bandState)
     self.memoryState = []		# a list of (freq, band, self.VFO, self.txFreq, self.mode)
+    self.stationIndex = None		# the favorites and memories sorted by frequency; see GetStationIndex()
+    self.stationGeneration = 0		# incremented each time the station index is made
     self.bandAmplPhase = conf.bandAmplPhase
     self.modeFilter = {			# the filter button index in use for each mode
       'CW'  : 3,
@@ -3725,6 +3815,13 @@ class App(wx.App):
     self.smeter_usage = "smeter"	# specify use of s-meter display
     self.timer = time.time()		# A seconds clock
     self.heart_time0 = self.timer	# timer to call HeartBeat at intervals
+    self.render = quisk_render.RenderScheduler(conf.graph_max_fps)	# decides when to draw FFT data
+    self.visibility = VisibilityTracker()	# hidden and minimized windows are not drawn
+    self.rasterizer = quisk_render.makeRasterizer(conf.graph_rasterizer)	# None to rasterize in the GUI thread
+    self.raster_targets = {}	# the displays waiting for the rasterizer, indexed by id()
+    self.skimmer = None		# the CW skimmer if conf.skimmer_enable
+    self.skimmer_gaps = 0	# the count of raw sample tap gaps at the last read
+    self.skimmer_lost = False	# samples were lost after the last samples given to the skimmer
     self.save_time0 = self.timer
     self.smeter_db_time0 = self.timer
     self.smeter_sunits_time0 = self.timer
@@ -3899,10 +3996,12 @@ The new code supports multiple corrections per band.""")
     frame2Height = 240  
     self.main_frame2 = KW4KDFrame(self.width-20, frame2Height) #JMH 20181221 this is spectrum screen
     self.main_frame2.Show() #JMH 20181221
+    self.visibility.AddFrame(self.main_frame2)
     #self.SetTopWindow(frame)
 #############################################################
 
     self.main_frame = frame = QMainFrame(self.width, self.height) # this is button screen
+    self.visibility.AddFrame(frame)
     self.SetTopWindow(frame)
     #w, h = frame.GetSizeTuple()
     #ww, hh = frame.GetClientSizeTuple()
@@ -4130,28 +4229,77 @@ The new code supports multiple corrections per band.""")
       self.sound_thread = SoundThread()
       self.sound_thread.start()
     #DX Cluster Telnet Links
+    feeds = []
+    dxClFltrCmd = getattr(conf, 'dxClFltrCmd', '')
     if conf.dxClHost:
-      # create DX Cluster and register listener for change notification
-      self.dxCluster = dxcluster.DxCluster(conf.dxClHost, conf.dxClPort, conf.user_call_sign, conf.dxClPassword, conf.dxClFltrCmd)
+      feeds.append((conf.dxClHost, conf.dxClPort, dxClFltrCmd))
+    if getattr(conf, 'dxClHost2', ''): #JMH 20190304 a 2nd telnet session
+      feeds.append((conf.dxClHost2, conf.dxClPort2, getattr(conf, 'dxClFltrCmd2', dxClFltrCmd)))
+    feeds.extend(conf.dxClFeeds)
+    if feeds or conf.skimmer_enable:	# the skimmer spots are stored with the DX cluster spots
+      # restore the unexpired spots from the journal
+      journal = None
+      if conf.dxClJournalHours > 0:
+        path = conf.dxClJournalPath
+        if not path:
+          path = os.path.join(conf.DefaultConfigDir, "quisk_spots.sqlite")
+        try:
+          journal = spotjournal.SpotJournal(path, conf.dxClJournalHours)
+        except:
+          traceback.print_exc()
+      # spots are filtered before they are stored
+      spotFilter = None
+      if conf.dxClFilters or conf.dxClFilterFile:
+        spotFilter = spotfilter.SpotFilter(conf.dxClFilters, conf.dxClFilterFile)
+      # create DX Cluster feeds and register listener for change notification
+      self.dxCluster = dxcluster.DxClusterClient(feeds, conf.user_call_sign, conf.dxClPassword, journal, spotFilter)
+      if journal:
+        try:
+          journal.replay(self.dxCluster.dxSpots)
+        except:
+          traceback.print_exc()
+        journal.start()
+        wx.CallAfter(self.OnDxSpotChanges)
       self.dxCluster.setListener(self.OnDxClChange)
       self.dxCluster.start()
-      try:
-        if conf.dxClHost2: #now start a 2nd telnet session/thread
-          # create DX Cluster and register listener for change notification
-          try:
-            if(conf.dxClFltrCmd2):
-              dxClFltrCmd = conf.dxClFltrCmd2
-          except:
-            dxClFltrCmd = conf.dxClFltrCmd
-          self.dxCluster = dxcluster.DxCluster(conf.dxClHost2, conf.dxClPort2, conf.user_call_sign, conf.dxClPassword, dxClFltrCmd)
-          self.dxCluster.setListener(self.OnDxClChange)
-          self.dxCluster.start()
-      except:
-        pass
+    if conf.skimmer_enable:
+      self.skimmer = self.MakeSkimmer()
     return True
-  def OnDxClChange(self):
+  def MakeSkimmer(self):
+    if not hasattr(QS, 'get_raw_tap'):
+      print("The CW skimmer needs the raw sample tap in the _quisk extension; please build it again")
+      return None
+    spotter = (conf.user_call_sign or 'SKIMMER') + '-#'
+    skim = skimmer.makeSkimmer(self.sample_rate, spotter, conf.skimmer_workers, conf.skimmer_snr)
+    if skim:
+      QS.set_raw_tap(self.sample_rate)	# a ring of one second of samples
+    return skim
+  def SkimData(self):	# Give the raw I/Q samples to the CW skimmer, and store its spots
+    if self.skimmer.rate != self.sample_rate:	# the old processes end before the new ones start
+      self.skimmer.stop()
+      self.skimmer.join(2.0)
+      self.skimmer = self.MakeSkimmer()
+      if not self.skimmer:
+        return
+    data, gaps = QS.get_raw_tap()
+    if QS.is_key_down():		# do not decode our own transmit signal
+      self.skimmer_lost = True
+    elif data:
+      self.skimmer.Submit(data, self.VFO + Hardware.transverter_offset, self.skimmer_lost)
+      self.skimmer_lost = False
+    if gaps != self.skimmer_gaps:	# the tap lost the samples after this data
+      self.skimmer_gaps = gaps
+      self.skimmer_lost = True
+    for spot in self.skimmer.Results():
+      self.dxCluster.addSpot(spot)
+  def OnDxClChange(self, batch):	# Called from the telnet thread at most once per dxClUpdateInterval
+    wx.CallAfter(self.OnDxSpotChanges, batch)
+  def OnDxSpotChanges(self, batch=None):	# batch is the list of DxEntry changed, or None for all spots
+    if self.dxCluster:
+      self.rbnlist.ReadChanges(self.dxCluster.dxSpots)
     #self.station_screen.Refresh()
-    self.station_screenf2.Refresh()
+    if batch is None or self.station_screenf2.Shows(batch):
+      self.station_screenf2.Refresh()
   def OnIdle(self, event):
     if self.screen:
       self.screen.OnIdle(event)
@@ -4167,9 +4315,11 @@ The new code supports multiple corrections per band.""")
     if self.dxCluster:
       self.dxCluster.stop()
       time.sleep(0.3)
-    if self.dxCluster2:
-      self.dxCluster2.stop()
-      time.sleep(0.3)   
+    if self.rasterizer:
+      self.rasterizer.stop()
+    if self.skimmer:
+      self.skimmer.stop()
+      self.skimmer.join(1.0)
     for i in range(0, 20):
       if threading.activeCount() == 1:
         break
@@ -4182,8 +4332,10 @@ The new code supports multiple corrections per band.""")
   def OnExit(self):
     if self.dxCluster:
       self.dxCluster.stop()
-    if self.dxCluster2:
-      self.dxCluster2.stop()  
+    if self.rasterizer:
+      self.rasterizer.stop()
+    if self.skimmer:
+      self.skimmer.stop()
     QS.close_rx_udp()
     Hardware.close()
     self.SaveState()
@@ -4738,55 +4890,7 @@ The new code supports multiple corrections per band.""")
         buttons[i].Enable(0)
   def MakeFilterCoef(self, rate, N, bw, center):
     """Make an I/Q filter with rectangular passband."""
-    lowpass = bw * 24000 // rate // 2
-    if lowpass in Filters:
-      filtD = Filters[lowpass]
-      #print ("Custom filter key %d rate %d bandwidth %d size %d" % (lowpass, rate, bw, len(filtD)))
-    else:
-      #print ("Window filter key %d rate %d bandwidth %d" % (lowpass, rate, bw))
-      if N is None:
-        shape = 1.5       # Shape factor at 88 dB
-        trans = (bw / 2.0 / rate) * (shape - 1.0)     # 88 dB atten
-        N = int(4.0 / trans)
-        if N > 1000:
-          N = 1000
-        N = (N // 2) * 2 + 1
-      K = bw * N / rate
-      filtD = []
-      pi = math.pi
-      sin = math.sin
-      cos = math.cos
-      for k in range(-N//2, N//2 + 1):
-        # Make a lowpass filter
-        if k == 0:
-          z = float(K) / N
-        else:
-          z = 1.0 / N * sin(pi * k * K / N) / sin(pi * k / N)
-        # Apply a windowing function
-        if 1:	# Blackman window
-          w = 0.42 + 0.5 * cos(2. * pi * k / N) + 0.08 * cos(4. * pi * k / N)
-        elif 0:	# Hamming
-          w = 0.54 + 0.46 * cos(2. * pi * k / N)
-        elif 0:	# Hanning
-          w = 0.5 + 0.5 * cos(2. * pi * k / N)
-        else:
-          w = 1
-        z *= w
-        filtD.append(z)
-    if center:
-      # Make a bandpass filter by tuning the low pass filter to new center frequency.
-      # Make two quadrature filters.
-      filtI = []
-      filtQ = []
-      tune = -1j * 2.0 * math.pi * center / rate;
-      NN = len(filtD)
-      D = (NN - 1.0) / 2.0;
-      for i in range(NN):
-        z = 2.0 * cmath.exp(tune * (i - D)) * filtD[i]
-        filtI.append(z.real)
-        filtQ.append(z.imag)
-      return filtI, filtQ
-    return filtD, filtD
+    return filter_design.makeFilterCoef(rate, N, bw, center, conf.filter_window)
   def UpdateFilterDisplay(self):
     # Note: Filter bandwidths are ripple bandwidths with a shape factor of 1.2.
     # Also, SSB filters start at 300 Hz.
@@ -4941,6 +5045,7 @@ The new code supports multiple corrections per band.""")
     if event is not None:
       win = event.GetEventObject()
       name = win.GetLabel()
+    self.visibility.OnChange()
     self.screen.Hide()
     #self.station_screen.Hide()
     self.station_screenf2.Hide()
@@ -5601,9 +5706,11 @@ The new code supports multiple corrections per band.""")
       data = self.memoryState[i]
       if data[0] == frq:
         self.memoryState[i] = (self.VFO + self.txFreq, self.lastBand, self.VFO, self.txFreq, self.mode)
+        self.stationIndex = None
         return
     self.memoryState.append((self.VFO + self.txFreq, self.lastBand, self.VFO, self.txFreq, self.mode))
     self.memoryState.sort()
+    self.stationIndex = None
     self.memNextButton.Enable(True)
     self.memDeleteButton.Enable(True)
     self.MakeMemPopMenu()
@@ -5628,12 +5735,26 @@ The new code supports multiple corrections per band.""")
       data = self.memoryState[i]
       if data[0] == frq:
         del self.memoryState[i]
+        self.stationIndex = None
         break
     self.memNextButton.Enable(bool(self.memoryState))
     self.memDeleteButton.Enable(bool(self.memoryState))
     self.MakeMemPopMenu()
     #self.station_screen.Refresh()
     self.station_screenf2.Refresh()
+  def GetStationIndex(self):
+    """Return a list of the frequencies of the favorites and memories, and a list of the stations.
+
+    Both lists are sorted by frequency.  They are made again after the favorites or memories change,
+    and self.stationGeneration is incremented."""
+    if self.stationIndex is None:
+      self.stationGeneration += 1
+      stations = list(self.config_screen.favorites.stations)
+      for mem_f, mem_band, mem_vfo, mem_txfreq, mem_mode in self.memoryState:
+        stations.append((mem_f, conf.Xsym_stat_mem, '', mem_mode, ''))
+      stations.sort()
+      self.stationIndex = ([station[0] for station in stations], stations)
+    return self.stationIndex
   def OnRightClickMemory(self, event):
     event.Skip()
     pos = event.GetPosition()
@@ -6050,6 +6171,21 @@ The new code supports multiple corrections per band.""")
           self.hamlib_clients.remove(client)
           # print 'Remove', client.address
           break
+  def DrawGraphData(self):	# Send FFT data to the screen when the render scheduler allows
+    if self.rasterizer:		# Give the finished rows to their displays
+      for kind, key, row, extra in self.rasterizer.Results():
+        window = self.raster_targets.get(key)
+        if window and row is not None:
+          window.OnRaster(row, extra)
+    if self.screen in (self.scope, self.config_screen):
+      return
+    if self.render.Due(self.timer):
+      # waterfalls need every row, a graph only the newest
+      history = isinstance(self.screen, (WaterfallScreen, MultiReceiverScreen))
+      rows = self.render.Take(self.timer, history)
+      for data in rows[:-1]:
+        self.screen.OnWaterfallData(data)
+      self.screen.OnGraphData(rows[-1])			# Send message to draw new data
   def OnReadSound(self):	# called at frequent intervals
     if conf.do_repeater_offset:
       hold = QS.tx_hold_state(-1)
@@ -6118,6 +6254,8 @@ The new code supports multiple corrections per band.""")
       elif ptt is False and self.pttButton.GetValue():
         self.SetPTT(False)
     self.timer = time.time()
+    if self.skimmer:
+      self.SkimData()
     if self.screen == self.scope:
       data = QS.get_graph(0, 1.0, 0)	# get raw data
       if data:
@@ -6165,7 +6303,8 @@ The new code supports multiple corrections per band.""")
             #print("Mode: %s; rxTune: %d" %(self.mode, (self.rxFreq + self.ritFreq)))
           else: self.Mflpcnt -=1
           ###########################################################
-          self.screen.OnGraphData(data)			# Send message to draw new data
+          self.render.Acquire(data)		# Save data for the render scheduler
+          self.DrawGraphData()
         #T('graph data')
         #application.Yield()
         #T('Yield')
@@ -6181,6 +6320,7 @@ The new code supports multiple corrections per band.""")
       if self.timer - self.clip_time0 > 1.0:
         self.clip_time0 = 0
         self.freqDisplay.Clip(0)
+    self.DrawGraphData()		# Draw data held back by the render scheduler
     if self.timer - self.heart_time0 > 0.10:		# call hardware to perform background tasks
       self.heart_time0 = self.timer
       if self.screen == self.config_screen:
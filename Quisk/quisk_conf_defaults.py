@@ -1325,6 +1325,90 @@ dxClPassword = ''
 # dxClExpireTime is the time in minutes until DX Cluster entries are removed.
 dxClExpireTime = 20
 
+## dxClDedupBand        Dx cluster spots per band, boolean
+# The Dx cluster options log into a Dx cluster server, and put station information
+# on the station window under the graph and waterfall screens.
+# Spots for the same DX station are merged into one entry.  If dxClDedupBand is True, spots
+# are merged only within the same band, so a station spotted on two bands is shown on both.
+dxClDedupBand = False
+#dxClDedupBand = True
+
+# dxClFeeds is a list of more DX cluster, RBN or skimmer servers to log into, in addition to
+# dxClHost.  Each item is (host, port, filter_command).  All feeds run in one thread, and their
+# spots are merged.  Port zero means the telnet port 23.
+dxClFeeds = []
+#dxClFeeds = [('telnet.reversebeacon.net', 7000, ''), ('dxc.wc2l.com', 0, 'Set Dx Filter (skimmer)')]
+
+## dxClUpdateInterval   Dx cluster update seconds, number
+# The Dx cluster options log into a Dx cluster server, and put station information
+# on the station window under the graph and waterfall screens.
+# dxClUpdateInterval is the shortest time in seconds between screen updates for new spots.
+# Spots that arrive faster are shown together.
+dxClUpdateInterval = 0.25
+#dxClUpdateInterval = 1.0
+
+## dxClJournalHours     Dx spot journal hours, integer
+# The Dx cluster options log into a Dx cluster server, and put station information
+# on the station window under the graph and waterfall screens.
+# Spots are saved in a journal file, and the unexpired spots are shown again when Quisk starts.
+# dxClJournalHours is the number of hours of spots to keep.  Zero means no journal.
+dxClJournalHours = 0
+#dxClJournalHours = 24
+
+## dxClJournalPath      Dx spot journal file, text
+# The Dx cluster options log into a Dx cluster server, and put station information
+# on the station window under the graph and waterfall screens.
+# dxClJournalPath is the path to the spot journal file.  If blank, the file quisk_spots.sqlite
+# in the config directory is used.
+dxClJournalPath = ''
+#dxClJournalPath = '/path/to/my/file/quisk_spots.sqlite'
+
+# dxClFilters is a list of rules to filter DX cluster and RBN spots before they are stored.  A spot
+# is kept only if it passes every rule.  The rules are:
+#   band 40 20 15             The spot frequency is within one of these bands from BandEdge.
+#   mode CW RTTY              The RBN mode is one of these.
+#   snr 6                     The RBN SNR is at least 6 dB.
+#   wpm 15 35                 The RBN speed is from 15 to 35 WPM.
+#   spotter continent NA EU   The spotter is on one of these continents.
+#   spotter prefix K W N VE   The spotter call starts with one of these.
+#   spotter deny K1TTT        The spotter call does not start with any of these.
+#   dx allow JA VK ZL         The DX call starts with one of these.
+#   dx deny K W N             The DX call does not start with any of these.
+# The continent is found from a short table of common call sign prefixes, not a full country list,
+# so a rare or special event prefix may have no continent or the wrong one, and fail the rule.
+# These rules are read when Quisk starts.  To change rules while Quisk is running, use dxClFilterFile.
+dxClFilters = []
+#dxClFilters = ['band 40 30 20', 'mode CW', 'snr 6', 'spotter continent NA']
+
+## dxClFilterFile       Dx spot filter file, text
+# The Dx cluster options log into a Dx cluster server, and put station information
+# on the station window under the graph and waterfall screens.
+# dxClFilterFile is the path to a file of more spot filter rules, one rule per line, in the same
+# form as dxClFilters.  The file is read again when it changes, so these rules can be changed while
+# Quisk is running.
+dxClFilterFile = ''
+#dxClFilterFile = '/path/to/my/file/quisk_spot_filters.txt'
+
+## skimmer_enable       CW skimmer, boolean
+# The CW skimmer decodes every CW signal in the raw I/Q samples, and adds the stations heard calling
+# CQ to the DX spots as local spots from your call sign with "-#".  The skimmer reads every captured
+# sample from a tap in the _quisk extension, so it decodes whatever screen is shown, but not while you
+# transmit.  If Quisk is too busy to read the tap for a second, samples are lost and the characters
+# being sent are dropped.  numpy is required.
+skimmer_enable = False
+#skimmer_enable = True
+
+## skimmer_workers      CW skimmer processes, integer
+# This is the number of processes that decode the CW signals for the skimmer.  Use the number of
+# spare CPU cores.  Zero decodes in the GUI thread.
+skimmer_workers = 2
+#skimmer_workers = 0
+
+## skimmer_snr          CW skimmer threshold dB, number
+# A CW signal is decoded by the skimmer if it is this many dB above the noise in a 50 Hz channel.
+skimmer_snr = 10.0
+#skimmer_snr = 15.0
+
 ## IQ_Server_IP         Pulse server IP address, text
 #IP Adddress for remote PulseAudio IQ server.
 IQ_Server_IP = ""
@@ -1584,6 +1668,22 @@ fft_size_multiplier = 0
 # and should be about 5 to 10 Hertz.  Higher rates require more processor power.
 graph_refresh = 7
 
+## graph_max_fps				Graph frame rate limit, number
+# This is the maximum number of times per second that the graph and waterfall are drawn.  FFT data
+# that arrives faster is held: the graph shows the newest data, and the waterfall adds all rows
+# at the next frame.  Frames are also skipped if drawing takes longer than the frame time.
+# Zero means no limit.
+graph_max_fps = 20
+#graph_max_fps = 10
+
+## graph_rasterizer			Graph rasterizer, text choice
+# This controls where the FFT data is turned into waterfall pixels and graph lines.  With '' this
+# is done in the GUI thread.  With 'thread' it is done in a background thread, and with 'process'
+# it is done in another process so it can use another CPU core.  The GUI thread then only draws.
+graph_rasterizer = ''
+#graph_rasterizer = 'thread'
+#graph_rasterizer = 'process'
+
 
 
 
@@ -1600,6 +1700,15 @@ graph_peak_hold_1 = 0.25
 # of the Graph button.  Lower numbers give a longer time constant.
 graph_peak_hold_2 = 0.10
 
+## graph_average_mode			Graph averaging, text choice
+# This controls how the graph line changes for the two peak hold settings of the Graph button.
+# With 'peak' the line rises at once and falls slowly.  With 'min' the line falls at once and
+# rises slowly, so it shows the noise floor.  With 'average' the line is an exponential
+# average of the FFT data.  The speed is set by graph_peak_hold_1 and graph_peak_hold_2.
+graph_average_mode = 'peak'
+#graph_average_mode = 'min'
+#graph_average_mode = 'average'
+
 
 ## use_sidetone				Use sidetone, integer choice
 # This controls whether Quisk will display a sidetone volume control "Sto",
@@ -1653,6 +1762,14 @@ FilterBwDGT	= (200, 400, 1500, 3200, 4800, 10000)
 FilterBwEXT	= (8000, 10000, 12000, 15000, 17000, 20000)
 FilterBwFDV	= (1500, 2000, 3000, '', '', '')
 
+## filter_window			Filter design, text choice
+# Quisk uses its built-in filters for the usual bandwidths.  For other bandwidths it designs a filter
+# when the filter button is pressed.  With 'blackman' this is a Blackman window filter.  With
+# 'equiripple' it is the shortest Parks-McClellan filter with 0.2 dB ripple, 88 dB attenuation and
+# a shape factor of 1.5.  This uses fewer taps and less CPU, and needs numpy.
+filter_window = 'blackman'
+#filter_window = 'equiripple'
+
 # If your hardware file defines the method OnButtonPTT(self, event), then Quisk will
 # display a PTT button you can press.  The method must switch your hardware to
 # transmit somehow, for example, by setting a serial port pin to high.
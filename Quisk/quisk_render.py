@@ -0,0 +1,677 @@
+# Drawing calculations for the graph and waterfall screens.  This module does not use wx,
+# so the calculations can be timed and used without a display.
+
+from __future__ import print_function
+
+import time
+import math
+import collections
+import array
+import bisect
+import ctypes
+import threading
+import multiprocessing
+try:
+  import Queue as queue
+except ImportError:
+  import queue
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+import quisk_conf_defaults as conf
+
+class WaterfallPalette:
+  """The 256 colors of a waterfall palette, and the conversion of a row of dB to RGBA pixels.
+
+  Use getPalette() so that all waterfalls share one palette.  If numpy is available the palette
+  is a 256 x 4 uint8 array and a row is converted with one indexing operation; otherwise a
+  table of four byte strings is used."""
+  def __init__(self, pal2):
+    red = []
+    green = []
+    blue = []
+    n = 0
+    for i in range(256):
+      if i > pal2[n+1][0]:
+         n = n + 1
+      red.append((i - pal2[n][0]) *
+       (pal2[n+1][1] - pal2[n][1]) //
+       (pal2[n+1][0] - pal2[n][0]) + pal2[n][1])
+      green.append((i - pal2[n][0]) *
+       (pal2[n+1][2] - pal2[n][2]) //
+       (pal2[n+1][0] - pal2[n][0]) + pal2[n][2])
+      blue.append((i - pal2[n][0]) *
+       (pal2[n+1][3] - pal2[n][3]) //
+       (pal2[n+1][0] - pal2[n][0]) + pal2[n][3])
+    self.red = red
+    self.green = green
+    self.blue = blue
+    self.table = [bytes(bytearray((red[i], green[i], blue[i], 255))) for i in range(256)]
+    if numpy is not None:
+      self.lut = numpy.empty((256, 4), dtype=numpy.uint8)
+      self.lut[:, 0] = red
+      self.lut[:, 1] = green
+      self.lut[:, 2] = blue
+      self.lut[:, 3] = 255
+    else:
+      self.lut = None
+  def Indexes(self, data, gain, y_zero, y_scale):
+    # Return the palette index 0 to 255 for each dB value in data; NaN is 0 dB
+    offset = y_zero // 3 + 100 - gain
+    scale = y_scale / 10.0
+    if self.lut is not None:
+      a = numpy.nan_to_num(numpy.asarray(data, dtype=numpy.float64))
+      a += offset
+      a *= scale
+      numpy.clip(a, 0, 255, out=a)
+      return a.astype(numpy.intp)
+    indexes = []
+    for x in data:
+      if x != x:	# NaN
+        x = 0
+      l = int((x + offset) * scale)
+      if l < 0:
+        l = 0
+      elif l > 255:
+        l = 255
+      indexes.append(l)
+    return indexes
+  def Colorize(self, data, gain, y_zero, y_scale):
+    # Return a row of RGBA pixels as a byte string for wx.BitmapFromBufferRGBA()
+    indexes = self.Indexes(data, gain, y_zero, y_scale)
+    if self.lut is not None:
+      return self.lut[indexes].tobytes()
+    table = self.table
+    return b''.join([table[l] for l in indexes])
+
+palettes = {}
+
+def getPalette(name=None):
+  """Return the shared WaterfallPalette for conf.waterfall_palette 'A', 'B' or 'C'."""
+  if name is None:
+    name = conf.waterfall_palette
+  try:
+    return palettes[name]
+  except KeyError:
+    pass
+  if name == 'B':
+    pal2 = conf.waterfallPaletteB
+  elif name == 'C':
+    pal2 = conf.waterfallPaletteC
+  else:
+    pal2 = conf.waterfallPalette
+  palette = palettes[name] = WaterfallPalette(pal2)
+  return palette
+
+class WaterfallRing:
+  """The rows of a waterfall image used as a ring buffer.
+
+  The image has width x height pixels.  Row "cursor" is the newest row, and the older rows follow it,
+  wrapping from the last row to row zero.  So the image is drawn with at most two copies.  The
+  x_origins table has the VFO offset of each image row, and rows are shifted by their offset from
+  the current VFO when they are drawn."""
+  def __init__(self, width, height):
+    self.width = width
+    self.height = height
+    self.cursor = 0
+    self.x_origins = [0] * height
+  def Add(self, x_origin):		# Return the image row to use for a new row
+    self.cursor = (self.cursor - 1) % self.height
+    self.x_origins[self.cursor] = x_origin
+    return self.cursor
+  def Row(self, age):			# Return the image row for the row "age" rows older than the newest
+    return (self.cursor + age) % self.height
+  def Spans(self, age, count, x_origin):
+    """Return a list of (image_row, number_of_rows, x_shift) to draw count rows starting at age.
+
+    A span ends at the bottom of the image and where the VFO offset changes."""
+    spans = []
+    height = self.height
+    count = min(count, height - age)
+    x_origins = self.x_origins
+    row = (self.cursor + age) % height
+    while count > 0:
+      x = x_origins[row]
+      end = min(height, row + count)
+      n = row + 1
+      while n < end and x_origins[n] == x:
+        n += 1
+      spans.append((row, n - row, x - x_origin))
+      count -= n - row
+      row = n % height
+    return spans
+
+class SpectrumTrace:
+  """The graph line: the pixel y of each FFT bin, with peak hold or averaging.
+
+  The mode is "peak" to rise at once and fall by at most "hold" pixels per frame, "min" to fall at
+  once and rise by at most "hold" pixels per frame, or "average" for an exponential average with
+  weight "alpha" for the new data.  With numpy the line is an N x 2 int32 array that is updated in
+  place and can be passed to DrawLines(); otherwise it is a list of [x, y] lists updated in place."""
+  def __init__(self, mode='peak'):
+    self.mode = mode
+    self.hold = 9999		# pixels per frame for "peak" and "min"
+    self.alpha = 1.0		# weight of new data for "average"
+    self.size = 0
+    self.line = [(0, 0), (1,1)]		# initial fake graph data
+    self.level = None		# the y values as floats for "average"
+  def SetHold(self, hold, alpha):
+    self.hold = hold
+    self.alpha = alpha
+  def Resize(self, size, ys):
+    self.size = size
+    if numpy is not None:
+      self.line = numpy.empty((size, 2), dtype=numpy.int32)
+      self.line[:, 0] = numpy.arange(size)
+      self.line[:, 1] = ys
+      self.level = self.line[:, 1].astype(numpy.float64)
+    else:
+      self.line = [[x, ys[x]] for x in range(size)]
+      self.level = [float(y) for y in ys]
+  def GetY(self):	# Return the y values as int32 bytes
+    if numpy is not None:
+      return self.line[:, 1].tobytes()
+    ys = array.array('i', [point[1] for point in self.line])
+    return ys.tobytes() if hasattr(ys, 'tobytes') else ys.tostring()
+  def SetY(self, ys):	# Set the y values from int32 bytes made by GetY()
+    if numpy is not None:
+      y = numpy.frombuffer(ys, dtype=numpy.int32)
+      if self.size != len(y):
+        self.Resize(len(y), y)
+      else:
+        self.line[:, 1] = y
+    else:
+      y = array.array('i')
+      if hasattr(y, 'frombytes'):
+        y.frombytes(ys)
+      else:
+        y.fromstring(ys)
+      if self.size != len(y):
+        self.Resize(len(y), y)
+      else:
+        for point, value in zip(self.line, y):
+          point[1] = value
+    return self.line
+  def Update(self, data, zeroDB, scale):
+    """Add a row of FFT data in dB and return the line, or None if the data has a NaN."""
+    factor = scale / 10.0
+    if numpy is not None:
+      a = numpy.asarray(data, dtype=numpy.float64)
+      if numpy.isnan(a.sum()):
+        return None
+      # y = zeroDB - int(dB * scale / 10.0 + 0.5)
+      a *= factor
+      a += 0.5
+      y = zeroDB - numpy.trunc(a)
+      if self.size != len(a):		# the first data is used as is
+        self.Resize(len(a), y)
+        return self.line
+      mode = self.mode
+      ys = self.line[:, 1]
+      if mode == 'average':
+        level = self.level
+        level += (y - level) * self.alpha
+        numpy.floor(level + 0.5, out=y)
+      elif mode == 'min':
+        numpy.maximum(y, ys - self.hold, out=y)
+      else:
+        numpy.minimum(y, ys + self.hold, out=y)
+      ys[:] = y
+      return self.line
+    for y in data:
+      if y != y:	# NaN
+        return None
+    if self.size != len(data):		# the first data is used as is
+      self.Resize(len(data), [zeroDB - int(y * factor + 0.5) for y in data])
+      return self.line
+    mode = self.mode
+    hold = self.hold
+    alpha = self.alpha
+    level = self.level
+    x = 0
+    for point in self.line:
+      y = zeroDB - int(data[x] * factor + 0.5)
+      y0 = point[1]
+      if mode == 'average':
+        level[x] += (y - level[x]) * alpha
+        y = int(math.floor(level[x] + 0.5))	# round as numpy does for negative y
+      elif mode == 'min':
+        if y < y0:
+          y = max(y, y0 - hold)
+      elif y > y0:
+        y = min(y, y0 + hold)
+      point[1] = y
+      x += 1
+    return self.line
+
+class RenderScheduler:
+  """Decide when to draw FFT rows, so that the paint rate does not follow the FFT rate.
+
+  Call Acquire() for each new FFT row, and Take() when Due() is True to get the rows to draw.
+  The graph needs only the newest row, but a waterfall needs every row, so up to queue_size rows
+  are kept.  Rows are drawn at most max_fps times a second, and less often if painting takes
+  longer than that.  Call Painted() with the paint time of each window."""
+  def __init__(self, max_fps, queue_size=64):
+    self.interval = 1.0 / max_fps if max_fps > 0 else 0.0
+    self.rows = collections.deque()
+    self.queue_size = queue_size
+    self.last_take = 0.0
+    self.paint_time = 0.0		# paint time of the last frame
+    self.frame_time = 0.0		# paint time of the current frame
+    self.acquired = 0		# FFT rows acquired
+    self.frames = 0		# calls to Take(), each a frame of rows to draw
+    self.paints = 0		# window paints reported by Painted()
+    self.dropped = 0		# rows not drawn
+    self.rate_time = 0.0
+    self.rate_counts = (0, 0, 0, 0)
+    self.rates = (0.0, 0.0, 0.0, 0.0)
+  def Acquire(self, data):
+    self.acquired += 1
+    if len(self.rows) >= self.queue_size:
+      self.rows.popleft()
+      self.dropped += 1
+    self.rows.append(data)
+  def Due(self, now):
+    if not self.rows:
+      return False
+    return now - self.last_take >= max(self.interval, self.paint_time)
+  def Take(self, now, history):	# Return the rows to draw; all rows if history, else the newest row
+    rows = self.rows
+    if history:
+      take = list(rows)
+    else:
+      take = [rows[-1]]
+      self.dropped += len(rows) - 1
+    rows.clear()
+    self.last_take = now
+    self.frames += 1
+    self.paint_time = self.frame_time
+    self.frame_time = 0.0
+    return take
+  def Painted(self, seconds):
+    self.paints += 1
+    self.frame_time += seconds
+  def Rates(self, now):	# Return rows acquired, frames drawn, window paints and rows dropped per second
+    if now - self.rate_time >= 1.0:
+      counts = (self.acquired, self.frames, self.paints, self.dropped)
+      if self.rate_time:
+        dt = now - self.rate_time
+        self.rates = tuple([(c1 - c0) / dt for c0, c1 in zip(self.rate_counts, counts)])
+      self.rate_counts = counts
+      self.rate_time = now
+    return self.rates
+
+class TextExtents:
+  """Cache the widths of strings drawn in one font.
+
+  Partial() returns the width of each leading part of the text, text[:1], text[:2] and so on, as
+  made by the measure function, usually a DC GetPartialTextExtents().  The cache is cleared when it
+  has max_size strings."""
+  def __init__(self, max_size=5000):
+    self.max_size = max_size
+    self.partial = {}
+    self.hits = 0
+    self.misses = 0
+  def Partial(self, text, measure):
+    try:
+      widths = self.partial[text]
+    except KeyError:
+      pass
+    else:
+      self.hits += 1
+      return widths
+    self.misses += 1
+    widths = measure(text)
+    if len(self.partial) >= self.max_size:
+      self.partial.clear()
+    self.partial[text] = widths
+    return widths
+  def Width(self, text, measure):
+    widths = self.Partial(text, measure)
+    if widths:
+      return widths[-1]
+    return 0
+
+text_extents = {}
+
+def getTextExtents(font):
+  """Return the shared TextExtents for a font, usually given by its GetNativeFontInfoDesc()."""
+  try:
+    return text_extents[font]
+  except KeyError:
+    extents = text_extents[font] = TextExtents()
+    return extents
+
+def truncateText(text, widths, space, dots_width, max_len=25):
+  """Return the text, or fewer than max_len characters of it and "..", to fit in space pixels.
+
+  The widths are the partial text extents of the text.  If nothing fits the result is ".."."""
+  if (widths[-1] if widths else 0) <= space:
+    return text
+  n = bisect.bisect_right(widths, space - dots_width)	# characters that fit with the dots
+  return text[:min(n, max_len - 1)] + '..'
+
+def rasterize(traces, palettes, kind, key, data, params):
+  """Convert one FFT row for a rasterizer and return bytes, or None.
+
+  For kind "W" (waterfall) params is (palette_name, gain, y_zero, y_scale) and the result is a row of
+  RGBA pixels.  For kind "G" (graph) params is (mode, hold, alpha, zeroDB, scale) and the result is
+  the int32 y value of each point.  The graph state for each key is kept in traces."""
+  if kind == 'W':
+    name, gain, y_zero, y_scale = params
+    return palettes[name].Colorize(data, gain, y_zero, y_scale)
+  mode, hold, alpha, zeroDB, scale = params
+  trace = traces.get(key)
+  if trace is None:
+    trace = traces[key] = SpectrumTrace(mode)
+  trace.mode = mode
+  trace.SetHold(hold, alpha)
+  if trace.Update(data, zeroDB, scale) is None:
+    return None
+  return trace.GetY()
+
+class ThreadRasterizer(threading.Thread):
+  """Convert FFT rows to waterfall pixels and graph lines in a thread.
+
+  Call Submit() with each row, and Results() to get a list of (kind, key, bytes, extra) for the
+  finished rows, in order.  Extra is any data the caller needs with the result."""
+  def __init__(self):
+    threading.Thread.__init__(self)
+    self.daemon = True
+    self.jobs = queue.Queue()
+    self.results = collections.deque()
+    self.traces = {}
+    self.palettes = {}
+  def Submit(self, kind, key, data, params, extra=None):
+    self.jobs.put((kind, key, data, params, extra))
+  def Results(self):
+    results = []
+    while self.results:
+      results.append(self.results.popleft())
+    return results
+  def run(self):
+    while True:
+      job = self.jobs.get()
+      if job is None:
+        break
+      kind, key, data, params, extra = job
+      if kind == 'W' and params[0] not in self.palettes:
+        self.palettes[params[0]] = getPalette(params[0])
+      self.results.append((kind, key, rasterize(self.traces, self.palettes, kind, key, data, params), extra))
+  def stop(self):
+    self.jobs.put(None)
+
+def rasterProcess(jobs, done, shared, free, slot_size, pal2s):
+  # The main function of the ProcessRasterizer process
+  palettes = {}
+  for name, pal2 in pal2s.items():
+    palettes[name] = WaterfallPalette(pal2)
+  traces = {}
+  slots = len(shared) // slot_size
+  slot = 0
+  while True:
+    job = jobs.get()
+    if job is None:
+      break
+    kind, key, data, params, extra = job
+    values = array.array('d')
+    if hasattr(values, 'frombytes'):
+      values.frombytes(data)
+    else:
+      values.fromstring(data)
+    data = numpy.frombuffer(values, dtype=numpy.float64) if numpy is not None else values
+    result = rasterize(traces, palettes, kind, key, data, params)
+    if result is None:
+      done.put((kind, key, -1, 0, extra))
+      continue
+    n = len(result)
+    if n > slot_size:		# too large for a slot, so send the bytes with the queue
+      done.put((kind, key, None, result, extra))
+      continue
+    free.acquire()		# wait for the GUI to read the slot
+    offset = slot * slot_size
+    ctypes.memmove(ctypes.addressof(shared) + offset, result, n)
+    done.put((kind, key, slot, n, extra))
+    slot = (slot + 1) % slots
+
+class ProcessRasterizer:
+  """Convert FFT rows to waterfall pixels and graph lines in another process.
+
+  This has the same methods as ThreadRasterizer.  The rows are sent to the process with a queue, and
+  the results are returned in a shared memory buffer of slots, each large enough for one row of
+  slot_size bytes.  A semaphore stops the process from writing to a slot that was not read.  A
+  result larger than slot_size is returned in the queue instead.
+
+  On Linux the process is forked from the GUI process after wx has started.  The process only runs
+  rasterProcess(), which uses numpy and the queues and never calls wx, so it does not use the copy
+  of the wx state it inherits."""
+  def __init__(self, slots=256, slot_size=4 * 8192):
+    self.slot_size = slot_size
+    self.shared = multiprocessing.RawArray('B', slots * slot_size)
+    self.free = multiprocessing.Semaphore(slots)
+    self.jobs = multiprocessing.Queue()
+    self.done = multiprocessing.Queue()
+    pal2s = {'A':conf.waterfallPalette, 'B':conf.waterfallPaletteB, 'C':conf.waterfallPaletteC}
+    self.process = multiprocessing.Process(target=rasterProcess,
+        args=(self.jobs, self.done, self.shared, self.free, slot_size, pal2s))
+    self.process.daemon = True
+  def start(self):
+    self.process.start()
+  def Submit(self, kind, key, data, params, extra=None):
+    data = array.array('d', data)	# send bytes; a pickled list of floats is slow
+    data = data.tobytes() if hasattr(data, 'tobytes') else data.tostring()
+    self.jobs.put((kind, key, data, params, extra))
+  def Results(self):
+    results = []
+    while True:
+      try:
+        kind, key, slot, n, extra = self.done.get_nowait()
+      except queue.Empty:
+        break
+      if slot is None:		# the bytes were sent in the queue
+        results.append((kind, key, n, extra))
+        continue
+      if slot < 0:
+        results.append((kind, key, None, extra))
+        continue
+      offset = slot * self.slot_size
+      data = ctypes.string_at(ctypes.addressof(self.shared) + offset, n)
+      self.free.release()
+      results.append((kind, key, data, extra))
+    return results
+  def is_alive(self):
+    return self.process.is_alive()
+  def join(self, timeout=None):
+    self.process.join(timeout)
+  def stop(self):
+    self.jobs.put(None)
+
+def makeRasterizer(kind):
+  """Return a started rasterizer for kind "thread" or "process", or None to draw in the GUI thread."""
+  if kind == 'thread':
+    rasterizer = ThreadRasterizer()
+  elif kind == 'process':
+    rasterizer = ProcessRasterizer()
+  else:
+    return None
+  rasterizer.start()
+  return rasterizer
+
+def benchmarkPalette(repeat=200):
+  """Print the microseconds to color one waterfall row for several FFT sizes."""
+  palette = getPalette('A')
+  for size in (1024, 2048, 4096):
+    data = [-130.0 + 120.0 * ((i * 7919) % size) / size for i in range(size)]
+    # the string concatenation that this replaces
+    t0 = time.time()
+    for i in range(repeat // 10):
+      row = ''
+      for x in data:
+        l = int((x - 0 + -30 // 3 + 100) * 30 / 10)
+        l = max(l, 0)
+        l = min(l, 255)
+        row = row + "%c%c%c%c" % (chr(palette.red[l]), chr(palette.green[l]), chr(palette.blue[l]), chr(255))
+    t_old = (time.time() - t0) / (repeat // 10) * 1E6
+    # the table of strings
+    lut = palette.lut
+    palette.lut = None
+    t0 = time.time()
+    for i in range(repeat):
+      palette.Colorize(data, 0, -30, 30)
+    t_table = (time.time() - t0) / repeat * 1E6
+    palette.lut = lut
+    if lut is not None:
+      t0 = time.time()
+      for i in range(repeat):
+        palette.Colorize(data, 0, -30, 30)
+      t_numpy = (time.time() - t0) / repeat * 1E6
+      numpy_text = "%.0f" % t_numpy
+    else:
+      numpy_text = "(no numpy)"
+    print("Waterfall row of %d bins: string concatenation %.0f, table %.0f, numpy %s microseconds" % (
+        size, t_old, t_table, numpy_text))
+
+def benchmarkRing(height=1000, repeat=1000):
+  """Print the time to find the spans to draw for a waterfall of height rows."""
+  ring = WaterfallRing(2048, height)
+  for i in range(height * 3 // 2):
+    ring.Add(0 if i < height else 10)	# one VFO change in the visible rows
+  t0 = time.time()
+  for i in range(repeat):
+    spans = ring.Spans(0, height, 10)
+  t1 = time.time()
+  print("Waterfall of %d rows: %d copies instead of %d, %.0f microseconds to find them" % (
+      height, len(spans), height, (t1 - t0) / repeat * 1E6))
+
+def benchmarkTrace(repeat=200):
+  """Print the microseconds to update the graph line for several FFT sizes."""
+  global numpy
+  for size in (1024, 2048, 4096):
+    data = [-130.0 + 120.0 * ((i * 7919) % size) / size for i in range(size)]
+    results = []
+    for use_numpy in (False, True):
+      saved = numpy
+      if not use_numpy:
+        numpy = None
+      elif numpy is None:
+        results.append("(no numpy)")
+        continue
+      trace = SpectrumTrace()
+      trace.SetHold(5, 0.25)
+      t0 = time.time()
+      for i in range(repeat):
+        trace.Update(data, 10, 20)
+      results.append("%.0f" % ((time.time() - t0) / repeat * 1E6))
+      numpy = saved
+    print("Graph line of %d bins: lists %s, numpy %s microseconds" % (size, results[0], results[1]))
+
+def checkTrace(size=256, repeat=20):
+  """Print whether the list and numpy graph lines agree, with negative y values in each mode."""
+  global numpy
+  if numpy is None:
+    print("Graph line check: (no numpy)")
+    return
+  rows = [[-40.0 + 37.3 * math.sin(i * 0.37 + r) for i in range(size)] for r in range(repeat)]
+  for mode in ('peak', 'min', 'average'):
+    lines = []
+    for use_numpy in (False, True):
+      saved = numpy
+      if not use_numpy:
+        numpy = None
+      trace = SpectrumTrace(mode)
+      trace.SetHold(3, 0.3)
+      for data in rows:
+        line = trace.Update(data, -100, 20)
+      lines.append([int(point[1]) for point in line])
+      numpy = saved
+    bad = sum(1 for y1, y2 in zip(lines[0], lines[1]) if y1 != y2)
+    print("Graph line check, mode %-7s: %d of %d y values differ" % (mode, bad, size))
+
+def benchmarkLabels(count=500, lines=3, width=1000, repeat=20):
+  """Print the text measurements and time to place count station names, as in a contest pile-up.
+
+  The names are all different.  Method "single" is timed with an empty cache for each layout, so
+  every name is measured once, and "cached" with the names measured by an earlier layout."""
+  calls = [0]
+  def extent(text):		# like GetTextExtent()[0] with 7 pixels per character
+    calls[0] += 1
+    return 7 * len(text)
+  def measure(text):		# like GetPartialTextExtents()
+    calls[0] += 1
+    return [7 * (i + 1) for i in range(len(text))]
+  names = ['%s%d%s%s%s%s' % ('KWN'[i % 3], i % 10, chr(65 + i // 676 % 26), chr(65 + i // 26 % 26), chr(65 + i % 26),
+      ('', '/P', '/QRP')[i % 3]) for i in range(count)]
+  xs = sorted([(i * 7919) % width for i in range(count)])
+  for method in ('loop', 'single', 'cached'):
+    calls[0] = 0
+    extents = TextExtents()
+    if method == 'cached':
+      for name in names:
+        extents.Partial(name, measure)
+      calls[0] = 0
+    t0 = time.time()
+    for r in range(repeat):
+      if method == 'single':
+        extents = TextExtents()
+      lastX = [width] * lines
+      line = 0
+      for x, name in reversed(list(zip(xs, names))):
+        space = lastX[line] - x - 7 - 4
+        if method == 'loop':		# the old way, measure after dropping each character
+          ws = extent('*')
+          w = extent(name)
+          max_len = 25
+          text = name
+          while w > space and max_len > 0:
+            max_len -= 1
+            text = name[:max_len] + '..'
+            w = extent(text)
+        else:
+          ws = extents.Width('*', measure)
+          text = truncateText(name, extents.Partial(name, measure), space, extents.Width('..', measure))
+        lastX[line] = x
+        line = (line + 1) % lines
+    t1 = time.time()
+    print("Station names %d, method %-6s: %.0f measurements and %.0f microseconds per layout" % (
+        count, method, float(calls[0]) / repeat, (t1 - t0) / repeat * 1E6))
+
+def benchmarkRasterizer(rows=2000, size=2048):
+  """Print the rows per second for each rasterizer, and the time used by the calling thread."""
+  data = [-130.0 + 120.0 * ((i * 7919) % size) / size for i in range(size)]
+  for kind in ('', 'thread', 'process'):
+    rasterizer = makeRasterizer(kind)
+    traces = {}
+    palettes = {'A':getPalette('A')}
+    t0 = time.time()
+    c0 = time.clock() if hasattr(time, 'clock') else time.process_time()
+    count = 0
+    for i in range(rows):
+      if rasterizer:
+        rasterizer.Submit('W', 1, data, ('A', 0, -30, 30))
+        rasterizer.Submit('G', 2, data, ('peak', 5, 1.0, 10, 20))
+        count += len(rasterizer.Results())
+      else:
+        rasterize(traces, palettes, 'W', 1, data, ('A', 0, -30, 30))
+        rasterize(traces, palettes, 'G', 2, data, ('peak', 5, 1.0, 10, 20))
+        count += 2
+    while count < rows * 2 and rasterizer.is_alive():
+      count += len(rasterizer.Results())
+      time.sleep(0.001)
+    t1 = time.time()
+    c1 = time.clock() if hasattr(time, 'clock') else time.process_time()
+    if rasterizer:
+      rasterizer.stop()
+      rasterizer.join()
+    print("Rasterizer %-8s %d rows of %d bins: %.0f rows per second, caller CPU %.0f microseconds per row" % (
+        kind or 'GUI', rows, size, rows / (t1 - t0), (c1 - c0) / rows * 1E6))
+
+if __name__ == '__main__':
+  benchmarkPalette()
+  benchmarkTrace()
+  checkTrace()
+  benchmarkRing()
+  benchmarkLabels()
+  benchmarkRasterizer()
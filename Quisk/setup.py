@@ -118,7 +118,7 @@ control the N8LP LP-PAN panadapter and the Elecraft K3.
 	download_url = 'http://james.ahlstrom.name/quisk/',
 	packages = ['quisk', 'quisk.sdriqpkg', 'quisk.n2adr', 'quisk.softrock', 'quisk.usb'],
 	package_dir =  {'quisk' : '.'},
-	package_data = {'quisk' : ['*.txt', '*.html']},
+	package_data = {'quisk' : ['*.txt', '*.html', '*.bin']},
 	ext_modules = Modules,
 	classifiers = [
 		'Development Status :: 6 - Mature',
@@ -0,0 +1,520 @@
+# A CW skimmer: decode the Morse code of every keyed carrier in the I/Q samples, and report the
+# stations heard calling as local spots.  This module does not use wx.
+#
+# The samples come from the raw sample tap QS.get_raw_tap(), which has every captured sample whatever
+# screen is shown.  The graph data from QS.get_graph(0, ...) is not used, as it is only the first data_width
+# samples of each FFT block, and Morse timing needs continuous samples.  A sliding
+# FFT divides the span into channels about 50 Hz wide.  A channel is decoded while its carrier is keyed
+# above the noise, and for a few seconds after.  The decoders run in a pool of processes, and each
+# process keeps the decoders of its own channels.  The spots are dxcluster.SpotRecord tuples from the
+# user's call sign with the skimmer suffix "-#", so they are stored with the DX cluster spots.
+
+from __future__ import print_function
+from __future__ import division
+
+import re
+import math
+import time
+import multiprocessing
+try:
+  import Queue as queue
+except ImportError:
+  import queue
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+import dxcluster
+
+morse_codes = {
+  '.-':'A', '-...':'B', '-.-.':'C', '-..':'D', '.':'E', '..-.':'F', '--.':'G', '....':'H', '..':'I',
+  '.---':'J', '-.-':'K', '.-..':'L', '--':'M', '-.':'N', '---':'O', '.--.':'P', '--.-':'Q', '.-.':'R',
+  '...':'S', '-':'T', '..-':'U', '...-':'V', '.--':'W', '-..-':'X', '-.--':'Y', '--..':'Z',
+  '-----':'0', '.----':'1', '..---':'2', '...--':'3', '....-':'4', '.....':'5', '-....':'6',
+  '--...':'7', '---..':'8', '----.':'9', '-..-.':'/', '..--..':'?', '.-.-.-':'.', '--..--':',', '-...-':'=',
+  }
+letter_codes = dict([(letter, code) for code, letter in morse_codes.items()])
+
+# A call sign, with an optional prefix or suffix after "/"
+call_re = re.compile(r'^(?:[A-Z0-9]{1,3}/)?(?:[A-Z]{1,2}|[A-Z][0-9]|[0-9][A-Z])[0-9][A-Z]{1,4}(?:/[A-Z0-9]{1,3})?$')
+
+def findCalls(words):
+  """Return a list of (call, kind) for the call signs sent after CQ, TEST or DE in the decoded words.
+
+  The kind is 'CQ' after CQ or TEST, otherwise ''.  A call must be decoded at least twice, so
+  one decoding error does not make a spot."""
+  found = []
+  calls = set()
+  for index, word in enumerate(words):
+    if word in ('CQ', 'TEST', 'DE'):
+      for call in words[index + 1:index + 4]:
+        if call not in calls and call_re.match(call) and words.count(call) >= 2:
+          calls.add(call)
+          found.append((call, 'CQ' if word != 'DE' else ''))
+  return found
+
+class Channelizer(object):
+  """A sliding FFT that returns the power in each channel for each hop of samples.
+
+  The channels are the FFT bins in frequency order, so channel size // 2 is the center frequency.
+  Samples left over from one block are used with the next block."""
+  def __init__(self, rate, bin_hz=50.0, hop_secs=0.005):
+    size = 64
+    while rate / size > bin_hz:
+      size *= 2
+    self.rate = rate
+    self.size = size
+    self.hop = max(1, min(size, int(rate * hop_secs)))
+    self.frame_secs = self.hop / rate
+    self.window = numpy.hanning(size)
+    self.Reset()
+  def Reset(self):
+    self.buffer = numpy.zeros(0, dtype=numpy.complex128)
+  def Freq(self, channel):	# Return the frequency of a channel relative to the center
+    return (channel - self.size // 2) * self.rate / self.size
+  def Process(self, samples):	# Return an array of the channel powers, one row for each hop
+    x = numpy.concatenate((self.buffer, samples))
+    if len(x) < self.size:
+      self.buffer = x
+      return numpy.zeros((0, self.size))
+    count = (len(x) - self.size) // self.hop + 1
+    step = x.strides[0]
+    frames = numpy.lib.stride_tricks.as_strided(x, shape=(count, self.size), strides=(step * self.hop, step))
+    spectra = numpy.fft.fft(frames * self.window, axis=1)
+    self.buffer = x[count * self.hop:]
+    return numpy.fft.fftshift(spectra.real ** 2 + spectra.imag ** 2, axes=1)
+
+class MorseDecoder(object):
+  """Decode the Morse code in the amplitude of one channel, given for each frame of frame_secs.
+
+  The key is down when the amplitude is above the geometric mean of the key down and key up levels.
+  The dit and dash lengths are found by dividing the recent marks into short and long ones, so the
+  decoder follows the speed of the sender."""
+  max_marks = 16		# the number of recent marks used for the speed
+  smooth = 3			# the number of frames averaged
+  def __init__(self, frame_secs):
+    self.frame_secs = frame_secs
+    self.high = None		# the amplitude with the key down
+    self.low = None		# the amplitude with the key up
+    self.key = False		# the key state at the end of the last block
+    self.run = 0		# frames in this key state
+    self.dit = 0.060 / frame_secs	# dit and dash frames, starting at 20 WPM
+    self.dash = self.dit * 3
+    self.marks = []		# the recent mark lengths
+    self.symbol = ''		# the dots and dashes of this character
+    self.word = ''
+    self.words = []		# the words decoded in this block
+  def Wpm(self):
+    return int(1.2 / (self.dit * self.frame_secs) + 0.5)
+  def Feed(self, amplitude):	# Decode a numpy array of amplitudes and return a list of the words completed
+    smooth = max(self.smooth, int(self.dit / 3))
+    if len(amplitude) > smooth:	# average over a few frames to reduce the noise
+      amplitude = numpy.convolve(amplitude, numpy.ones(smooth) / smooth, 'same')
+    lo, hi = numpy.percentile(amplitude, [20, 90])
+    if self.high is None:
+      self.high = hi
+      self.low = lo
+    else:
+      self.high = max(hi, self.high * 0.7 + hi * 0.3)
+      self.low = self.low * 0.7 + lo * 0.3
+    keyed = amplitude > math.sqrt(self.high * self.low)
+    glitch = self.dit * 0.3
+    bounds = [0] + (numpy.nonzero(keyed[1:] != keyed[:-1])[0] + 1).tolist() + [len(keyed)]
+    for start, end in zip(bounds[:-1], bounds[1:]):
+      state = bool(keyed[start])
+      length = end - start
+      if state == self.key or (length < glitch and end < len(keyed)):	# continue the run and ignore short glitches
+        self.run += length
+      else:
+        self.EndRun()
+        self.key = state
+        self.run = length
+    if not self.key:	# end the character and word without waiting for the next mark
+      if self.run >= self.dit * 2:
+        self.EndChar()
+      if self.run >= self.dit * 5:
+        self.EndWord()
+    words = self.words
+    self.words = []
+    return words
+  def EndRun(self):
+    if not self.key:		# a space
+      if self.run >= self.dit * 2:
+        self.EndChar()
+      if self.run >= self.dit * 5:
+        self.EndWord()
+    elif self.run > self.dash * 3:	# a long carrier, not a mark
+      self.symbol = ''
+    else:			# a mark
+      self.marks.append(self.run)
+      del self.marks[:-self.max_marks]
+      self.Speed()
+      self.symbol += '.' if self.run < (self.dit + self.dash) / 2 else '-'
+      if len(self.symbol) > 7:
+        self.symbol = ''
+  def Speed(self):	# Divide the recent marks into dits and dashes at the largest ratio between lengths
+    marks = sorted(self.marks)
+    if len(marks) < 4:
+      return
+    ratio, index = max([(marks[i] / marks[i - 1], i) for i in range(1, len(marks))])
+    if ratio >= 1.8:
+      self.dit = sum(marks[:index]) / index
+      self.dash = sum(marks[index:]) / (len(marks) - index)
+  def EndChar(self):
+    if self.symbol:
+      self.word += morse_codes.get(self.symbol, '')
+      self.symbol = ''
+  def EndWord(self):
+    if self.word:
+      self.words.append(self.word)
+      self.word = ''
+  def Break(self):	# Samples were lost, so drop the partial character and word; keep the levels and speed
+    self.key = False
+    self.run = 0
+    self.symbol = ''
+    self.word = ''
+  def Flush(self):	# Return the last words
+    self.EndChar()
+    self.EndWord()
+    words = self.words
+    self.words = []
+    return words
+
+def decodeChannels(decoders, frame_secs, channels, envelopes):
+  """Feed the envelope of each channel to its decoder, and return (channel, words, wpm) for the new words.
+
+  The decoders are a dictionary keyed by channel.  Decoders of channels that are no longer in channels
+  are flushed and removed."""
+  results = []
+  wanted = set(channels)
+  for channel in list(decoders):
+    if channel not in wanted:
+      decoder = decoders.pop(channel)
+      words = decoder.Flush()
+      if words:
+        results.append((channel, words, decoder.Wpm()))
+  for channel, amplitude in zip(channels, envelopes):
+    decoder = decoders.get(channel)
+    if decoder is None:
+      decoder = decoders[channel] = MorseDecoder(frame_secs)
+    words = decoder.Feed(amplitude)
+    if words:
+      results.append((channel, words, decoder.Wpm()))
+  return results
+
+def decodeProcess(jobs, done, frame_secs):
+  # The main function of each decoder process
+  decoders = {}
+  while True:
+    job = jobs.get()
+    if job is None:
+      break
+    serial, channels, data = job
+    if channels is None:	# data is True for a new VFO frequency, False for lost samples
+      if data:
+        decoders.clear()
+      else:
+        for decoder in decoders.values():
+          decoder.Break()
+      continue
+    envelopes = numpy.frombuffer(data, dtype=numpy.float32).reshape(len(channels), -1)
+    done.put((serial, decodeChannels(decoders, frame_secs, channels, envelopes)))
+
+class Skimmer(object):
+  """Find the keyed carriers in blocks of I/Q samples and decode them in a pool of processes.
+
+  Call Submit() with each block of samples and the VFO frequency, and Results() to get a list of the
+  new spots.  The samples are collected until there are job_secs of frames.  Then the noise floor of
+  each channel is updated, a channel is active if its peak power is snr dB above the floor, and the
+  envelopes of the active channels are sent to the process that owns each channel.  With workers zero
+  the channels are decoded in the thread that calls Submit().  If samples were lost before a block,
+  the partial characters are dropped, as their timing is lost, but each decoder keeps its speed and levels."""
+  hold_secs = 4.0		# decode a channel for this time after it was last active
+  respot_secs = 300.0		# spot the same call on the same channel again after this time
+  max_words = 12		# the number of recent words of each channel searched for a call
+  min_frames = 8		# an active carrier is above the noise for this many frames of a job
+  def __init__(self, rate, spotter, workers=2, snr=10.0, job_secs=0.25):
+    self.channelizer = Channelizer(rate)
+    self.frame_secs = self.channelizer.frame_secs
+    self.job_frames = max(1, int(job_secs / self.frame_secs))
+    self.hold = int(self.hold_secs / (self.job_frames * self.frame_secs)) + 1
+    self.rate = rate
+    self.spotter = spotter
+    self.ratio = 10 ** (snr / 10.0)
+    self.frames = []		# the power arrays not yet used
+    self.nframes = 0
+    self.floor = None		# the noise power of each channel
+    self.channels = {}		# the last job serial at which each channel was active
+    self.snrs = {}		# the SNR in dB of each channel
+    self.texts = {}		# the recent words of each channel
+    self.spotted = {}		# the time each (call, channel) was spotted
+    self.spots = []		# the new spots
+    self.vfo = None
+    self.serial = 0		# the job serial number
+    self.pending = 0		# the jobs sent to the processes and not yet returned
+    self.decoded = 0		# the channel envelopes decoded
+    self.gaps = 0		# the number of times samples were lost
+    self.decoders = {}		# the decoders when workers is zero
+    self.workers = []		# a list of (process, job queue)
+    self.done = multiprocessing.Queue() if workers else None
+    for i in range(workers):
+      jobs = multiprocessing.Queue()
+      process = multiprocessing.Process(target=decodeProcess, args=(jobs, self.done, self.frame_secs))
+      process.daemon = True
+      self.workers.append((process, jobs))
+  def start(self):
+    for process, jobs in self.workers:
+      process.start()
+  def Submit(self, samples, vfo, gap=False):	# gap is True if samples were lost before this block
+    if vfo != self.vfo:
+      self.Reset(vfo)
+    elif gap:
+      self.gaps += 1
+      self.Restart()
+    if isinstance(samples, bytes):	# the bytes from QS.get_raw_tap()
+      samples = numpy.frombuffer(samples, dtype=numpy.complex128)
+    power = self.channelizer.Process(numpy.asarray(samples, dtype=numpy.complex128))
+    if len(power):
+      self.frames.append(power)
+      self.nframes += len(power)
+    if self.nframes >= self.job_frames:
+      power = numpy.concatenate(self.frames)
+      self.frames = []
+      self.nframes = 0
+      self.Dispatch(power)
+  def Restart(self, clear=False):
+    # Start the decoders again after lost samples, or with clear at a new VFO frequency
+    self.channelizer.Reset()
+    self.frames = []
+    self.nframes = 0
+    if clear:
+      self.decoders.clear()
+    else:
+      for decoder in self.decoders.values():
+        decoder.Break()
+    for process, jobs in self.workers:
+      jobs.put((self.serial, None, clear))
+  def Reset(self, vfo):		# Start again at a new VFO frequency
+    self.vfo = vfo
+    self.Restart(True)
+    self.channels.clear()
+    self.snrs.clear()
+    self.texts.clear()
+    now = time.time()
+    for key, t in list(self.spotted.items()):
+      if now - t > self.respot_secs:
+        del self.spotted[key]
+  def Dispatch(self, power):
+    self.serial += 1
+    # The power of each channel is the power of its bin and the bins on each side
+    bins = power
+    power = bins[:, :-2] + bins[:, 1:-1] + bins[:, 2:]
+    floor = numpy.percentile(power, 20, axis=0)
+    if self.floor is None:
+      self.floor = floor
+    else:
+      self.floor = self.floor * 0.8 + floor * 0.2
+    peak = power.max(axis=0)
+    snr = peak / numpy.maximum(self.floor, 1E-30)
+    # An active channel is a peak that is above the noise for several frames, so noise peaks are not active.
+    # A carrier between two channels stays in the channel it started in.
+    above = (power > self.floor * self.ratio).sum(axis=0) >= self.min_frames
+    active = above[1:-1] & (peak[1:-1] >= peak[:-2]) & (peak[1:-1] >= peak[2:])
+    for channel in (numpy.nonzero(active)[0] + 2).tolist():
+      if channel - 1 in self.channels:
+        channel -= 1
+      elif channel + 1 in self.channels:
+        channel += 1
+      self.channels[channel] = self.serial
+      self.snrs[channel] = 10 * math.log10(snr[channel - 1])
+    for channel, serial in list(self.channels.items()):
+      if self.serial - serial > self.hold:
+        del self.channels[channel]
+    channels = sorted(self.channels)
+    # The envelope of each channel is the amplitude of the strongest of its three bins
+    index = numpy.array(channels, dtype=int)
+    if len(index):
+      means = numpy.vstack([bins[:, index + k].mean(axis=0) for k in (-1, 0, 1)])
+      index += numpy.argmax(means, axis=0) - 1
+    envelopes = numpy.sqrt(bins[:, index]).T.astype(numpy.float32)
+    self.decoded += len(channels)
+    if not self.workers:
+      self.Publish(decodeChannels(self.decoders, self.frame_secs, channels, envelopes))
+      return
+    count = len(self.workers)
+    for number, (process, jobs) in enumerate(self.workers):
+      rows = [i for i, channel in enumerate(channels) if channel % count == number]
+      data = numpy.ascontiguousarray(envelopes[rows])
+      data = data.tobytes() if hasattr(data, 'tobytes') else data.tostring()
+      jobs.put((self.serial, [channels[i] for i in rows], data))
+      self.pending += 1
+  def Results(self):	# Return a list of the new dxcluster.SpotRecord spots
+    while self.workers:
+      try:
+        serial, results = self.done.get_nowait()
+      except queue.Empty:
+        break
+      self.pending -= 1
+      self.Publish(results)
+    spots = self.spots
+    self.spots = []
+    return spots
+  def Publish(self, results):
+    now = time.time()
+    for channel, words, wpm in results:
+      text = self.texts.setdefault(channel, [])
+      text += words
+      del text[:-self.max_words]
+      for call, kind in findCalls(text):
+        key = (call, channel)
+        if now - self.spotted.get(key, 0) < self.respot_secs:
+          continue
+        self.spotted[key] = now
+        freq = int(round((self.vfo + self.channelizer.Freq(channel)) / 100.0)) * 100
+        snr = int(round(self.snrs.get(channel, 0)))
+        comment = ("CW %d dB %d WPM %s" % (snr, wpm, kind)).rstrip()
+        self.spots.append(dxcluster.SpotRecord(self.spotter, freq, call, comment, None, '', 'CW', snr, wpm, kind))
+      if channel not in self.channels:
+        del self.texts[channel]
+  def is_alive(self):
+    for process, jobs in self.workers:
+      if not process.is_alive():
+        return False
+    return True
+  def stop(self):
+    for process, jobs in self.workers:
+      jobs.put(None)
+  def join(self, timeout=None):	# Wait for the processes to end after stop()
+    for process, jobs in self.workers:
+      process.join(timeout)
+
+def makeSkimmer(rate, spotter, workers=2, snr=10.0):
+  """Return a started Skimmer for the sample rate, or None if numpy is not available."""
+  if numpy is None:
+    print("The CW skimmer needs numpy")
+    return None
+  skimmer = Skimmer(rate, spotter, workers, snr)
+  skimmer.start()
+  return skimmer
+
+def morseKeying(text, wpm, rate, samples):
+  """Return an array of the key state 0 or 1 for each sample that sends the text over and over."""
+  units = []
+  for word in text.split():
+    for letter in word:
+      for symbol in letter_codes[letter]:
+        units += [1] if symbol == '.' else [1, 1, 1]
+        units.append(0)
+      units += [0, 0]
+    units += [0, 0, 0, 0]
+  units = numpy.array(units, dtype=numpy.float64)
+  unit = int(rate * 1.2 / wpm)
+  index = (numpy.arange(samples) // unit) % len(units)
+  return units[index]
+
+def makeSignal(rate, seconds, count, seed=1):
+  """Return I/Q samples with count CW stations calling CQ in noise, and a dictionary of their calls.
+
+  Each station has a different frequency, speed and SNR from 6 to 25 dB in one channel.  The edges
+  of the keying are shaped over 5 milliseconds to limit the key clicks."""
+  rnd = numpy.random.RandomState(seed)
+  samples = int(rate * seconds)
+  n = numpy.arange(samples)
+  iq = (rnd.standard_normal(samples) + 1j * rnd.standard_normal(samples)) * math.sqrt(0.5)	# noise power 1.0
+  window = Channelizer(rate).window
+  gain = window.sum() ** 2 / (window ** 2).sum()	# the SNR gain of one FFT bin
+  calls = {}
+  spacing = rate * 0.8 / count
+  shape = int(rate * 0.005)
+  for i in range(count):
+    freq = -rate * 0.4 + spacing * (i + 0.5) + rnd.uniform(-spacing / 4, spacing / 4)
+    call = "%s%d%s" % (rnd.choice(['K', 'W', 'N', 'DL', 'G', 'JA', 'VE']), rnd.randint(0, 10),
+        ''.join([chr(ord('A') + x) for x in rnd.randint(0, 26, 3)]))
+    text = "CQ CQ DE %s %s K" % (call, call)
+    key = morseKeying(text, rnd.uniform(16, 36), rate, samples + shape)
+    key = (numpy.cumsum(key)[shape:] - numpy.cumsum(key)[:-shape]) / shape		# moving average
+    amplitude = math.sqrt(10 ** (rnd.uniform(6, 25) / 10.0) / gain)
+    iq += key[:samples] * amplitude * numpy.exp(2j * math.pi * freq / rate * n)
+    calls[call] = freq
+  return iq, calls
+
+def sampleBlocks(iq, rate, fft_mult=0, data_width=800, late_secs=0, seed=2):
+  """Yield (samples, gap) from the I/Q samples iq in the blocks that quisk gives the skimmer.
+
+  With fft_mult zero the blocks come from the raw sample tap.  The sound thread adds 5 to 20 milliseconds
+  of samples to a ring of one second, and the GUI reads the ring every 10 to 50 milliseconds.  If
+  late_secs is not zero, a read is 1.5 seconds late on average once in late_secs seconds, so the ring
+  fills and samples are lost.  With fft_mult
+  above zero the blocks are those of QS.get_graph(0, ...), the first data_width samples of each FFT of
+  data_width * fft_mult samples, so samples are lost before each block unless fft_mult is one."""
+  if fft_mult:
+    size = data_width * fft_mult
+    for i in range(0, len(iq) - data_width, size):
+      yield iq[i:i + data_width], fft_mult > 1 and i > 0
+    return
+  rnd = numpy.random.RandomState(seed)
+  ring = rate
+  pos = 0
+  gap = False
+  while pos < len(iq):
+    wait = rnd.uniform(0.010, 0.050)
+    if late_secs and rnd.uniform() < wait / late_secs:
+      wait += 1.5
+    wait *= rate
+    start = pos
+    end = pos + int(wait)
+    stored = pos
+    while pos < end:		# the sound thread writes blocks until the ring is full
+      pos += int(rnd.uniform(0.005, 0.020) * rate)
+      if pos - start < ring:
+        stored = pos
+    yield iq[start:min(stored, len(iq))], gap
+    gap = stored < pos		# the samples after stored were lost
+
+def benchmark(rate=48000, seconds=20, stations=60):
+  """Decode a made up band of CW stations with several numbers of processes, and with several
+  sources of samples.
+
+  Print the channels decoded per CPU core in real time, and the stations spotted at the right
+  frequency.  The processes share the cores, so the rate per core counts only the cores in use."""
+  if numpy is None:
+    print("The skimmer benchmark needs numpy")
+    return
+  iq, calls = makeSignal(rate, seconds, stations)
+  cores = multiprocessing.cpu_count()
+  print("%d stations, %d seconds at %d sps, %d CPU cores" % (stations, seconds, rate, cores))
+  tests = [(workers, 'tap', {}) for workers in (0, 1, 2, 4)]
+  tests.append((1, 'tap, late every 5 sec', {'late_secs':5}))
+  for fft_mult in (1, 2, 4):
+    tests.append((1, 'graph, fft_mult %d' % fft_mult, {'fft_mult':fft_mult}))
+  for workers, source, options in tests:
+    skimmer = Skimmer(rate, 'SKIMMER-#', workers)
+    skimmer.start()
+    spots = []
+    t0 = time.time()
+    for samples, gap in sampleBlocks(iq, rate, **options):
+      skimmer.Submit(samples, 7030000, gap)
+      spots += skimmer.Results()
+    while skimmer.pending and skimmer.is_alive():
+      time.sleep(0.01)
+      spots += skimmer.Results()
+    elapsed = time.time() - t0
+    skimmer.stop()
+    skimmer.join()
+    heard = set()
+    wrong = set()
+    for spot in spots:
+      if spot.dx in calls and abs(spot.freq - 7030000 - calls[spot.dx]) < 100:
+        heard.add(spot.dx)
+      else:
+        wrong.add(spot.dx)
+    channels = skimmer.decoded / max(1, skimmer.serial)	# the average channels decoded in each job
+    used = min(cores, workers + 1) if workers else 1
+    print("Processes %d, %-22s %5.1f times real time, %4.1f channels, %5.0f channels per core, %2d gaps, %d of %d stations spotted, %d false spots" % (
+        workers, source + ':', seconds / elapsed, channels, channels * seconds / elapsed / used,
+        skimmer.gaps, len(heard), len(calls), len(wrong)))
+
+if __name__ == '__main__':
+  benchmark()
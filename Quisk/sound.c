@@ -517,6 +517,8 @@ int quisk_read_sound(void)	// Called from sound thread
 	// Perhaps write samples to a loopback device for use by another program
 	if (RawSamplePlayback.handle)
 		play_sound_interface(&RawSamplePlayback, nSamples, cSamples, 0, 1.0);
+	// Perhaps save the samples for the raw sample tap
+	quisk_raw_tap(cSamples, nSamples);
 #if ! DEBUG_MIC
 	nSamples = quisk_process_samples(cSamples, nSamples);
 #endif
@@ -0,0 +1,183 @@
+# Filter DX cluster and RBN spots before they are stored.
+
+from __future__ import print_function
+
+import os
+
+import quisk_conf_defaults as conf
+
+# Each filter rule is a string of words, and a spot is kept only if it passes every rule:
+#   band 40 20 15             The spot frequency is within one of these bands from conf.BandEdge.
+#   mode CW RTTY              The RBN mode is one of these.  Spots without a mode pass.
+#   snr 6                     The RBN SNR is at least 6 dB.  Spots without an SNR pass.
+#   wpm 15 35                 The RBN speed is from 15 to 35 WPM.  Spots without a speed pass.
+#   spotter continent NA EU   The spotter is on one of these continents.
+#   spotter prefix K W N VE   The spotter call starts with one of these.
+#   spotter deny K1TTT        The spotter call does not start with any of these.
+#   dx allow JA VK ZL         The DX call starts with one of these.
+#   dx deny K W N             The DX call does not start with any of these.
+# Upper and lower case are the same.  Lines starting with "#" are comments.
+
+# The continent of common call sign prefixes.  The longest matching prefix is used.  This is a short
+# hand made table and not a country list, so some prefixes are missing and others are approximate:
+# for example all R and U calls not listed under AS are taken as European Russia.
+continent_prefixes = {
+  'NA' : ('A', 'K', 'N', 'W', 'VE', 'VA', 'VO', 'VY', 'CY', 'XE', 'XF', 'TI', 'HI', 'CO', 'CM', 'KP4', 'NP4', 'WP4',
+          'TG', 'YN', 'HR', 'HP', 'J3', 'J6', 'J7', 'J8', 'V2', 'V3', 'V4', 'VP2', 'VP5', 'VP9', 'ZF', '6Y', '8P', '9Y', 'FG', 'FM', 'FS', 'PJ'),
+  'SA' : ('LU', 'LW', 'L2', 'PY', 'PP', 'PU', 'ZZ', 'CX', 'CE', 'CA', 'XQ', 'OA', 'HC', 'HK', 'YV', 'CP', 'ZP', 'PZ', '8R', 'FY', 'VP8'),
+  'EU' : ('G', 'M', '2E', 'F', 'D', 'I', 'EA', 'EB', 'EC', 'ON', 'OO', 'OT', 'PA', 'PD', 'PE', 'PH', 'OH', 'OG', 'SM', 'SA', 'SE', 'SK', '7S', '8S',
+          'LA', 'LB', 'OZ', 'OU', 'SP', 'SQ', 'SN', '3Z', 'OK', 'OL', 'OM', 'HA', 'HG', 'YO', 'YP', 'LZ', 'S5', '9A', 'YU', 'YT', 'E7', 'Z3', '4O',
+          'EI', 'EJ', 'HB', 'OE', 'SV', 'SX', 'SZ', 'CT', 'CU', 'CS', 'UR', 'UT', 'US', 'UX', 'EM', 'EO', 'ES', 'YL', 'LY', 'EU', 'EW', 'ER',
+          'TF', 'OY', 'JW', 'LX', 'T7', 'HV', '9H', 'ZA', 'ZB', 'OJ0', 'R', 'U', 'RA', 'UA'),
+  'AS' : ('J', 'B', 'HL', 'DS', '6K', 'VU', 'AP', '4S', '9N', 'S2', 'HS', 'E2', 'XV', '3W', '9V', '9M2', 'DU', 'BV', 'VR', 'XX9',
+          'UA9', 'UA0', 'RA9', 'RA0', 'R9', 'R0', 'UN', 'EX', 'EY', 'EZ', 'UK', '4X', '4Z', 'A4', 'A6', 'A7', 'A9', 'HZ', '7Z', '9K',
+          'YI', 'YK', 'OD', 'JY', 'EP', 'TA', 'TC', '4L', 'EK', '4J', '4K', '5B', 'JT', 'XU', 'XW', 'XZ'),
+  'AF' : ('ZS', 'ZR', 'ZT', 'ZU', 'V5', 'A2', '7P', '3DA', 'C9', '5H', '5Z', '5X', '9J', 'Z2', '9Q', 'TN', 'TR', 'TJ', 'TU', '9G', '5N', '5U',
+          '6W', 'C5', 'J5', '3X', '9L', 'EL', '5V', 'TY', 'XT', 'TZ', '5T', 'CN', '7X', '3V', '5A', 'SU', 'ST', 'ET', 'E3', 'J2', '6O',
+          'D2', 'D4', 'S9', '3C', 'FR', '5R', '3B', 'S7', 'D6', 'EA8', 'EA9', 'CT3', 'IH9', 'ZD7', 'ZD8', 'ZD9'),
+  'OC' : ('VK', 'AX', 'ZL', 'ZM', 'KH6', 'NH6', 'WH6', 'AH6', 'KH2', 'AH2', 'NH2', 'YB', 'YC', 'YD', 'YE', 'YF', 'YG', 'YH', 'P2', 'H4',
+          'YJ', 'FK', 'FO', 'FW', '3D2', '5W', 'A3', 'T2', 'T3', 'E5', 'ZK', 'V6', 'V7', 'T8', 'KH0', 'KH8', 'KH9', '9M6', '9M8', 'V8', '4W'),
+  }
+
+prefix_continent = {}
+for continent, prefixes in continent_prefixes.items():
+  for prefix in prefixes:
+    prefix_continent[prefix] = continent
+max_prefix = max([len(x) for x in prefix_continent])
+continent_cache = {}
+
+def baseCall(call):	# Return the call sign without a skimmer suffix such as "-#" or "-2-#"
+  call = call.upper()
+  i = call.find('-')
+  if i > 0:
+    call = call[0:i]
+  if '/' in call:	# use the longest part, usually the home call
+    call = max(call.split('/'), key=len)
+  return call
+
+def continentOf(call):	# Return the continent of a call sign or None
+  try:
+    return continent_cache[call]
+  except KeyError:
+    pass
+  base = baseCall(call)
+  continent = None
+  for n in range(min(max_prefix, len(base)), 0, -1):
+    continent = prefix_continent.get(base[0:n])
+    if continent:
+      break
+  if len(continent_cache) > 20000:
+    continent_cache.clear()
+  continent_cache[call] = continent
+  return continent
+
+def prefixTest(prefixes):	# Return a function that tests if a call starts with a prefix
+  prefixes = tuple(prefixes)
+  def test(call):
+    return baseCall(call).startswith(prefixes)
+  return test
+
+class SpotFilter:
+  """Compile filter rules into functions and count the spots each rule rejects.
+
+  accept(spot) is called for every dxcluster.SpotRecord before it is stored.  The rules can be
+  replaced at any time with load(), or read again from a file with reload().  The rules given to
+  the constructor are not read again."""
+  def __init__(self, rules=(), path=''):
+    self.path = path
+    self.mtime = None
+    self.checked = 0		# number of spots tested
+    self.passed = 0		# number of spots accepted
+    self.filters = []		# list of [rule, function, hits]
+    self.rules = list(rules)
+    self.load(self.rules + self.readFile())
+  def readFile(self):
+    if not self.path:
+      return []
+    try:
+      self.mtime = os.path.getmtime(self.path)
+      fp = open(self.path)
+      lines = fp.read().splitlines()
+      fp.close()
+    except (IOError, OSError) as e:
+      self.mtime = None		# report a missing file once, and read it again when it returns
+      print("Spot filter file error", self.path, e)
+      return []
+    return lines
+  def reload(self):	# Read the filter file again if it changed; return True if it was read
+    if not self.path:
+      return False
+    try:
+      mtime = os.path.getmtime(self.path)
+    except OSError:
+      mtime = None
+    if mtime == self.mtime:
+      return False
+    self.load(self.rules + self.readFile())
+    return True
+  def load(self, rules):
+    filters = []
+    for rule in rules:
+      rule = rule.strip()
+      if not rule or rule[0] == '#':
+        continue
+      try:
+        function = self.compile(rule.upper().split())
+      except (ValueError, IndexError, KeyError):
+        print("Bad spot filter rule:", rule)
+        continue
+      filters.append([rule, function, 0])
+    self.filters = filters
+  def compile(self, words):	# Return a function of a SpotRecord that returns True to keep the spot
+    name = words[0]
+    args = words[1:]
+    if name == 'BAND':
+      edges = sorted([conf.BandEdge[band.lower()] for band in args])
+      def test(spot):
+        freq = spot.freq
+        for f1, f2 in edges:
+          if f1 <= freq <= f2:
+            return True
+        return False
+    elif name == 'MODE':
+      modes = frozenset(args)
+      def test(spot):
+        return not spot.mode or spot.mode in modes
+    elif name == 'SNR':
+      snr = int(args[0])
+      def test(spot):
+        return spot.snr is None or spot.snr >= snr
+    elif name == 'WPM':
+      wpm1 = int(args[0])
+      wpm2 = int(args[1]) if len(args) > 1 else 999
+      def test(spot):
+        return spot.wpm is None or wpm1 <= spot.wpm <= wpm2
+    elif name == 'SPOTTER' and args[0] == 'CONTINENT':
+      continents = frozenset(args[1:])
+      def test(spot):
+        return continentOf(spot.spotter) in continents
+    elif name == 'SPOTTER' and args[0] in ('PREFIX', 'ALLOW'):
+      prefix = prefixTest(args[1:])
+      test = lambda spot: prefix(spot.spotter)
+    elif name == 'SPOTTER' and args[0] == 'DENY':
+      prefix = prefixTest(args[1:])
+      test = lambda spot: not prefix(spot.spotter)
+    elif name == 'DX' and args[0] == 'ALLOW':
+      prefix = prefixTest(args[1:])
+      test = lambda spot: prefix(spot.dx)
+    elif name == 'DX' and args[0] == 'DENY':
+      prefix = prefixTest(args[1:])
+      test = lambda spot: not prefix(spot.dx)
+    else:
+      raise ValueError(name)
+    return test
+  def accept(self, spot):
+    self.checked += 1
+    for item in self.filters:
+      if not item[1](spot):
+        item[2] += 1
+        return False
+    self.passed += 1
+    return True
+  def getCounts(self):	# Return a list of (rule, number of spots rejected)
+    return [(rule, hits) for rule, function, hits in self.filters]
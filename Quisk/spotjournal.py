@@ -0,0 +1,142 @@
+# Keep a journal of DX cluster spots in an SQLite database so that the spots survive a restart.
+
+from __future__ import print_function
+
+import threading
+import time
+import os
+import sqlite3
+try:
+  import Queue as queue
+except ImportError:
+  import queue
+
+import dxcluster
+import quisk_conf_defaults as conf
+
+class SpotJournal(threading.Thread):
+  """Append DX spots to an SQLite database from a background thread.
+
+  Call append() from any thread; the spots are written in batches.  Call replay() at startup to
+  put the unexpired spots back into a DxSpotStore, and getHistory() to find the spots for a DX
+  station.  Spots older than keep_hours are deleted.  The spots still queued are written when the
+  thread stops."""
+  columns = "received, time, freq, dx, spotter, comment, mode, snr, wpm, kind"
+  def __init__(self, path, keep_hours=24):
+    threading.Thread.__init__(self)
+    self.daemon = True
+    self.path = path
+    self.keep_hours = keep_hours
+    self.queue = queue.Queue()
+    self.doQuit = threading.Event()
+    self.written = 0		# number of spots written
+    self.errors = 0
+    self.prune_time = 0
+    connection = self.connect()
+    connection.executescript("""
+      CREATE TABLE IF NOT EXISTS spots (received REAL, time REAL, freq INTEGER, dx TEXT,
+          spotter TEXT, comment TEXT, mode TEXT, snr INTEGER, wpm INTEGER, kind TEXT);
+      CREATE INDEX IF NOT EXISTS spots_freq ON spots (freq, time);
+      CREATE INDEX IF NOT EXISTS spots_dx ON spots (dx, time);
+      CREATE INDEX IF NOT EXISTS spots_received ON spots (received);
+      """)
+    connection.close()
+  def connect(self):	# An SQLite connection can only be used by the thread that made it
+    return sqlite3.connect(self.path, timeout=10)
+  def append(self, entry):	# Add the newest report of a DxEntry
+    report = entry.getReport(0)
+    self.queue.put((entry.timestamp, report.time, entry.freq, entry.dx, report.spotter,
+        report.comment, report.mode, report.snr, report.wpm, report.kind))
+  def run(self):
+    connection = self.connect()
+    while not self.doQuit.isSet():
+      try:
+        rows = [self.queue.get(True, 1.0)]
+      except queue.Empty:
+        rows = []
+      self.write(connection, rows)
+    self.write(connection, [])	# the spots appended before stop()
+    connection.close()
+  def write(self, connection, rows):	# Write rows and the rest of the queue, and commit
+    while True:
+      try:
+        rows.append(self.queue.get_nowait())
+      except queue.Empty:
+        break
+    now = time.time()
+    try:
+      if rows:
+        connection.executemany("INSERT INTO spots (%s) VALUES (?,?,?,?,?,?,?,?,?,?)" % self.columns, rows)
+        self.written += len(rows)
+      if now - self.prune_time > 600:
+        self.prune_time = now
+        connection.execute("DELETE FROM spots WHERE received < ?", (now - self.keep_hours * 3600,))
+      connection.commit()
+    except sqlite3.Error as e:
+      self.errors += 1
+      print("Spot journal error", self.path, e)
+  def stop(self, timeout=None):	# Write the queued spots and end the thread; wait up to timeout seconds
+    self.doQuit.set()
+    if timeout is not None and self.is_alive():
+      self.join(timeout)
+  def makeEntry(self, row):
+    received, t, freq, dx, spotter, comment, mode, snr, wpm, kind = row
+    entry = dxcluster.DxEntry()
+    entry.dx = dxcluster.internName(dx)
+    entry.freq = freq
+    entry.timestamp = received
+    entry.info.append(dxcluster.SpotReport(dxcluster.internName(spotter), t, comment,
+        dxcluster.internName(mode), snr, wpm, dxcluster.internName(kind)))
+    return entry
+  def query(self, sql, args):
+    connection = self.connect()
+    try:
+      rows = connection.execute("SELECT %s FROM spots WHERE %s" % (self.columns, sql), args).fetchall()
+    finally:
+      connection.close()
+    return [self.makeEntry(row) for row in rows]
+  def replay(self, store, now=None):	# Put the unexpired spots into the DxSpotStore; return the number of spots
+    if now is None:
+      now = time.time()
+    entries = self.query("received > ? ORDER BY received", (now - conf.dxClExpireTime * 60,))
+    store.load(entries)
+    return len(entries)
+  def getHistory(self, dx, hours):	# Return a DxEntry for each spot of dx in the last hours, oldest first
+    return self.query("dx = ? AND time > ? ORDER BY time", (dx, time.time() - hours * 3600))
+  def getRange(self, freq1, freq2, hours):	# Return the spots with freq1 < frequency < freq2 in the last hours
+    return self.query("freq > ? AND freq < ? AND time > ? ORDER BY freq, time",
+        (freq1, freq2, time.time() - hours * 3600))
+
+def benchmark(count=20000):
+  """Measure the time to write count spots and to replay them into a DxSpotStore."""
+  import tempfile
+  path = os.path.join(tempfile.mkdtemp(), 'spots.sqlite')
+  journal = SpotJournal(path)
+  journal.start()
+  now = time.time()
+  t0 = time.time()
+  for i in range(count):
+    entry = dxcluster.DxEntry()
+    entry.parseMessage("DX de K%dAB-#:  %.1f  W%dX%d  CW 12 dB 22 WPM CQ  %s" % (
+        i % 10, 7000.0 + i * 0.1, i % 10, i % (count // 2), time.strftime("%H%MZ", time.gmtime(now))))
+    journal.append(entry)
+  while journal.written < count:
+    time.sleep(0.01)
+  t1 = time.time()
+  print("Write %d spots: %.0f spots per second" % (count, count / (t1 - t0)))
+  store = dxcluster.DxSpotStore()
+  t0 = time.time()
+  n = journal.replay(store)
+  t1 = time.time()
+  print("Replay %d spots into %d stations: %.0f milliseconds" % (n, len(store), (t1 - t0) * 1E3))
+  t0 = time.time()
+  history = journal.getHistory('W1X1', 24)
+  t1 = time.time()
+  print("History of W1X1: %d spots in %.2f milliseconds" % (len(history), (t1 - t0) * 1E3))
+  journal.stop()
+  journal.join()
+  os.remove(path)
+  os.rmdir(os.path.dirname(path))
+
+if __name__ == '__main__':
+  benchmark()